@@ -9,8 +9,16 @@ from core.database import get_db_conn
 
 # Infrastructure (Repository & Adapter) 임포트
 from infrastructure.db.meeting_repository import MySQLMeetingRepository
+from infrastructure.db.cached_meeting_repository import CachedMeetingRepository
 from infrastructure.db.user_repository import MySQLUserRepository
 from infrastructure.llm.gemini_adapter import GeminiLLMAdapter
+from infrastructure.llm.cached_llm_client import CachedLLMClient
+from infrastructure.cache.kv_cache import KeyValueCache, build_kv_cache
+from infrastructure.cache.invalidation import CacheInvalidator
+from infrastructure.progress.pipeline_progress import PipelineProgressSubscriber
+from infrastructure.cache.pipeline_coalescing import MeetingPipelineLock
+from domain.interfaces.llm import ILLMClient
+from domain.interfaces.repository import IMeetingRepository
 
 # Service 임포트
 from services.meeting_service import MeetingService
@@ -20,9 +28,39 @@ from services.user_service import UserService
 # 1. Database & Repository Dependencies
 # =========================================================
 
+# Meeting 조회 캐시 (MEETING_CACHE_BACKEND: none | memory | redis)
+# 캐시와 무효화 채널은 요청 간에 공유되도록 프로세스 단위로 하나만 생성 (main.py lifespan 에서 구독 시작/종료)
+_meeting_cache: Optional[KeyValueCache] = None
+_meeting_cache_invalidator: Optional[CacheInvalidator] = None
+
+def get_meeting_cache_invalidator() -> Optional[CacheInvalidator]:
+    global _meeting_cache, _meeting_cache_invalidator
+    backend = os.getenv("MEETING_CACHE_BACKEND", "none")
+    if _meeting_cache_invalidator is None and backend != "none":
+        _meeting_cache = build_kv_cache(
+            backend,
+            redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            ttl=int(os.getenv("MEETING_CACHE_TTL", "600")),
+            max_entries=int(os.getenv("MEETING_CACHE_MAX_ENTRIES", "2000"))
+        )
+        _meeting_cache_invalidator = CacheInvalidator(
+            _meeting_cache,
+            redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        )
+    return _meeting_cache_invalidator
+
 # Meeting Repository 주입
-async def get_meeting_repository(session: AsyncSession = Depends(get_db_conn)) -> MySQLMeetingRepository:
-    return MySQLMeetingRepository(session)
+async def get_meeting_repository(session: AsyncSession = Depends(get_db_conn)) -> IMeetingRepository:
+    repository = MySQLMeetingRepository(session)
+    invalidator = get_meeting_cache_invalidator()
+    if invalidator is None:
+        return repository
+    return CachedMeetingRepository(
+        repository,
+        invalidator.cache,
+        invalidator,
+        negative_ttl=int(os.getenv("MEETING_CACHE_NEGATIVE_TTL", "30"))
+    )
 
 # User Repository 주입
 async def get_user_repository(session: AsyncSession = Depends(get_db_conn)) -> MySQLUserRepository:
@@ -34,12 +72,51 @@ async def get_user_repository(session: AsyncSession = Depends(get_db_conn)) -> M
 # =========================================================
 
 # LLM Adapter 주입 (Gemini)
-def get_llm_client() -> GeminiLLMAdapter:
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        # 실제 운영 환경에서는 로그를 남기고 서버 시작을 막거나 예외 처리
-        raise ValueError("GEMINI_API_KEY environment variable is not set.")
-    return GeminiLLMAdapter(api_key)
+# 응답 캐시/single-flight 가 요청 간에 공유되도록 프로세스 단위로 하나만 생성
+_llm_client: Optional[ILLMClient] = None
+
+def get_llm_client() -> ILLMClient:
+    global _llm_client
+    if _llm_client is None:
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            # 실제 운영 환경에서는 로그를 남기고 서버 시작을 막거나 예외 처리
+            raise ValueError("GEMINI_API_KEY environment variable is not set.")
+
+        llm_cache = build_kv_cache(
+            os.getenv("LLM_CACHE_BACKEND", "none"),
+            redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            ttl=int(os.getenv("LLM_CACHE_TTL", "86400")),
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+        )
+        adapter = GeminiLLMAdapter(api_key)
+        _llm_client = CachedLLMClient(adapter, llm_cache) if llm_cache else adapter
+    return _llm_client
+
+# 뉴스 분석 진행 이벤트 구독 (Redis pub/sub, 프로세스 단위로 하나만 생성)
+_progress_subscriber: Optional[PipelineProgressSubscriber] = None
+
+def get_progress_subscriber() -> PipelineProgressSubscriber:
+    global _progress_subscriber
+    if _progress_subscriber is None:
+        _progress_subscriber = PipelineProgressSubscriber(
+            os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            keepalive=float(os.getenv("PROGRESS_KEEPALIVE", "15")),
+            snapshot_ttl=int(os.getenv("PROGRESS_SNAPSHOT_TTL", "3600"))
+        )
+    return _progress_subscriber
+
+# 회의록별 뉴스 분석 파이프라인 락 (워커와 같은 Redis 키 / TTL 사용)
+_pipeline_lock: Optional[MeetingPipelineLock] = None
+
+def get_pipeline_lock() -> MeetingPipelineLock:
+    global _pipeline_lock
+    if _pipeline_lock is None:
+        _pipeline_lock = MeetingPipelineLock(
+            os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            ttl=int(os.getenv("NEWS_PIPELINE_LOCK_TTL", "900"))
+        )
+    return _pipeline_lock
 
 
 # =========================================================
@@ -48,8 +125,8 @@ def get_llm_client() -> GeminiLLMAdapter:
 
 # Meeting Service 주입 (Repository + LLM Adapter + Celery Task)
 def get_meeting_service(
-    repository: MySQLMeetingRepository = Depends(get_meeting_repository),
-    llm_client: GeminiLLMAdapter = Depends(get_llm_client)
+    repository: IMeetingRepository = Depends(get_meeting_repository),
+    llm_client: ILLMClient = Depends(get_llm_client)
 ) -> MeetingService:
     # Celery Task는 런타임에 가져오거나(순환참조 방지), None으로 처리
     try:
@@ -60,7 +137,11 @@ def get_meeting_service(
     return MeetingService(
         repository=repository,
         llm_client=llm_client,
-        celery_task=process_news_task
+        celery_task=process_news_task,
+        page_size=int(os.getenv("MEETINGS_PAGE_SIZE", "20")),
+        progress=get_progress_subscriber(),
+        stale_after=float(os.getenv("NEWS_TASK_STALE_AFTER", "900")),
+        pipeline_lock=get_pipeline_lock()
     )
 
 # User Service 주입 (Repository)
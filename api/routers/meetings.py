@@ -1,10 +1,14 @@
+import json
+import time
+from typing import Optional
 from fastapi import APIRouter, Request, Depends, Form, status
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
 # [수정 1] api.dependencies에서 서비스와 "유저 인증 함수"를 가져옵니다.
 # (기존의 from services import user_svc 삭제)
-from api.dependencies import get_meeting_service, get_current_user_required
+from api.dependencies import get_meeting_service, get_current_user_required, get_progress_subscriber
+from infrastructure.progress.pipeline_progress import PipelineProgressSubscriber
 from services.meeting_service import MeetingService
 
 from core.templates import templates
@@ -45,20 +49,23 @@ async def create_meeting(
         status_code=status.HTTP_303_SEE_OTHER
     )
 
-# 3. 회의록 목록 조회 (GET)
+# 3. 회의록 목록 조회 (GET, cursor 로 다음 페이지)
 @router.get("/read/all")
 async def get_all_meetings_ui(
     request: Request,
+    cursor: Optional[str] = None,
     service: MeetingService = Depends(get_meeting_service),
     session_user = Depends(get_current_user_required)
 ):
-    all_meetings = await service.get_all_meetings(user_id=session_user["id"])
+    page = await service.get_meetings_page(user_id=session_user["id"], cursor=cursor)
     
     return templates.TemplateResponse(
         request=request,
         name="main_meeting.html",
         context={
-            "all_meetings": all_meetings,
+            "all_meetings": page["items"],
+            "next_cursor": page["next_cursor"],
+            "is_first_page": cursor is None,
             "session_user": session_user
         }
     )
@@ -103,10 +110,56 @@ async def retry_news_analysis(
     service: MeetingService = Depends(get_meeting_service),
     session_user = Depends(get_current_user_required)
 ):
+    requested_at = time.time()
     await service.retry_news_analysis(meeting_id=id, user_id=session_user["id"])
 
     # 비동기 요청이므로 202 Accepted 또는 JSON 응답 반환
     return JSONResponse(
-        content={"status": "retry_started", "meeting_id": id},
+        content={"status": "retry_started", "meeting_id": id, "requested_at": requested_at},
         status_code=status.HTTP_202_ACCEPTED
+    )
+
+# 뉴스 분석 작업 상태 (JSON)
+# state: queued | running | done | failed | stale | unknown, 진행 중이면 재시도 요청은 409
+@router.get("/status/{id}")
+async def get_news_status(
+    id: int,
+    service: MeetingService = Depends(get_meeting_service),
+    session_user = Depends(get_current_user_required)
+):
+    news_status = await service.get_news_status(meeting_id=id, user_id=session_user["id"])
+    return JSONResponse(content=news_status)
+
+# 뉴스 분석 진행 상황 (Server-Sent Events)
+# 워커가 Redis pub/sub 으로 발행한 단계별 이벤트를 그대로 전달하고, 완료/실패 시 스트림을 닫습니다.
+@router.get("/progress/{id}")
+async def stream_news_progress(
+    request: Request,
+    id: int,
+    since: float = 0.0,
+    service: MeetingService = Depends(get_meeting_service),
+    progress: PipelineProgressSubscriber = Depends(get_progress_subscriber),
+    session_user = Depends(get_current_user_required)
+):
+    # 권한 확인 (없으면 404) + 진행 중인 실행이 없으면 구독하지 않고 바로 종료 이벤트 전달
+    news_status = await service.get_news_status(meeting_id=id, user_id=session_user["id"])
+
+    async def event_stream():
+        if news_status["state"] in ("stale", "unknown"):
+            event = {"meeting_id": id, "step": "failed", "ts": time.time(), "message": "진행 중인 분석이 없습니다."}
+            yield f"event: progress\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+            return
+        async for event in progress.events(id, since=since):
+            if await request.is_disconnected():
+                break
+            if event is None:
+                # 프록시가 유휴 연결을 끊지 않도록 주석 라인 전송
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: progress\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
\ No newline at end of file
@@ -1,18 +1,34 @@
 # celery_worker.py
 import os
+import gc
 import asyncio
-import json
-import pymysql
-from celery import Celery
+import contextlib
+from celery import Celery, chain
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown, worker_ready, worker_shutdown
 from kombu import Queue
-from celery.result import allow_join_result
 from dotenv import load_dotenv
 
 # [Adapter Import] 리팩토링된 인프라스트럭처 어댑터들
 from infrastructure.llm.gemini_adapter import GeminiLLMAdapter
+from infrastructure.llm.cached_llm_client import CachedLLMClient
+from infrastructure.cache.kv_cache import build_kv_cache, RedisKeyValueCache
+from infrastructure.cache.invalidation import CacheInvalidator
+from infrastructure.cache.pipeline_coalescing import MeetingPipelineLock, SharedWorkMap
 from infrastructure.search.google_search_adapter import GoogleSearchAdapter
+from infrastructure.search.cached_search_client import CachedSearchClient
 from infrastructure.crawler.newspaper_adapter import NewspaperCrawlerAdapter
+from infrastructure.crawler.article_cache import SQLiteArticleCache, RedisArticleCache
 from infrastructure.ai.sbert_adapter import SbertAdapter
+from infrastructure.ai.embedding_cache import EmbeddingCache
+from infrastructure.ai.sbert_batcher import SbertMicroBatcher
+from infrastructure.ai.sbert_backends import is_fork_safe
+from infrastructure.db.sync_pool import PyMySQLPool, parse_db_conn
+from infrastructure.db.news_items_writer import NewsItemsWriter
+from infrastructure.db.cached_meeting_repository import meeting_detail_key
+from infrastructure.progress.pipeline_progress import PipelineProgressPublisher
+from services.news_summary_service import NewsSummaryService
+from utils.rate_limiter import AsyncTokenBucket
+from utils.async_runtime import AsyncRuntime
 
 load_dotenv()
 
@@ -20,6 +36,23 @@ load_dotenv()
 DB_CONN = os.getenv("DB_CONN")
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# S-BERT 워커 시작 옵션 (gpu 큐 워커에서만 켭니다)
+SBERT_WARMUP = os.getenv("SBERT_WARMUP", "false").lower() == "true"    # 태스크 수신 전 모델 로드 + 더미 인코딩
+SBERT_PRELOAD = os.getenv("SBERT_PRELOAD", "false").lower() == "true"  # prefork 부모에서 로드해 자식과 COW 공유
+SBERT_READY_FILE = os.getenv("SBERT_READY_FILE")                       # 워밍업 완료 시 생성되는 readiness 파일
+
+# 검색 1페이지가 오자마자 크롤링을 시작하고 나머지 페이지는 백그라운드로 받음 (adaptive pagination 과 함께 사용)
+SEARCH_STREAMING = os.getenv("SEARCH_STREAMING", "false").lower() == "true"
+
+# 크롤링 조기 종료 예산 (0 이면 제한 없음)
+CRAWL_MAX_CANDIDATES = int(os.getenv("CRAWL_MAX_CANDIDATES", "0"))   # 유효 기사가 이만큼 모이면 중단
+CRAWL_TIME_BUDGET = float(os.getenv("CRAWL_TIME_BUDGET", "0"))       # 크롤링 전체 제한 시간(초)
+
+# 동시에 진행 중인 같은 키워드 집합의 파이프라인끼리 검색 + 크롤링 결과 공유 (SHARED_WORK_TTL=0 이면 끔)
+SHARED_WORK_TTL = int(os.getenv("SHARED_WORK_TTL", "30"))                         # 대기자가 가져갈 때까지의 최대 보관 시간(초)
+SHARED_WORK_WAIT_TIMEOUT = int(os.getenv("SHARED_WORK_WAIT_TIMEOUT", "120"))      # 선행 파이프라인 대기 한도(초)
+SHARED_WORK_POLL_INTERVAL = int(os.getenv("SHARED_WORK_POLL_INTERVAL", "3"))      # 대기 중 재조회 간격(초)
+
 if not DB_CONN:
     raise ValueError("DB_CONN 환경 변수가 설정되지 않았습니다.")
 
@@ -46,59 +79,467 @@ celery_app.conf.update(
     
     # 라우팅 설정: S-BERT 태스크는 무조건 'gpu' 큐로 보냄
     task_routes={
-        'celery_worker.run_sbert_task': {'queue': 'gpu'}
-    }
+        'celery_worker.run_sbert_task': {'queue': 'gpu'},
+        'celery_worker.rank_news_task': {'queue': 'gpu'}
+    },
+
+    # 워밍업 시 prefork 자식 프로세스의 초기화(모델 로드)가 기본 4초를 넘기므로 대기 시간 확장
+    worker_proc_alive_timeout=float(os.getenv("SBERT_WARMUP_TIMEOUT", "120")) if SBERT_WARMUP else 4.0
 )
 
-# --- 동기 DB 연결 헬퍼 함수 ---
-def get_sync_db_conn():
-    from urllib.parse import urlparse
-    
-    # SQLAlchemy용 URL 접두어 처리
-    conn_str = DB_CONN
-    if conn_str.startswith("mysql+aiomysql://"):
-        conn_str = "mysql://" + conn_str[len("mysql+aiomysql://"):]
-        
-    try:
-        parsed = urlparse(conn_str)
-        return pymysql.connect(
-            host=parsed.hostname,
-            port=parsed.port or 3306,
-            user=parsed.username,
-            password=parsed.password,
-            database=parsed.path.lstrip('/'),
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
-    except Exception as e:
-        print(f"DB 연결 설정 오류: {e}")
-        return None
+# --- 동기 DB 커넥션 풀 + news_items 저장기 (연결은 워커 프로세스 시작 시그널에서 생성) ---
+db_pool = PyMySQLPool(
+    parse_db_conn(DB_CONN),
+    max_size=int(os.getenv("DB_POOL_SIZE", "4")),
+    health_check_interval=float(os.getenv("DB_HEALTH_CHECK_INTERVAL", "30"))
+)
+
+# API 서버의 회의록 조회 캐시 무효화 (MEETING_CACHE_BACKEND 와 같은 값으로 설정)
+# redis 면 공유 캐시에서 직접 지우고, memory 면 pub/sub 으로 API 프로세스들에 알림
+MEETING_CACHE_BACKEND = os.getenv("MEETING_CACHE_BACKEND", "none")
+meeting_cache_invalidator = CacheInvalidator(
+    RedisKeyValueCache(REDIS_URL) if MEETING_CACHE_BACKEND == "redis" else None,
+    redis_url=REDIS_URL
+) if MEETING_CACHE_BACKEND != "none" else None
+
+# 파이프라인 단계별 진행 이벤트 발행 (API 서버의 /meetings/progress/{id} SSE 로 전달)
+progress_publisher = PipelineProgressPublisher(
+    REDIS_URL,
+    snapshot_ttl=int(os.getenv("PROGRESS_SNAPSHOT_TTL", "3600"))
+)
+
+# 회의록별 파이프라인 락: 재시도 연타 / 중복 등록 시 하나의 파이프라인만 실행
+pipeline_lock = MeetingPipelineLock(REDIS_URL, ttl=int(os.getenv("NEWS_PIPELINE_LOCK_TTL", "900")))
+
+# 동시에 들어온 같은 주제의 파이프라인은 검색/크롤링 결과를 공유하고 S-BERT 랭킹부터 갈라짐
+shared_work = SharedWorkMap(
+    REDIS_URL,
+    result_ttl=SHARED_WORK_TTL,
+    claim_ttl=SHARED_WORK_WAIT_TIMEOUT
+) if SHARED_WORK_TTL > 0 else None
+
+# write-behind 모드에서 flush 될 때까지 잡아 두는 회의록 락 토큰 (meeting_id -> lock_token)
+# flush 전에 락을 풀면 재시도가 뉴스를 초기화한 뒤 이전 실행의 지연 쓰기가 덮어쓸 수 있음
+pending_lock_tokens = {}
+
+def on_news_items_written(meeting_ids: list):
+    """DB 반영(write-behind 면 flush) 직후: 조회 캐시 무효화 + 저장 완료 이벤트 발행 + 회의록 락 해제"""
+    if meeting_cache_invalidator:
+        meeting_cache_invalidator.invalidate(meeting_detail_key(meeting_id) for meeting_id in meeting_ids)
+    for meeting_id in meeting_ids:
+        progress_publisher.publish(meeting_id, "saved")
+        lock_token = pending_lock_tokens.pop(meeting_id, None)
+        if lock_token:
+            release_news_pipeline_lock(meeting_id, lock_token)
+
+def on_news_items_dropped(meeting_ids: list):
+    """write-behind 쓰기를 반영할 수 없어 버린 경우: 실패 이벤트 발행 + 회의록 락 해제"""
+    for meeting_id in meeting_ids:
+        progress_publisher.publish(meeting_id, "failed", message="DB 저장 실패")
+        lock_token = pending_lock_tokens.pop(meeting_id, None)
+        if lock_token:
+            release_news_pipeline_lock(meeting_id, lock_token)
+
+# DB_WRITE_BEHIND=true 시 결과를 모아 DB_FLUSH_INTERVAL 초 / DB_FLUSH_SIZE 건 단위로 다중 행 INSERT
+news_writer = NewsItemsWriter(
+    db_pool,
+    write_behind=os.getenv("DB_WRITE_BEHIND", "false").lower() == "true",
+    flush_interval=float(os.getenv("DB_FLUSH_INTERVAL", "0.5")),
+    flush_size=int(os.getenv("DB_FLUSH_SIZE", "20")),
+    spool_path=os.getenv("DB_SPOOL_PATH"),
+    on_written=on_news_items_written,
+    on_dropped=on_news_items_dropped
+)
 
 # --- Adapter 인스턴스 초기화 (워커 프로세스 시작 시 생성) ---
-gemini_adapter = GeminiLLMAdapter(api_key=os.getenv("GEMINI_API_KEY"))
+gemini_adapter = GeminiLLMAdapter(
+    api_key=os.getenv("GEMINI_API_KEY"),
+    batch_token_budget=int(os.getenv("SUMMARY_BATCH_TOKEN_BUDGET", "30000"))
+)
+
+# LLM 응답 캐시 (LLM_CACHE_BACKEND: none | memory | redis)
+llm_cache = build_kv_cache(
+    os.getenv("LLM_CACHE_BACKEND", "none"),
+    redis_url=REDIS_URL,
+    ttl=int(os.getenv("LLM_CACHE_TTL", "86400")),
+    max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+)
+llm_client = CachedLLMClient(gemini_adapter, llm_cache) if llm_cache else gemini_adapter
 
+# 뉴스 요약 서비스 (동시 호출 + 토큰 버킷 + 타임아웃 + 재시도)
+# 레이트 리밋은 워커 프로세스 단위이므로 전체 쿼터 / 프로세스 수로 설정합니다.
+news_summary_service = NewsSummaryService(
+    llm_client,
+    max_concurrency=int(os.getenv("SUMMARY_MAX_CONCURRENCY", "5")),
+    rate_limiter=AsyncTokenBucket(
+        rate=float(os.getenv("SUMMARY_RATE_PER_SEC", "2")),
+        capacity=int(os.getenv("SUMMARY_RATE_BURST", "5"))
+    ),
+    call_timeout=float(os.getenv("SUMMARY_CALL_TIMEOUT", "30")),
+    max_retries=int(os.getenv("SUMMARY_MAX_RETRIES", "3")),
+    use_batch=os.getenv("SUMMARY_BATCH", "false").lower() == "true"
+)
+
+# 검색 어댑터 (HTTP/2 keep-alive 커넥션 풀을 이벤트 루프 단위로 재사용)
 search_adapter = GoogleSearchAdapter(
     json_api_key=os.getenv("CUSTOM_SEARCH_JSON_API_KEY"),
-    engine_id=os.getenv("CUSTOM_SEARCH_ENGINE_API_KEY")
+    engine_id=os.getenv("CUSTOM_SEARCH_ENGINE_API_KEY"),
+    http2=os.getenv("SEARCH_HTTP2", "true").lower() == "true",
+    pagination=os.getenv("SEARCH_PAGINATION", "fixed"),
+    max_duplicate_ratio=float(os.getenv("SEARCH_MAX_DUPLICATE_RATIO", "0.5"))
+)
+
+# 검색 결과 캐시 (SEARCH_CACHE_BACKEND: none | memory | redis, 짧은 TTL 권장)
+search_cache = build_kv_cache(
+    os.getenv("SEARCH_CACHE_BACKEND", "none"),
+    redis_url=REDIS_URL,
+    ttl=int(os.getenv("SEARCH_CACHE_TTL", "600")),
+    max_entries=int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+)
+search_client = CachedSearchClient(search_adapter, search_cache) if search_cache else search_adapter
+
+# 크롤링 결과 캐시 (ARTICLE_CACHE_BACKEND: none | sqlite | redis)
+def build_article_cache():
+    backend = os.getenv("ARTICLE_CACHE_BACKEND", "none")
+    options = dict(
+        ttl=int(os.getenv("ARTICLE_CACHE_TTL", "3600")),
+        max_stale=int(os.getenv("ARTICLE_CACHE_MAX_STALE", "86400")),
+        max_entries=int(os.getenv("ARTICLE_CACHE_MAX_ENTRIES", "10000"))
+    )
+    if backend == "sqlite":
+        return SQLiteArticleCache(os.getenv("ARTICLE_CACHE_PATH", "article_cache.sqlite3"), **options)
+    if backend == "redis":
+        return RedisArticleCache(REDIS_URL, **options)
+    return None
+
+# 크롤러 어댑터 (CRAWLER_MODE=async 시 커넥션 풀 + 전역/도메인별 동시성 제한 + deadline)
+crawler_adapter = NewspaperCrawlerAdapter(
+    mode=os.getenv("CRAWLER_MODE", "executor"),
+    max_concurrency=int(os.getenv("CRAWLER_MAX_CONCURRENCY", "20")),
+    per_host_concurrency=int(os.getenv("CRAWLER_PER_HOST_CONCURRENCY", "4")),
+    fetch_timeout=float(os.getenv("CRAWLER_FETCH_TIMEOUT", "10")),
+    parse_workers=int(os.getenv("CRAWLER_PARSE_WORKERS", "4")),
+    cache=build_article_cache()
 )
 
-crawler_adapter = NewspaperCrawlerAdapter()
+# S-BERT 임베딩 캐시 (메모리 LRU + SBERT_CACHE_DIR 지정 시 디스크 계층)
+embedding_cache = EmbeddingCache(
+    max_entries=int(os.getenv("SBERT_CACHE_SIZE", "10000")),
+    disk_dir=os.getenv("SBERT_CACHE_DIR"),
+    disk_max_entries=int(os.getenv("SBERT_CACHE_DISK_SIZE", "100000"))
+)
 
 # S-BERT 어댑터 (내부적으로 모델 로딩 Singleton 처리됨)
-sbert_adapter = SbertAdapter()
+sbert_adapter = SbertAdapter(
+    embedding_cache=embedding_cache,
+    encode_batch_size=int(os.getenv("SBERT_ENCODE_BATCH_SIZE", "32")),
+    min_score=float(os.getenv("SBERT_MIN_SCORE")) if os.getenv("SBERT_MIN_SCORE") else None,
+    debug=os.getenv("SBERT_DEBUG", "false").lower() == "true",
+    chunk_pooling=os.getenv("SBERT_CHUNK_POOLING", "max"),
+    chunk_overlap=int(os.getenv("SBERT_CHUNK_OVERLAP", "32")),
+    max_chunks_per_article=int(os.getenv("SBERT_MAX_CHUNKS", "8")),
+    backend=os.getenv("SBERT_BACKEND", "torch"),
+    onnx_path=os.getenv("SBERT_ONNX_PATH")
+)
+
+# S-BERT 마이크로 배처: 동시에 들어온 run_sbert_task / rank_news_task 요청을 묶어서 인코딩
+# (gpu 워커를 -P threads 또는 -P gevent 로 실행해야 요청이 겹쳐 배칭 효과가 납니다)
+sbert_batcher = SbertMicroBatcher(
+    sbert_adapter,
+    window_ms=int(os.getenv("SBERT_BATCH_WINDOW_MS", "20")),
+    max_batch_size=int(os.getenv("SBERT_BATCH_MAX_SIZE", "8"))
+)
+
+# 워커 프로세스 단위 이벤트 루프: 태스크마다 asyncio.run 을 하지 않고 이 루프에 코루틴을 제출하므로
+# 검색/크롤러 커넥션 풀과 LLM single-flight 등이 태스크 사이에 유지됩니다.
+async_runtime = AsyncRuntime("news-worker-loop")
+async_runtime.on_shutdown(search_adapter.aclose)
+async_runtime.on_shutdown(crawler_adapter.aclose)
 
 
 # =============================================================================
-# [Task 1] GPU 작업: S-BERT 유사도 분석
-# 이 작업은 'gpu' 큐를 구독하는 워커에서만 실행됩니다.
+# [Worker Signals] 이벤트 루프 / DB 커넥션 풀 시작 / 종료
+# prefork: 자식 프로세스마다 시작 (fork 이전에 스레드/소켓을 만들지 않음)
+# threads/solo: 태스크를 실행하는 메인 프로세스에서 한 번 시작 (모든 스레드가 공유)
+# =============================================================================
+def _start_worker_resources():
+    async_runtime.start()
+    db_pool.open(min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")))
+    news_writer.start()
+
+def _stop_worker_resources():
+    news_writer.close()
+    db_pool.close()
+    async_runtime.stop()
+
+@worker_init.connect
+def start_worker_resources(sender=None, **kwargs):
+    if not _is_prefork_pool(sender):
+        _start_worker_resources()
+
+@worker_process_init.connect
+def start_worker_resources_in_child(**kwargs):
+    _start_worker_resources()
+
+@worker_process_shutdown.connect
+def stop_worker_resources_in_child(**kwargs):
+    _stop_worker_resources()
+
+@worker_shutdown.connect
+def stop_worker_resources(**kwargs):
+    _stop_worker_resources()
+
+
+# =============================================================================
+# [Worker Signals] S-BERT 모델 사전 로드 / 워밍업 / readiness 보고
+# =============================================================================
+def _is_prefork_pool(worker) -> bool:
+    return "prefork" in str(getattr(worker, "pool_cls", "prefork"))
+
+# prefork 자식 프로세스 수 (fork 이전 worker_init 에서 기록, 모든 자식의 워밍업 완료 판정용)
+_prefork_concurrency = 0
+
+@worker_init.connect
+def preload_sbert_model(sender=None, **kwargs):
+    """
+    워커 메인 프로세스 시작 시 (prefork 라면 fork 이전) 모델 가중치만 로드합니다.
+    더미 인코딩은 torch 의 intra-op/OpenMP 스레드풀을 띄우므로, prefork 에서는 fork 이후 자식에서 수행합니다.
+    """
+    global _prefork_concurrency
+    if _is_prefork_pool(sender):
+        _prefork_concurrency = getattr(sender, "concurrency", 0) or 0
+    clear_sbert_ready()
+
+    preload = SBERT_PRELOAD and is_fork_safe(sbert_adapter.backend)
+    if SBERT_PRELOAD and not preload:
+        print("[GPU Worker] CUDA 환경에서는 fork 이전 로드를 할 수 없어 SBERT_PRELOAD 를 무시합니다.")
+
+    # threads/gevent 풀은 메인 프로세스에서 태스크를 실행하므로 여기서 워밍업
+    if (SBERT_WARMUP or SBERT_PRELOAD) and not _is_prefork_pool(sender):
+        sbert_adapter.warm_up()
+    elif preload:
+        sbert_adapter.get_model()
+        # 로드된 객체를 GC 추적 대상에서 제외해 자식 프로세스의 COW 페이지가 복사되지 않도록 함
+        gc.freeze()
+
+@worker_process_init.connect
+def warm_up_sbert_model(**kwargs):
+    """prefork 자식 프로세스가 태스크를 받기 전에 워밍업합니다 (사전 로드 시 더미 인코딩만 수행)."""
+    if SBERT_WARMUP or SBERT_PRELOAD:
+        sbert_adapter.warm_up()
+        if SBERT_READY_FILE:
+            _report_child_warm()
+
+def _warm_marker_path() -> str:
+    return f"{SBERT_READY_FILE}.warm"
+
+def _write_sbert_ready():
+    with open(SBERT_READY_FILE, "w") as f:
+        f.write(str(os.getpid()))
+    print(f"[GPU Worker] readiness 보고 완료 ({SBERT_READY_FILE})")
+
+def _report_child_warm():
+    """
+    워밍업을 마친 자식의 pid 를 기록하고, 모든 자식이 마쳤으면 readiness 파일을 만듭니다.
+    prefork 의 worker_ready 는 자식들의 worker_process_init 이 끝나기 전에 올 수 있어 여기서 판정합니다.
+    """
+    with open(_warm_marker_path(), "a") as f:
+        f.write(f"{os.getpid()}\n")
+    with open(_warm_marker_path()) as f:
+        warm = {line.strip() for line in f if line.strip()}
+    if len(warm) >= _prefork_concurrency:
+        _write_sbert_ready()
+
+@worker_ready.connect
+def report_sbert_ready(**kwargs):
+    # prefork 는 자식 프로세스가 워밍업을 마칠 때 보고 (_report_child_warm)
+    if (SBERT_WARMUP or SBERT_PRELOAD) and SBERT_READY_FILE and not _prefork_concurrency:
+        _write_sbert_ready()
+
+@worker_shutdown.connect
+def clear_sbert_ready(**kwargs):
+    if not SBERT_READY_FILE:
+        return
+    for path in (SBERT_READY_FILE, _warm_marker_path()):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+# =============================================================================
+# [Helper] 검색 + 크롤링 스트리밍 (SEARCH_STREAMING=true)
+# =============================================================================
+async def search_and_crawl_streaming(keywords: list) -> list:
+    """
+    검색 결과 묶음이 도착할 때마다 크롤링 태스크를 띄워, 다음 페이지 검색과 크롤링을 겹쳐 실행합니다.
+    모든 페이지가 CRAWL_MAX_CANDIDATES 예산 하나를 공유하며, 예산이 차면 남은 검색/크롤링을 취소합니다.
+    (CRAWL_TIME_BUDGET 은 페이지별 크롤링 제한 시간)
+    """
+    news_items = []
+    crawl_jobs = []
+    enough = asyncio.Event()
+
+    async def crawl_page(urls: list):
+        async def drain():
+            async with contextlib.aclosing(crawler_adapter.stream_urls(urls)) as stream:
+                async for item in stream:
+                    news_items.append(item)
+                    if CRAWL_MAX_CANDIDATES and len(news_items) >= CRAWL_MAX_CANDIDATES:
+                        enough.set()
+                        return
+        try:
+            await asyncio.wait_for(drain(), timeout=CRAWL_TIME_BUDGET or None)
+        except asyncio.TimeoutError:
+            pass
+
+    async def search_pages():
+        async with contextlib.aclosing(search_client.stream_urls(keywords, count=50)) as pages:
+            async for urls in pages:
+                print(f"  [Step 1] URL {len(urls)}개 수신 → 바로 크롤링 시작")
+                crawl_jobs.append(asyncio.ensure_future(crawl_page(urls)))
+        await asyncio.gather(*crawl_jobs)
+
+    runner = asyncio.ensure_future(search_pages())
+    waiter = asyncio.ensure_future(enough.wait())
+    try:
+        await asyncio.wait({runner, waiter}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        pending = [task for task in (runner, waiter, *crawl_jobs) if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    # 예산을 채우기 전에 검색이 실패했다면 호출 측(search_news_task)에서 중단 처리
+    if runner.done() and not runner.cancelled() and runner.exception() and not enough.is_set():
+        raise runner.exception()
+
+    print(f"  [Step 2] 스트리밍 크롤링 완료 ({len(news_items)}개)")
+    return news_items[:CRAWL_MAX_CANDIDATES] if CRAWL_MAX_CANDIDATES else news_items
+
+
+# =============================================================================
+# [Pipeline] 뉴스 분석 파이프라인: 검색 -> 크롤링 -> (GPU) 랭킹 -> 요약 -> 저장
+# 각 단계는 독립된 태스크이며 chain 으로 연결됩니다. 단계마다 파이프라인 컨텍스트(dict)를
+# 받아 결과를 채워 다음 단계로 넘기므로, 어떤 워커도 다른 큐의 결과를 기다리며 블로킹하지 않습니다.
+#
+# 컨텍스트 형식:
+# {"meeting_id", "user_id", "summary_meeting", "keywords",
+#  "news_urls", "news_items", "selected_news", "shared_work_owner", "lock_token", "halted"}
 # =============================================================================
+def _release_shared_work(ctx: dict):
+    owner = ctx.pop("shared_work_owner", None)
+    if owner and shared_work:
+        try:
+            shared_work.release(ctx["keywords"], owner)
+        except Exception as e:
+            print(f"  [Shared Work Error] claim 해제 실패: {e}")
+
+
+def _halt(ctx: dict, reason: str) -> dict:
+    """이후 단계가 작업 없이 통과하도록 컨텍스트에 중단 사유를 기록합니다."""
+    print(f"  [Pipeline] 중단 (meeting_id={ctx['meeting_id']}): {reason}")
+    ctx["halted"] = reason
+    # 공유 작업을 맡고 있었다면 대기 중인 같은 주제의 파이프라인이 이어받도록 놓아줌
+    _release_shared_work(ctx)
+    progress_publisher.publish(ctx["meeting_id"], "failed", message=reason)
+    return ctx
+
+
+def _claim_shared_work(task, ctx: dict) -> bool:
+    """
+    같은 키워드의 공유 결과가 있으면 ctx["news_items"] 에 채우고 True 를 반환합니다.
+    다른 파이프라인이 검색/크롤링 중이면 워커를 붙잡지 않고 태스크를 재시도(countdown)해 기다리며,
+    대기 한도를 넘기거나 Redis 오류가 나면 공유 없이 직접 수행합니다.
+    """
+    if shared_work is None:
+        return False
+    try:
+        state, news_items = shared_work.claim(ctx["keywords"], task.request.id)
+    except Exception as e:
+        print(f"  [Shared Work Error] 조회 실패, 단독 실행: {e}")
+        return False
+
+    if state == SharedWorkMap.READY:
+        print(f"  [Step 1] 같은 주제의 검색/크롤링 결과 재사용 ({len(news_items)}개)")
+        ctx["news_items"] = news_items
+        return True
+    if state == SharedWorkMap.CLAIMED:
+        ctx["shared_work_owner"] = task.request.id
+        return False
+
+    max_waits = SHARED_WORK_WAIT_TIMEOUT // max(SHARED_WORK_POLL_INTERVAL, 1)
+    if task.request.retries < max_waits:
+        print(f"  [Step 1] 같은 주제의 파이프라인이 진행 중 → {SHARED_WORK_POLL_INTERVAL}초 후 재조회")
+        raise task.retry(countdown=SHARED_WORK_POLL_INTERVAL, max_retries=max_waits)
+    print("  [Step 1] 공유 결과 대기 한도 초과, 단독 실행")
+    return False
+
+
+# [Stage 1] 뉴스 URL 검색 (IO 작업, cpu_io 큐)
+@celery_app.task(name='celery_worker.search_news_task', bind=True, ignore_result=True)
+def search_news_task(self, ctx: dict):
+    keywords = ctx["keywords"]
+    if _claim_shared_work(self, ctx):
+        progress_publisher.publish(ctx["meeting_id"], "searched", shared=True)
+        return ctx
+
+    print(f"  [Step 1] Google 검색 시작 (키워드: {keywords})")
+    try:
+        if SEARCH_STREAMING:
+            # 1+2. 검색 결과가 페이지 단위로 도착하는 대로 크롤링 시작 (crawl 단계는 통과)
+            ctx["news_items"] = async_runtime.run(search_and_crawl_streaming(keywords))
+            progress_publisher.publish(ctx["meeting_id"], "searched")
+            return ctx
+
+        ctx["news_urls"] = async_runtime.run(search_client.search_urls(keywords, count=50))
+    except Exception as e:
+        return _halt(ctx, f"검색 실패: {e}")
+
+    if not ctx["news_urls"]:
+        return _halt(ctx, "검색된 뉴스 URL이 없습니다.")
+    progress_publisher.publish(ctx["meeting_id"], "searched", count=len(ctx["news_urls"]))
+    return ctx
+
+
+# [Stage 2] 뉴스 본문 크롤링 (IO 작업, cpu_io 큐)
+@celery_app.task(name='celery_worker.crawl_news_task', ignore_result=True)
+def crawl_news_task(ctx: dict):
+    if ctx.get("halted"):
+        return ctx
+
+    if "news_items" not in ctx:
+        urls = ctx.pop("news_urls")
+        print(f"  [Step 2] 크롤링 시작 ({len(urls)}개 URL)")
+        try:
+            ctx["news_items"] = async_runtime.run(crawler_adapter.crawl_with_budget(
+                urls,
+                max_items=CRAWL_MAX_CANDIDATES or None,
+                time_budget=CRAWL_TIME_BUDGET or None
+            ))
+        except Exception as e:
+            return _halt(ctx, f"크롤링 실패: {e}")
+
+    if not ctx["news_items"]:
+        return _halt(ctx, "크롤링된 뉴스 내용이 없습니다.")
+
+    owner = ctx.pop("shared_work_owner", None)
+    if owner and shared_work:
+        try:
+            shared_work.publish(ctx["keywords"], owner, ctx["news_items"])
+        except Exception as e:
+            print(f"  [Shared Work Error] 결과 공유 실패: {e}")
+    progress_publisher.publish(ctx["meeting_id"], "crawled", count=len(ctx["news_items"]))
+    return ctx
+
+
+# [Task] GPU 작업: S-BERT 유사도 분석 (기존 호출 규약 유지: 요약문, 뉴스 목록 -> 상위 뉴스)
+# 이 작업은 'gpu' 큐를 구독하는 워커에서만 실행됩니다.
 @celery_app.task(name='celery_worker.run_sbert_task')
 def run_sbert_task(summary_meeting: str, news_items_list: list):
     print("  [GPU Task] S-BERT 분석 시작...")
     try:
-        # SbertAdapter를 사용하여 유사도 계산 후 상위 뉴스 선별
-        result = sbert_adapter.calculate_similarity(summary_meeting, news_items_list)
-        print("  [GPU Task] 분석 완료.")
+        # 마이크로 배처를 통해 유사도 계산 후 상위 뉴스 선별
+        result = sbert_batcher.submit(summary_meeting, news_items_list)
+        print(f"  [GPU Task] 분석 완료. (임베딩 캐시: {embedding_cache.stats()})")
         return result
     except Exception as e:
         print(f"  [GPU Task Error] S-BERT 처리 중 오류: {e}")
@@ -106,8 +547,92 @@ def run_sbert_task(summary_meeting: str, news_items_list: list):
         return news_items_list[:5]
 
 
+# [Stage 3] GPU 작업: 파이프라인 컨텍스트로 run_sbert_task 와 같은 랭킹 수행 ('gpu' 큐)
+@celery_app.task(name='celery_worker.rank_news_task', ignore_result=True)
+def rank_news_task(ctx: dict):
+    if ctx.get("halted"):
+        return ctx
+
+    ctx["selected_news"] = run_sbert_task(ctx["summary_meeting"], ctx.pop("news_items"))
+    progress_publisher.publish(ctx["meeting_id"], "ranked", count=len(ctx["selected_news"]))
+    return ctx
+
+
+# [Stage 4] 뉴스 요약 (LLM API 호출 - IO 작업, cpu_io 큐)
+@celery_app.task(name='celery_worker.summarize_news_task', ignore_result=True)
+def summarize_news_task(ctx: dict):
+    if ctx.get("halted"):
+        return ctx
+
+    print(f"  [Step 4] 뉴스 요약 시작 (Gemini API)")
+    try:
+        ctx["selected_news"] = async_runtime.run(news_summary_service.summarize_all(ctx["selected_news"]))
+    except Exception as e:
+        return _halt(ctx, f"뉴스 요약 실패: {e}")
+    print("  [Step 4] 뉴스 요약 완료")
+    progress_publisher.publish(ctx["meeting_id"], "summarized", count=len(ctx["selected_news"]))
+    return ctx
+
+
+# [Stage 5] DB 업데이트 (커넥션 풀 / write-behind 저장기 사용, cpu_io 큐)
+# 중단된 파이프라인도 이 단계를 통과하므로 여기서 회의록 락을 해제합니다 (락 값 = 진입 작업 ID, write-behind 면 flush 후).
+@celery_app.task(name='celery_worker.persist_news_task')
+def persist_news_task(ctx: dict):
+    meeting_id = ctx["meeting_id"]
+    if ctx.get("halted"):
+        release_news_pipeline_lock(meeting_id, ctx["lock_token"])
+        return ctx["halted"]
+
+    final_news = ctx["selected_news"]
+    print("  [Step 5] DB 저장 시작")
+    if news_writer.write_behind:
+        # 락은 flush 후 on_news_items_written 에서 해제 (flush 되지 못하면 TTL 뒤 만료)
+        pending_lock_tokens[meeting_id] = ctx["lock_token"]
+    if news_writer.write(meeting_id, final_news):
+        print("  [Step 5] DB 저장 성공" if not news_writer.write_behind else "  [Step 5] DB 저장 예약 (write-behind)")
+    else:
+        print("  [Step 5 Error] DB 업데이트 실패")
+        progress_publisher.publish(meeting_id, "failed", message="DB 저장 실패")
+        pending_lock_tokens.pop(meeting_id, None)
+
+    if not news_writer.write_behind:
+        release_news_pipeline_lock(meeting_id, ctx["lock_token"])
+    return f"Task Completed: meeting_id={meeting_id}, news_count={len(final_news)}"
+
+
+@celery_app.task(name='celery_worker.release_news_pipeline_lock')
+def release_news_pipeline_lock(meeting_id: int, token: str):
+    try:
+        pipeline_lock.release(meeting_id, token)
+    except Exception as e:
+        print(f"  [Pipeline Lock Error] 락 해제 실패 (meeting_id={meeting_id}): {e}")
+
+
+# 단계가 예외로 끝나 chain 이 끊긴 경우 (link_error): 실패 이벤트 발행 + 락 해제
+# 실패 이벤트가 없으면 상태 API 가 진입 작업 SUCCESS / 마지막 단계 PENDING 을 보고 계속 running 으로 판단함
+@celery_app.task(name='celery_worker.fail_news_pipeline')
+def fail_news_pipeline(meeting_id: int, token: str):
+    progress_publisher.publish(meeting_id, "failed", message="뉴스 분석 중 오류가 발생했습니다")
+    release_news_pipeline_lock(meeting_id, token)
+
+
+def build_news_pipeline(ctx: dict):
+    """
+    파이프라인 단계를 chain 으로 연결합니다 (큐 라우팅은 task_routes 를 따름).
+    컨텍스트(크롤링 본문 포함)는 메시지로 다음 단계에 넘어가므로 중간 단계는 ignore_result 로
+    결과 백엔드에 남기지 않고, 상태 API 가 조회하는 마지막 단계(persist) 결과만 저장합니다.
+    """
+    return chain(
+        search_news_task.s(ctx),
+        crawl_news_task.s(),
+        rank_news_task.s(),
+        summarize_news_task.s(),
+        persist_news_task.s()
+    )
+
+
 # =============================================================================
-# [Task 2] 메인 작업: 뉴스 검색 -> 크롤링 -> (S-BERT 위임) -> 요약 -> 저장
+# [Entry] 메인 작업: 파이프라인 컨텍스트를 만들어 chain 을 시작하고 바로 반환
 # 이 작업은 'cpu_io' 큐(기본)를 구독하는 워커에서 실행됩니다.
 # =============================================================================
 @celery_app.task(name='process_news_task', bind=True)
@@ -120,68 +645,28 @@ def process_news_task(
 ):
     print(f"[Main Task] 뉴스 분석 프로세스 시작 (meeting_id={meeting_id})")
 
+    # 회의록 락의 값은 이 진입 작업의 ID: API 가 등록 전에 같은 ID 로 잡아 두었거나(재시도/생성),
+    # 락이 없으면 여기서 잡음. 다른 작업이 잡고 있으면 중복 실행이므로 시작하지 않음
+    lock_token = self.request.id
     try:
-        # 1. 뉴스 URL 검색 (IO 작업)
-        print(f"  [Step 1] Google 검색 시작 (키워드: {keyword_meeting_list})")
-        news_urls = asyncio.run(search_adapter.search_urls(keyword_meeting_list, count=50))
-        
-        if not news_urls:
-            print("  [Step 1] 검색된 뉴스 URL이 없습니다.")
-            return "No news urls found."
-
-        # 2. 뉴스 본문 크롤링 (IO 작업)
-        print(f"  [Step 2] 크롤링 시작 ({len(news_urls)}개 URL)")
-        news_items = asyncio.run(crawler_adapter.crawl_urls(news_urls))
-        
-        if not news_items:
-            print("  [Step 2] 크롤링된 뉴스 내용이 없습니다.")
-            return "No crawled content."
-
-        # 3. S-BERT 분석 위임 (GPU 작업 호출 및 대기)
-        print("  [Step 3] S-BERT 분석 요청 (GPU 워커로 위임)...")
-        try:
-            # allow_join_result()를 사용하여 하위 태스크가 끝날 때까지 대기
-            with allow_join_result():
-                selected_news = run_sbert_task.delay(summary_meeting, news_items).get(timeout=300)
-            print(f"  [Step 3] S-BERT 분석 완료 (선별된 뉴스 {len(selected_news)}개)")
-        except Exception as e:
-            print(f"  [Step 3] S-BERT 태스크 호출 실패: {e}")
-            # 실패 시 Fallback
-            selected_news = news_items[:5]
-
-        # 4. 뉴스 요약 (LLM API 호출 - IO 작업)
-        print(f"  [Step 4] 뉴스 요약 시작 (Gemini API)")
-        
-        async def summarize_all(items):
-            for item in items:
-                if item.get('original'):
-                    item['summary'] = await gemini_adapter.generate_news_summary(item['original'])
-            return items
-            
-        final_news = asyncio.run(summarize_all(selected_news))
-        print("  [Step 4] 뉴스 요약 완료")
-
-        # 5. DB 업데이트 (동기 DB 연결 사용)
-        print("  [Step 5] DB 저장 시작")
-        conn = get_sync_db_conn()
-        if conn:
-            try:
-                with conn.cursor() as cursor:
-                    sql = "UPDATE meetings SET news_items = %s WHERE id = %s"
-                    cursor.execute(sql, (json.dumps(final_news, ensure_ascii=False), meeting_id))
-                conn.commit()
-                print("  [Step 5] DB 저장 성공")
-            except Exception as e:
-                print(f"  [Step 5 Error] DB 업데이트 실패: {e}")
-                conn.rollback()
-            finally:
-                conn.close()
-        else:
-            print("  [Step 5 Error] DB 연결 실패")
-
-        return f"Task Completed: meeting_id={meeting_id}, news_count={len(final_news)}"
-
+        acquired = pipeline_lock.holder(meeting_id) == lock_token or pipeline_lock.acquire(meeting_id, lock_token)
     except Exception as e:
-        print(f"[Main Task Error] 작업 실패: {e}")
-        # 필요 시 재시도 로직 활성화
-        # raise self.retry(exc=e, countdown=60)
\ No newline at end of file
+        print(f"[Pipeline Lock Error] 락 확인 실패, 락 없이 실행: {e}")
+        acquired = True
+
+    if not acquired:
+        print(f"[Main Task] 이미 진행 중인 파이프라인이 있어 건너뜀 (meeting_id={meeting_id})")
+        return None
+
+    ctx = {
+        "meeting_id": meeting_id,
+        "user_id": user_id,
+        "summary_meeting": summary_meeting,
+        "keywords": keyword_meeting_list,
+        "lock_token": lock_token
+    }
+    progress_publisher.publish(meeting_id, "started")
+    pipeline = build_news_pipeline(ctx).apply_async(link_error=fail_news_pipeline.si(meeting_id, lock_token))
+    pipeline_id = pipeline.id
+    print(f"[Main Task] 파이프라인 등록 완료 (meeting_id={meeting_id}, 마지막 단계 task_id={pipeline_id})")
+    return pipeline_id
@@ -1,8 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List
+from typing import AsyncIterator, Dict, Optional, List
 
 class ICrawlerClient(ABC):
     @abstractmethod
     async def crawl_urls(self, urls: List[str]) -> List[Dict[str, Optional[str]]]:
         """URL 리스트를 받아 제목, 원문을 추출"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def stream_urls(self, urls: List[str]) -> AsyncIterator[Dict[str, Optional[str]]]:
+        """URL 리스트를 크롤링하며 완료되는 순서대로 기사를 yield (async generator)"""
+        pass
+
+    @abstractmethod
+    async def crawl_with_budget(
+        self,
+        urls: List[str],
+        max_items: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> List[Dict[str, Optional[str]]]:
+        """유효한 기사가 max_items 개 모이거나 time_budget(초)이 지나면 남은 크롤링을 취소하고 반환"""
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 class ILLMClient(ABC):
 
@@ -11,4 +11,13 @@ class ILLMClient(ABC):
     @abstractmethod
     async def generate_news_summary(self, news_content: str) -> str:
         """뉴스 원문을 받아 요약문을 반환"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def generate_news_summaries(self, news_contents: List[str]) -> List[Optional[str]]:
+        """여러 뉴스 원문을 한 번의 요청으로 요약하여 입력 순서대로 반환 (요약하지 못한 항목은 None)"""
+        pass
+
+    def split_news_batches(self, news_contents: List[str]) -> List[List[int]]:
+        """generate_news_summaries 1회에 담을 인덱스 그룹 (기본: 전체를 한 그룹)"""
+        return [list(range(len(news_contents)))] if news_contents else []
@@ -1,6 +1,7 @@
 # app/domain/interfaces/repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 
 class IMeetingRepository(ABC):
     """
@@ -19,8 +20,21 @@ class IMeetingRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_all_by_user(self, user_id: int) -> List[Dict[str, Any]]:
-        """사용자의 모든 회의록을 최신순으로 조회합니다."""
+    async def get_news_items(self, meeting_id: int) -> List[Dict[str, Any]]:
+        """회의록의 추천 뉴스(랭킹 순, 원문 제외)를 조회합니다."""
+        pass
+
+    @abstractmethod
+    async def get_page_by_user(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        사용자의 회의록을 최신순((created_dt, id) 내림차순)으로 최대 limit 개 조회합니다.
+        after 가 주어지면 해당 (created_dt, id) 보다 이전 회의록부터 조회합니다 (keyset pagination).
+        """
         pass
 
     @abstractmethod
@@ -28,7 +42,12 @@ class IMeetingRepository(ABC):
         """회의록을 삭제합니다."""
         pass
     
+    @abstractmethod
+    async def set_news_task_id(self, meeting_id: int, task_id: str) -> None:
+        """뉴스 분석 작업 ID 를 저장합니다."""
+        pass
+
     @abstractmethod
     async def clear_news_items(self, meeting_id: int, user_id: int) -> None:
-        """뉴스 아이템을 초기화(NULL) 합니다."""
+        """추천 뉴스를 삭제합니다."""
         pass
\ No newline at end of file
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List
 
 class ISearchClient(ABC):
     @abstractmethod
     async def search_urls(self, keywords: List[str], count: int = 50) -> List[str]:
         """키워드 리스트로 관련 URL 검색"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def stream_urls(self, keywords: List[str], count: int = 50) -> AsyncIterator[List[str]]:
+        """검색 결과 URL을 받는 대로 묶음(List[str]) 단위로 yield (async generator)"""
+        pass
@@ -18,3 +18,21 @@ class SummaryNewsByLLM(BaseModel):
         ...,
         description="Gemini(LLM)가 원본 뉴스를 요약한 핵심 요약본"
     )
+
+
+class NewsSummaryItemByLLM(BaseModel):
+    index: int = Field(
+        ...,
+        description="입력으로 주어진 뉴스 번호 (예: [0] 뉴스의 요약이면 0)"
+    )
+    summary: str = Field(
+        ...,
+        description="해당 뉴스를 한국어 3~4문장으로 요약한 핵심 요약본"
+    )
+
+
+class SummaryNewsListByLLM(BaseModel):
+    summaries: List[NewsSummaryItemByLLM] = Field(
+        ...,
+        description="입력된 모든 뉴스의 요약 리스트 (뉴스 1개당 1개 항목)"
+    )
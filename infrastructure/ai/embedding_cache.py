@@ -0,0 +1,240 @@
+import os
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없는 환경
+    fcntl = None
+
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화(NFC) 후 공백을 하나로 합쳐 동일 본문이 같은 키를 갖도록 합니다."""
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def make_cache_key(model_name: str, text: str) -> str:
+    """(모델 이름, 정규화된 텍스트)의 SHA-256 해시를 캐시 키로 사용합니다."""
+    payload = f"{model_name}\x00{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class DiskEmbeddingStore:
+    """
+    memory-mapped float32 행렬 + SQLite 인덱스(key → 행 번호)로 구성된 디스크 임베딩 저장소.
+    - embeddings.f32 : (capacity, dim) float32 행렬 (max_rows 까지 필요할 때 두 배씩 확장)
+    - index.sqlite3  : slots(row, key), meta(dim, next_row)
+    조회/추가 비용은 요청한 키 수에만 비례합니다 (인덱스 전체를 읽거나 다시 쓰지 않음).
+    max_rows 행이 차면 가장 먼저 기록된 행부터 덮어씁니다 (ring buffer).
+    여러 워커 프로세스가 같은 디렉터리를 공유할 수 있도록 쓰기 시에는 파일 락을 잡습니다.
+    """
+
+    MATRIX_FILE = "embeddings.f32"
+    INDEX_FILE = "index.sqlite3"
+    LOCK_FILE = ".lock"
+    QUERY_CHUNK = 500  # SQLite 바인딩 변수 개수 제한 안에서 IN 조회
+
+    def __init__(self, directory: str, max_rows: int = 100000, initial_capacity: int = 1024):
+        self.directory = directory
+        self.max_rows = max_rows
+        self.initial_capacity = min(initial_capacity, max_rows)
+        os.makedirs(directory, exist_ok=True)
+
+        self._matrix_path = os.path.join(directory, self.MATRIX_FILE)
+        self._index_path = os.path.join(directory, self.INDEX_FILE)
+        self._lock_path = os.path.join(directory, self.LOCK_FILE)
+
+        self.dim: Optional[int] = None
+        self._matrix: Optional[np.memmap] = None
+        # SQLite 연결은 fork 를 넘겨 쓸 수 없으므로 처음 사용할 때 프로세스마다 엽니다
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+    def _lock(self):
+        handle = open(self._lock_path, "a+")
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        return handle
+
+    def _unlock(self, handle):
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+        handle.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            # 부모 프로세스의 연결은 닫지 않고 버림
+            self._conn = None
+            self._matrix = None
+            self._pid = os.getpid()
+        if self._conn is None:
+            conn = sqlite3.connect(self._index_path, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS slots (row INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _meta(self, conn: sqlite3.Connection, name: str) -> Optional[int]:
+        row = conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _lookup(self, conn: sqlite3.Connection, keys: List[str]) -> Dict[str, int]:
+        found: Dict[str, int] = {}
+        for start in range(0, len(keys), self.QUERY_CHUNK):
+            chunk = keys[start:start + self.QUERY_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            found.update(conn.execute(f"SELECT key, row FROM slots WHERE key IN ({placeholders})", chunk))
+        return found
+
+    def _open_matrix(self, min_rows: int = 0) -> np.memmap:
+        """행렬을 매핑합니다. min_rows 보다 작으면 (max_rows 이내에서) 파일을 키웁니다 (쓰기 락 필요)."""
+        capacity = 0
+        if os.path.exists(self._matrix_path):
+            capacity = os.path.getsize(self._matrix_path) // (4 * self.dim)
+
+        if capacity < min_rows:
+            new_capacity = min(self.max_rows, max(self.initial_capacity, capacity * 2, min_rows))
+            with open(self._matrix_path, "ab") as f:
+                f.truncate(new_capacity * self.dim * 4)
+            capacity = new_capacity
+            self._matrix = None
+
+        if self._matrix is None or self._matrix.shape[0] != capacity:
+            self._matrix = np.memmap(self._matrix_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        return self._matrix
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    @property
+    def rows(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM slots").fetchone()[0]
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        conn = self._connection()
+        found = self._lookup(conn, list(keys))
+        if not found:
+            return {}
+        if self.dim is None:
+            self.dim = self._meta(conn, "dim")
+        matrix = self._open_matrix()
+        if matrix.shape[0] <= max(found.values()):
+            # 다른 프로세스가 행렬을 키웠으면 다시 매핑
+            self._matrix = None
+            matrix = self._open_matrix()
+        vectors = {key: np.array(matrix[row]) for key, row in found.items() if row < matrix.shape[0]}
+
+        # 읽는 사이 다른 프로세스가 그 행을 새 키로 덮어썼다면(기존 키가 지워졌다면) 버림
+        current = self._lookup(conn, list(vectors))
+        return {key: vec for key, vec in vectors.items() if current.get(key) == found[key]}
+
+    def put_many(self, items: Dict[str, np.ndarray]):
+        if not items:
+            return
+        handle = self._lock()
+        try:
+            conn = self._connection()
+            existing = self._lookup(conn, list(items))
+            new_items = [(key, vec) for key, vec in items.items() if key not in existing][-self.max_rows:]
+            if not new_items:
+                return
+            if self.dim is None:
+                self.dim = self._meta(conn, "dim") or int(new_items[0][1].shape[-1])
+
+            next_row = self._meta(conn, "next_row") or 0
+            rows = [(next_row + i) % self.max_rows for i in range(len(new_items))]
+
+            # 1) 덮어쓸 행의 기존 키를 먼저 지워 커밋 → 읽는 쪽이 새 벡터를 이전 키의 값으로 가져가지 않음
+            conn.executemany("DELETE FROM slots WHERE row = ?", [(row,) for row in rows])
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta(name, value) VALUES (?, ?)",
+                [("dim", self.dim), ("next_row", (next_row + len(new_items)) % self.max_rows)]
+            )
+            conn.commit()
+
+            # 2) 벡터 기록 후 새 키 등록
+            matrix = self._open_matrix(min_rows=max(rows) + 1)
+            for row, (_, vec) in zip(rows, new_items):
+                matrix[row] = vec
+            matrix.flush()
+            conn.executemany(
+                "INSERT OR REPLACE INTO slots(row, key) VALUES (?, ?)",
+                [(row, key) for row, (key, _) in zip(rows, new_items)]
+            )
+            conn.commit()
+        finally:
+            self._unlock(handle)
+
+
+class EmbeddingCache:
+    """
+    content-addressed 임베딩 캐시 (in-process LRU → 디스크 순으로 조회).
+    키는 make_cache_key(model_name, text) 이며, 캐시 미스만 인코딩 대상이 됩니다.
+    """
+
+    def __init__(self, max_entries: int = 10000, disk_dir: Optional[str] = None, disk_max_entries: int = 100000):
+        self.max_entries = max_entries
+        self.disk = DiskEmbeddingStore(disk_dir, max_rows=disk_max_entries) if disk_dir else None
+        self._lru: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 히트/미스 카운터
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _remember(self, key: str, vec: np.ndarray):
+        self._lru[key] = vec
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """캐시에 존재하는 키의 벡터만 반환합니다."""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._lru:
+                    self._lru.move_to_end(key)
+                    found[key] = self._lru[key]
+            self.memory_hits += len(found)
+
+            remaining = [key for key in keys if key not in found]
+            if self.disk and remaining:
+                from_disk = self.disk.get_many(remaining)
+                for key, vec in from_disk.items():
+                    self._remember(key, vec)
+                found.update(from_disk)
+                self.disk_hits += len(from_disk)
+
+            self.misses += len(set(keys) - set(found))
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]):
+        with self._lock:
+            for key, vec in items.items():
+                self._remember(key, vec)
+            if self.disk:
+                self.disk.put_many(items)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": len(self._lru),
+            "disk_entries": self.disk.rows if self.disk else 0,
+        }
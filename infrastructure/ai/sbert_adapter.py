@@ -1,83 +1,255 @@
-from sentence_transformers import SentenceTransformer, util
-from typing import List, Dict, Optional
-import torch
-
-# [Singleton Pattern] 모델 전역 변수
-sbert_model = None
-
-def get_sbert_model():
-    global sbert_model
-    if sbert_model is None:
-        print("[GPU Worker] S-BERT 모델 로드 중 (paraphrase-multilingual-MiniLM-L12-v2)...")
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        sbert_model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2', device=device)
-        print(f"[GPU Worker] 모델 로드 완료 (Device: {device})")
-    return sbert_model
+from typing import List, Dict, Optional, Tuple
+import time
+import numpy as np
+
+from infrastructure.ai.embedding_cache import EmbeddingCache, make_cache_key
+from infrastructure.ai.sbert_backends import SBERT_BACKENDS, load_sbert_model
+
+MODEL_NAME = 'paraphrase-multilingual-MiniLM-L12-v2'
+
+# [Singleton Pattern] 백엔드별 모델 전역 변수
+sbert_models = {}
+
+def get_sbert_model(backend: str = "torch", onnx_path: Optional[str] = None):
+    if backend not in sbert_models:
+        print(f"[GPU Worker] S-BERT 모델 로드 중 ({MODEL_NAME}, backend={backend})...")
+        sbert_models[backend] = load_sbert_model(MODEL_NAME, backend, onnx_path)
+        print(f"[GPU Worker] 모델 로드 완료 (backend={backend})")
+    return sbert_models[backend]
 
 class SbertAdapter:
+    def __init__(
+        self,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        encode_batch_size: int = 32,
+        min_score: Optional[float] = None,
+        debug: bool = False,
+        chunk_pooling: str = "max",
+        chunk_overlap: int = 32,
+        max_chunks_per_article: int = 8,
+        backend: str = "torch",
+        onnx_path: Optional[str] = None
+    ):
+        if chunk_pooling not in ("max", "mean"):
+            raise ValueError(f"지원하지 않는 chunk_pooling 값입니다: {chunk_pooling}")
+        if backend not in SBERT_BACKENDS:
+            raise ValueError(f"지원하지 않는 S-BERT 백엔드입니다: {backend} (지원: {SBERT_BACKENDS})")
+
+        self.embedding_cache = embedding_cache
+        self.encode_batch_size = encode_batch_size
+        self.min_score = min_score  # 이 점수 미만의 뉴스는 top_k 안이라도 제외
+        self.debug = debug          # True일 때만 기사별 점수 로그 출력
+
+        # 긴 기사 본문 청킹 설정
+        self.chunk_pooling = chunk_pooling                    # 청크 점수 풀링 방식 (max | mean)
+        self.chunk_overlap = chunk_overlap                    # 인접 청크 간 겹치는 토큰 수
+        self.max_chunks_per_article = max_chunks_per_article  # 기사당 최대 청크 수 (메모리 상한)
+
+        # 추론 백엔드 (torch | quantized | onnx)
+        self.backend = backend
+        self.onnx_path = onnx_path
+        # 백엔드마다 임베딩 값이 미세하게 다르므로 캐시 키에 백엔드를 포함
+        self.cache_namespace = MODEL_NAME if backend == "torch" else f"{MODEL_NAME}:{backend}"
+
+    def get_model(self):
+        return get_sbert_model(self.backend, self.onnx_path)
+
+    def warm_up(self) -> float:
+        """
+        모델을 로드하고 더미 인코딩을 한 번 수행해 첫 요청의 지연(가중치 로드, 커널/스레드풀 초기화)을 없앱니다.
+        소요 시간(초)을 반환합니다.
+        """
+        started = time.perf_counter()
+        model = self.get_model()
+        # 캐시를 거치지 않고 토크나이저와 인코딩 경로를 모두 한 번씩 실행
+        self._chunk_text(model, "warm up")
+        self._encode_sorted(model, ["warm up", "모델 예열용 더미 문장입니다."])
+        elapsed = time.perf_counter() - started
+        print(f"[GPU Worker] S-BERT 워밍업 완료 ({elapsed:.2f}s, backend={self.backend})")
+        return elapsed
+
+    def _chunk_text(self, model, text: str) -> List[str]:
+        """
+        본문을 모델 최대 시퀀스 길이 이내의 토큰 윈도우로 나눕니다.
+        토크나이저 offset을 이용해 원문을 그대로 잘라내므로 decode 비용이 없습니다.
+        """
+        window = model.max_seq_length - 2  # [CLS]/[SEP] 등 special token 자리
+        encoding = model.tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            truncation=False,
+            verbose=False
+        )
+        offsets = encoding["offset_mapping"]
+        if len(offsets) <= window:
+            return [text]
+
+        stride = max(window - self.chunk_overlap, 1)
+        chunks = []
+        for start in range(0, len(offsets), stride):
+            end = min(start + window, len(offsets))
+            chunks.append(text[offsets[start][0]:offsets[end - 1][1]])
+            if end == len(offsets) or len(chunks) >= self.max_chunks_per_article:
+                break
+        return chunks
+
+    def _encode_sorted(self, model, texts: List[str]) -> np.ndarray:
+        """길이순으로 정렬해 한 번에 인코딩(패딩 낭비 최소화)한 뒤 원래 순서로 되돌립니다."""
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        encoded = model.encode(
+            [texts[i] for i in order],
+            batch_size=self.encode_batch_size,
+            convert_to_numpy=True
+        )
+        result = np.empty_like(encoded, dtype=np.float32)
+        result[order] = encoded
+        return result
+
+    def encode_texts(self, model, texts: List[str]) -> np.ndarray:
+        """텍스트 리스트를 (N, D) float32 임베딩으로 변환합니다. 캐시 미스만 model.encode를 거칩니다."""
+        if self.embedding_cache is None:
+            return self._encode_sorted(model, texts)
+
+        keys = [make_cache_key(self.cache_namespace, text) for text in texts]
+        cached = self.embedding_cache.get_many(keys)
+
+        # 같은 본문이 여러 번 들어와도 한 번만 인코딩
+        miss_texts: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in miss_texts:
+                miss_texts[key] = text
+
+        if miss_texts:
+            encoded = self._encode_sorted(model, list(miss_texts.values()))
+            fresh = dict(zip(miss_texts.keys(), encoded))
+            self.embedding_cache.put_many(fresh)
+            cached.update(fresh)
+
+        return np.stack([cached[key] for key in keys])
+
     def calculate_similarity(
         self, 
         summary_meeting: str, 
         news_items: List[Dict[str, Optional[str]]],
-        top_k: int = 5
+        top_k: int = 5,
+        min_score: Optional[float] = None
     ) -> List[Dict[str, Optional[str]]]:
-        
+        return self.calculate_similarity_batch([(summary_meeting, news_items, top_k, min_score)])[0]
+
+    def calculate_similarity_batch(
+        self,
+        requests: List[Tuple[str, List[Dict[str, Optional[str]]], int, Optional[float]]],
+    ) -> List[List[Dict[str, Optional[str]]]]:
+        """
+        여러 회의의 (요약본, 뉴스 리스트, top_k, min_score) 요청을 한 번의 인코딩 배치로 처리하고
+        회의별 선별 결과(각 뉴스에 'score' 포함)를 요청 순서대로 반환합니다.
+        """
         # 1. 모델 로드
-        model = get_sbert_model()
+        model = self.get_model()
         if not model:
             print("[Error] 모델 로드 실패. 기본 뉴스 반환.")
-            return news_items[:top_k]
+            return [news_items[:top_k] for _, news_items, top_k, _ in requests]
+
+        # 유효한 뉴스 필터링 및 전체 요청의 텍스트(요약본 + 기사 청크) 수집
+        all_texts: List[str] = []
+        spans = []
+        for summary_meeting, news_items, top_k, min_score in requests:
+            valid_items = [item for item in news_items if item.get('original')]
+            summary_index = len(all_texts)
+            chunk_counts = []
+            if valid_items:
+                all_texts.append(summary_meeting)
+                for item in valid_items:
+                    chunks = self._chunk_text(model, item['original'])
+                    all_texts.extend(chunks)
+                    chunk_counts.append(len(chunks))
+            spans.append((summary_index, chunk_counts, valid_items, top_k,
+                          self.min_score if min_score is None else min_score))
+
+        if not all_texts:
+            return [[] for _ in requests]
+
+        # 2. 임베딩 (Vectorization) - 모든 요청의 청크를 하나의 배치로, L2 정규화하여 내적 = 코사인 유사도
+        embeddings = self.encode_texts(model, all_texts)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings = embeddings / np.maximum(norms, 1e-12)
+
+        results = []
+        for summary_index, chunk_counts, valid_items, top_k, min_score in spans:
+            if not valid_items:
+                results.append([])
+                continue
+            meeting_embedding = embeddings[summary_index]
+            chunk_embeddings = embeddings[summary_index + 1:summary_index + 1 + sum(chunk_counts)]
+            scores = self._pool_chunk_scores(meeting_embedding, chunk_embeddings, chunk_counts)
+            results.append(self._select_top_k(scores, valid_items, top_k, min_score))
+        return results
+
+    def _pool_chunk_scores(
+        self,
+        meeting_embedding: np.ndarray,
+        chunk_embeddings: np.ndarray,
+        chunk_counts: List[int]
+    ) -> np.ndarray:
+        """청크별 임베딩을 기사 단위 코사인 점수(크기: 뉴스 개수)로 풀링합니다."""
+        offsets = np.concatenate(([0], np.cumsum(chunk_counts)[:-1]))
 
-        # 유효한 뉴스 필터링
-        valid_items = [item for item in news_items if item.get('original')]
-        if not valid_items:
+        if self.chunk_pooling == "max":
+            # 기사 내 가장 관련 있는 구간의 점수
+            chunk_scores = chunk_embeddings @ meeting_embedding
+            return np.maximum.reduceat(chunk_scores, offsets)
+
+        # mean: 청크 임베딩 평균을 다시 정규화한 기사 벡터로 점수 계산
+        article_embeddings = np.add.reduceat(chunk_embeddings, offsets, axis=0) / np.asarray(chunk_counts)[:, None]
+        article_norms = np.linalg.norm(article_embeddings, axis=1, keepdims=True)
+        article_embeddings = article_embeddings / np.maximum(article_norms, 1e-12)
+        return article_embeddings @ meeting_embedding
+
+    def _select_top_k(
+        self,
+        scores: np.ndarray,
+        valid_items: List[Dict[str, Optional[str]]],
+        top_k: int,
+        min_score: Optional[float]
+    ) -> List[Dict[str, Optional[str]]]:
+        # 3. 상위 Top-K 추출: argpartition으로 O(n) 선택 후 k개만 정렬
+        k = min(top_k, len(scores))
+        if k <= 0:
             return []
+        if k < len(scores):
+            top_indices = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top_indices = np.arange(len(scores))
+        top_indices = top_indices[np.argsort(-scores[top_indices], kind="stable")]
+        if min_score is not None:
+            top_indices = top_indices[scores[top_indices] >= min_score]
+
+        # 4. 최종 뉴스 리스트 구성 (점수 포함, 원본 dict는 변경하지 않음)
+        top_scores = scores[top_indices].tolist()
+        selected_news = [
+            {**valid_items[idx], "score": score}
+            for idx, score in zip(top_indices.tolist(), top_scores)
+        ]
+
+        print(f"[S-BERT] 뉴스 {len(valid_items)}개 중 {len(selected_news)}개 선별")
+
+        if self.debug:
+            # ------------------------------------------------------------------
+            # [Debug Log] 전체 뉴스 유사도 및 선별된 Top-K 뉴스
+            # ------------------------------------------------------------------
+            print("-" * 60)
+            print(f"[S-BERT Debug] 전체 {len(valid_items)}개 뉴스 유사도 점수:")
+            print("-" * 60)
+            for i, score in enumerate(scores.tolist()):
+                title = valid_items[i].get('title') or '제목 없음'
+                print(f"  [{i+1:02d}] Score: {score:.4f} | Title: {title[:40]}...")
+
+            print("-" * 60)
+            print(f"[S-BERT Debug] 최종 선별된 Top {len(selected_news)} 뉴스:")
+            print("-" * 60)
+            for rank, item in enumerate(selected_news):
+                print(f"  [Rank {rank+1}] Score: {item['score']:.4f} | Title: {item.get('title') or '제목 없음'}")
+            print("-" * 60)
 
-        print(f"\n[S-BERT] 분석 시작: 회의록 요약본 vs 뉴스 {len(valid_items)}개")
-
-        # 2. 임베딩 (Vectorization)
-        meeting_embedding = model.encode(summary_meeting, convert_to_tensor=True)
-        corpus_texts = [item['original'] for item in valid_items]
-        corpus_embeddings = model.encode(corpus_texts, convert_to_tensor=True)
-        
-        # 3. 코사인 유사도 계산
-        # cosine_scores는 1차원 텐서 (크기: 뉴스 개수)
-        cosine_scores = util.cos_sim(meeting_embedding, corpus_embeddings)[0]
-
-        # ------------------------------------------------------------------
-        # [Log 1] 전체 뉴스 유사도 출력
-        # ------------------------------------------------------------------
-        print("-" * 60)
-        print(f"[S-BERT Debug] 전체 {len(valid_items)}개 뉴스 유사도 점수:")
-        print("-" * 60)
-        
-        # (점수, 인덱스) 쌍 생성
-        scores_indices = list(zip(cosine_scores, range(len(valid_items))))
-        
-        for i, (score, idx) in enumerate(scores_indices):
-            title = valid_items[idx].get('title', '제목 없음')
-            # score.item()으로 텐서에서 실수값 추출
-            print(f"  [{i+1:02d}] Score: {score.item():.4f} | Title: {title[:40]}...")
-
-        # 4. 정렬 및 상위 Top-K 추출
-        sorted_scores = sorted(scores_indices, key=lambda x: x[0], reverse=True)
-        top_results = sorted_scores[:top_k]
-        
-        # 5. 최종 뉴스 리스트 구성
-        top_indices = [idx for score, idx in top_results]
-        selected_news = [valid_items[i] for i in top_indices]
-
-        # ------------------------------------------------------------------
-        # [Log 2] 선별된 Top-K 뉴스 유사도 출력
-        # ------------------------------------------------------------------
-        print("-" * 60)
-        print(f"[S-BERT Debug] 최종 선별된 Top {len(selected_news)} 뉴스:")
-        print("-" * 60)
-        
-        for rank, (score, idx) in enumerate(top_results):
-            title = valid_items[idx].get('title', '제목 없음')
-            print(f"  [Rank {rank+1}] Score: {score.item():.4f} | Title: {title}")
-        print("-" * 60)
-        print(f"[S-BERT] 분석 완료.\n")
-
-        return selected_news
\ No newline at end of file
+        return selected_news
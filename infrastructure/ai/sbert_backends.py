@@ -0,0 +1,101 @@
+import os
+from typing import List
+
+import numpy as np
+import torch
+from sentence_transformers import SentenceTransformer
+
+# 지원하는 추론 백엔드
+# - torch     : 기본 SentenceTransformer (CUDA 가능 시 GPU)
+# - quantized : torch 동적 int8 양자화 (nn.Linear, CPU 전용)
+# - onnx      : ONNX Runtime CPU 추론 (최초 실행 시 onnx_path로 export)
+SBERT_BACKENDS = ("torch", "quantized", "onnx")
+
+
+class OnnxSentenceEncoder:
+    """
+    ONNX Runtime 으로 Transformer 본체를 실행하고 mean pooling 을 직접 수행하는 인코더.
+    SbertAdapter 가 사용하는 SentenceTransformer 인터페이스(encode / tokenizer / max_seq_length)만 흉내냅니다.
+    """
+
+    def __init__(self, reference: SentenceTransformer, onnx_path: str):
+        import onnxruntime as ort
+
+        self.tokenizer = reference.tokenizer
+        self.max_seq_length = reference.max_seq_length
+
+        if not os.path.exists(onnx_path):
+            self._export(reference, onnx_path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+
+    def _export(self, reference: SentenceTransformer, onnx_path: str):
+        print(f"[GPU Worker] ONNX 모델 export 중 ({onnx_path})...")
+        os.makedirs(os.path.dirname(onnx_path) or ".", exist_ok=True)
+        transformer = reference[0].auto_model.to("cpu").eval()
+        dummy = self.tokenizer(["warm up"], return_tensors="pt")
+        torch.onnx.export(
+            transformer,
+            (dummy["input_ids"], dummy["attention_mask"]),
+            onnx_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "last_hidden_state": {0: "batch", 1: "sequence"},
+            },
+            opset_version=14,
+        )
+
+    def encode(self, sentences: List[str], batch_size: int = 32, convert_to_numpy: bool = True, **kwargs) -> np.ndarray:
+        if isinstance(sentences, str):
+            sentences = [sentences]
+
+        outputs = []
+        for start in range(0, len(sentences), batch_size):
+            batch = sentences[start:start + batch_size]
+            features = self.tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            attention_mask = features["attention_mask"].astype(np.int64)
+            token_embeddings = self.session.run(
+                ["last_hidden_state"],
+                {"input_ids": features["input_ids"].astype(np.int64), "attention_mask": attention_mask},
+            )[0]
+
+            # mean pooling (SentenceTransformer Pooling 모듈과 동일)
+            mask = attention_mask[..., None].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            outputs.append(summed / np.clip(mask.sum(axis=1), 1e-9, None))
+
+        return np.concatenate(outputs).astype(np.float32)
+
+
+def is_fork_safe(backend: str) -> bool:
+    """fork 이전(부모 프로세스)에 모델을 로드해도 되는지 여부. CUDA 는 fork 후 재초기화할 수 없습니다."""
+    return backend != "torch" or not torch.cuda.is_available()
+
+
+def load_sbert_model(model_name: str, backend: str = "torch", onnx_path: str = None):
+    """백엔드 설정에 맞는 인코더를 생성합니다."""
+    if backend not in SBERT_BACKENDS:
+        raise ValueError(f"지원하지 않는 S-BERT 백엔드입니다: {backend} (지원: {SBERT_BACKENDS})")
+
+    if backend == "torch":
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        return SentenceTransformer(model_name, device=device)
+
+    # quantized / onnx 는 CPU 추론 전용
+    reference = SentenceTransformer(model_name, device="cpu")
+
+    if backend == "quantized":
+        return torch.quantization.quantize_dynamic(reference, {torch.nn.Linear}, dtype=torch.qint8)
+
+    return OnnxSentenceEncoder(reference, onnx_path or os.path.join("models", f"{model_name}.onnx"))
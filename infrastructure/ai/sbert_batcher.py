@@ -0,0 +1,105 @@
+import threading
+import time
+from typing import List, Dict, Optional
+
+from infrastructure.ai.sbert_adapter import SbertAdapter
+
+
+class _PendingRequest:
+    def __init__(
+        self,
+        summary_meeting: str,
+        news_items: List[Dict[str, Optional[str]]],
+        top_k: int,
+        min_score: Optional[float]
+    ):
+        self.summary_meeting = summary_meeting
+        self.news_items = news_items
+        self.top_k = top_k
+        self.min_score = min_score
+        self.done = threading.Event()
+        self.result: Optional[List[Dict[str, Optional[str]]]] = None
+        self.error: Optional[BaseException] = None
+
+
+class SbertMicroBatcher:
+    """
+    동시에 들어온 유사도 요청을 window_ms 동안(또는 max_batch_size개가 찰 때까지) 모아
+    SbertAdapter.calculate_similarity_batch 한 번으로 처리하는 마이크로 배처.
+
+    별도 스레드 없이 "먼저 도착한 요청이 리더"가 되어 배치를 모으고 실행합니다.
+    (gpu 워커를 threads/gevent 풀로 띄워야 한 프로세스 안에서 요청이 겹칩니다.)
+    다른 요청이 진행 중이지 않으면 기다리지 않고 바로 처리하므로, 요청이 겹치지 않는
+    prefork 풀에서는 window_ms 지연이 생기지 않습니다.
+    """
+
+    def __init__(self, adapter: SbertAdapter, window_ms: int = 20, max_batch_size: int = 8):
+        self.adapter = adapter
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+
+        self._cond = threading.Condition()
+        self._pending: List[_PendingRequest] = []
+        self._leader_active = False
+        self._in_flight = 0  # submit 에 들어와 아직 결과를 받지 못한 요청 수
+
+    def submit(
+        self,
+        summary_meeting: str,
+        news_items: List[Dict[str, Optional[str]]],
+        top_k: int = 5,
+        min_score: Optional[float] = None
+    ) -> List[Dict[str, Optional[str]]]:
+        # 배칭 비활성화 시 바로 처리
+        if self.window <= 0 or self.max_batch_size <= 1:
+            return self.adapter.calculate_similarity(summary_meeting, news_items, top_k, min_score)
+
+        request = _PendingRequest(summary_meeting, news_items, top_k, min_score)
+        with self._cond:
+            self._pending.append(request)
+            self._in_flight += 1
+            if len(self._pending) >= self.max_batch_size:
+                self._cond.notify_all()
+            is_leader = not self._leader_active
+            self._leader_active = True
+
+        try:
+            if is_leader:
+                self._run_batch()
+            else:
+                request.done.wait()
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _run_batch(self):
+        # 1. 윈도우가 끝나거나 배치가 찰 때까지 수집 (진행 중인 다른 요청이 없으면 바로 실행)
+        deadline = time.monotonic() + self.window
+        with self._cond:
+            while self._in_flight > 1 and len(self._pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch, self._pending = self._pending, []
+            # 이후 도착한 요청은 새 리더가 처리
+            self._leader_active = False
+
+        # 2. 한 번의 인코딩으로 처리 후 회의별로 결과 분배
+        print(f"  [S-BERT Batch] {len(batch)}개 요청을 묶어서 처리")
+        try:
+            results = self.adapter.calculate_similarity_batch(
+                [(req.summary_meeting, req.news_items, req.top_k, req.min_score) for req in batch]
+            )
+            for req, result in zip(batch, results):
+                req.result = result
+        except Exception as e:
+            for req in batch:
+                req.error = e
+        finally:
+            for req in batch:
+                req.done.set()
@@ -0,0 +1,84 @@
+"""
+S-BERT 백엔드 간 랭킹 일치도 검사.
+
+사용 예:
+    python -m infrastructure.ai.sbert_parity samples.json --backend onnx --top-k 5
+
+samples.json 형식: [{"summary_meeting": "...", "news_items": [{"url": ..., "title": ..., "original": ...}, ...]}, ...]
+"""
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Tuple
+
+from infrastructure.ai.sbert_adapter import SbertAdapter
+from infrastructure.ai.sbert_backends import SBERT_BACKENDS
+
+
+def measure_ranking_parity(
+    samples: List[Tuple[str, List[Dict[str, Any]]]],
+    candidate_backend: str,
+    reference_backend: str = "torch",
+    top_k: int = 5
+) -> Dict[str, Any]:
+    """
+    동일한 샘플을 두 백엔드로 랭킹한 뒤 Top-K 일치도를 측정합니다.
+    - exact_match_rate : Top-K 순서까지 완전히 같은 샘플 비율
+    - same_set_rate    : Top-K 집합이 같은 샘플 비율
+    - mean_overlap     : 샘플별 |Top-K 교집합| / K 평균
+    """
+    reference = SbertAdapter(backend=reference_backend)
+    candidate = SbertAdapter(backend=candidate_backend)
+    requests = [(summary, items, top_k, None) for summary, items in samples]
+
+    timings = {}
+    rankings = {}
+    for name, adapter in (("reference", reference), ("candidate", candidate)):
+        adapter.get_model()  # 모델 로드 시간은 측정에서 제외
+        started = time.perf_counter()
+        results = adapter.calculate_similarity_batch(requests)
+        timings[name] = time.perf_counter() - started
+        rankings[name] = [[item["url"] for item in result] for result in results]
+
+    exact, same_set, overlap = 0, 0, 0.0
+    mismatches = []
+    for i, (ref, cand) in enumerate(zip(rankings["reference"], rankings["candidate"])):
+        exact += ref == cand
+        same_set += set(ref) == set(cand)
+        overlap += len(set(ref) & set(cand)) / max(len(ref), 1)
+        if ref != cand:
+            mismatches.append({"sample": i, "reference": ref, "candidate": cand})
+
+    count = max(len(samples), 1)
+    return {
+        "reference_backend": reference_backend,
+        "candidate_backend": candidate_backend,
+        "samples": len(samples),
+        "top_k": top_k,
+        "exact_match_rate": exact / count,
+        "same_set_rate": same_set / count,
+        "mean_overlap": overlap / count,
+        "reference_seconds": timings["reference"],
+        "candidate_seconds": timings["candidate"],
+        "mismatches": mismatches,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="S-BERT 백엔드 랭킹 일치도 검사")
+    parser.add_argument("samples", help="샘플 JSON 파일 경로")
+    parser.add_argument("--backend", choices=SBERT_BACKENDS, required=True)
+    parser.add_argument("--reference", choices=SBERT_BACKENDS, default="torch")
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.samples, "r", encoding="utf-8") as f:
+        raw_samples = json.load(f)
+
+    report = measure_ranking_parity(
+        [(sample["summary_meeting"], sample["news_items"]) for sample in raw_samples],
+        candidate_backend=args.backend,
+        reference_backend=args.reference,
+        top_k=args.top_k
+    )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
@@ -0,0 +1,61 @@
+import json
+import threading
+from typing import Iterable, Optional
+
+from infrastructure.cache.kv_cache import KeyValueCache
+
+
+class CacheInvalidator:
+    """
+    여러 프로세스에 흩어진 캐시 엔트리를 함께 무효화합니다.
+    - cache : 이 프로세스에서 바로 지울 캐시 (Redis 캐시면 모든 프로세스가 공유, None 이면 생략)
+    - Redis pub/sub 채널로 키 목록을 알려, 프로세스 내부(memory) 캐시를 쓰는 다른 프로세스도 지우게 합니다.
+
+    API 서버는 listen() 으로 구독하고, Celery 워커는 invalidate() 로 발행만 합니다.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[KeyValueCache] = None,
+        redis_url: Optional[str] = None,
+        channel: str = "cache_invalidation"
+    ):
+        self.cache = cache
+        self.channel = channel
+        self.redis = None
+        if redis_url:
+            import redis
+            self.redis = redis.Redis.from_url(redis_url)
+        self._pubsub = None
+        self._listener: Optional[threading.Thread] = None
+
+    def invalidate(self, keys: Iterable[str]):
+        keys = list(keys)
+        if not keys:
+            return
+        if self.cache is not None:
+            self.cache.delete(*keys)
+        if self.redis is not None:
+            self.redis.publish(self.channel, json.dumps(keys))
+
+    def listen(self):
+        """다른 프로세스가 발행한 무효화 메시지를 받아 로컬 캐시에서 지우는 스레드를 시작합니다."""
+        if self.redis is None or self.cache is None or self._listener is not None:
+            return
+        self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: self._on_message})
+        self._listener = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def _on_message(self, message):
+        try:
+            self.cache.delete(*json.loads(message["data"]))
+        except Exception as e:
+            print(f"[Cache Invalidation Error] 메시지 처리 실패: {e}")
+
+    def close(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
@@ -0,0 +1,88 @@
+import time
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class KeyValueCache(ABC):
+    """TTL 이 있는 문자열 key-value 캐시 (LLM 응답, 검색 결과 등 JSON 문자열 저장용)."""
+
+    def __init__(self, ttl: int = 86400):
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """ttl 을 지정하지 않으면 캐시 기본 ttl 을 사용합니다."""
+        pass
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        pass
+
+
+class InMemoryKeyValueCache(KeyValueCache):
+    """프로세스 내부 LRU + TTL 캐시"""
+
+    def __init__(self, ttl: int = 86400, max_entries: int = 5000):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + (ttl or self.ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+class RedisKeyValueCache(KeyValueCache):
+    """Redis 캐시 (API 서버와 모든 워커가 공유). 만료는 Redis TTL 에 맡깁니다."""
+
+    def __init__(self, redis_url: str, ttl: int = 86400):
+        super().__init__(ttl)
+        import redis
+        self.redis = redis.Redis.from_url(redis_url)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.redis.get(key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        self.redis.set(key, value, ex=ttl or self.ttl)
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.redis.delete(*keys)
+
+
+def build_kv_cache(backend: str, redis_url: str = None, ttl: int = 86400, max_entries: int = 5000) -> Optional[KeyValueCache]:
+    """설정값(none | memory | redis)에 맞는 캐시를 생성합니다. none 이면 None."""
+    if backend == "memory":
+        return InMemoryKeyValueCache(ttl=ttl, max_entries=max_entries)
+    if backend == "redis":
+        return RedisKeyValueCache(redis_url, ttl=ttl)
+    return None
@@ -0,0 +1,116 @@
+import json
+import hashlib
+from typing import Any, List, Optional, Tuple
+
+from infrastructure.search.cached_search_client import normalize_keywords
+from infrastructure.db.news_codec import encode_payload, decode_payload
+
+# 값이 자신의 토큰일 때만 키를 지움 (TTL 만료 후 다른 실행이 잡은 락을 지우지 않도록)
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class MeetingPipelineLock:
+    """
+    회의록 ID 별 뉴스 분석 파이프라인 락 (Redis SET NX EX).
+    값은 실행의 진입 작업(process_news_task) ID 입니다. API 가 작업 등록 전에 잡고,
+    워커는 자신의 ID 와 같으면 그대로 진행한 뒤 마지막 단계에서 해제합니다.
+    워커가 죽어도 ttl 초 뒤 자동 해제됩니다.
+    """
+
+    KEY_PREFIX = "news_pipeline_lock:"
+
+    def __init__(self, redis_url: str, ttl: int = 900):
+        import redis
+        self.redis = redis.Redis.from_url(redis_url)
+        self.ttl = ttl
+        self._release = self.redis.register_script(_RELEASE_SCRIPT)
+
+    def _key(self, meeting_id: int) -> str:
+        return f"{self.KEY_PREFIX}{meeting_id}"
+
+    def acquire(self, meeting_id: int, token: str) -> bool:
+        return bool(self.redis.set(self._key(meeting_id), token, nx=True, ex=self.ttl))
+
+    def holder(self, meeting_id: int) -> Optional[str]:
+        value = self.redis.get(self._key(meeting_id))
+        return value.decode("utf-8") if value is not None else None
+
+    def release(self, meeting_id: int, token: str) -> bool:
+        return bool(self._release(keys=[self._key(meeting_id)], args=[token]))
+
+
+class SharedWorkMap:
+    """
+    정규화된 키워드 집합 단위로, 동시에 진행 중인 파이프라인끼리 검색 + 크롤링 결과를 공유합니다.
+    - 처음 도착한 파이프라인이 claim 을 잡고 검색/크롤링을 수행
+    - 그동안 도착한 같은 주제의 파이프라인은 대기자로 등록하고 기다렸다가 다시 조회
+    - claim 을 잡은 쪽은 publish() 로 결과를 남기되, 대기자가 없으면 저장하지 않음
+    - 결과는 등록된 대기자만 가져가며, 마지막 대기자가 가져가면(또는 result_ttl 초 뒤) 삭제
+    따라서 실행이 끝난 뒤 들어온 재시도/새 회의록은 이전 결과를 재사용하지 않습니다.
+    결과는 news_codec 포맷(zstd 압축 msgpack)으로 저장합니다.
+    claim 은 claim_ttl 초 뒤 만료되므로, 선행 파이프라인이 죽어도 대기 중인 쪽이 이어받습니다.
+    """
+
+    RESULT_PREFIX = "shared_work:result:"
+    CLAIM_PREFIX = "shared_work:claim:"
+    WAITERS_PREFIX = "shared_work:waiters:"
+
+    READY = "ready"      # 기다리던 공유 결과 있음
+    CLAIMED = "claimed"  # 이 파이프라인이 작업을 맡음
+    BUSY = "busy"        # 다른 파이프라인이 작업 중 (대기자로 등록됨)
+
+    def __init__(self, redis_url: str, result_ttl: int = 30, claim_ttl: int = 120):
+        import redis
+        self.redis = redis.Redis.from_url(redis_url)
+        self.result_ttl = result_ttl
+        self.claim_ttl = claim_ttl
+        self._release = self.redis.register_script(_RELEASE_SCRIPT)
+
+    def _digest(self, keywords: List[str]) -> str:
+        payload = json.dumps(normalize_keywords(keywords), ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def claim(self, keywords: List[str], owner: str) -> Tuple[str, Optional[Any]]:
+        """(READY, 결과) / (CLAIMED, None) / (BUSY, None) 중 하나를 반환합니다."""
+        digest = self._digest(keywords)
+        waiters_key = self.WAITERS_PREFIX + digest
+        if self.redis.sismember(waiters_key, owner):
+            cached = self.redis.get(self.RESULT_PREFIX + digest)
+            if cached is not None:
+                self._consume(digest, owner)
+                return self.READY, decode_payload(cached)
+
+        claim_key = self.CLAIM_PREFIX + digest
+        current = None
+        if not self.redis.set(claim_key, owner, nx=True, ex=self.claim_ttl):
+            current = self.redis.get(claim_key)
+        # 새로 잡았거나, 재시도된 같은 파이프라인이면 계속 작업을 맡음
+        if current is None or current.decode("utf-8") == owner:
+            if current is None:
+                self.redis.srem(waiters_key, owner)
+            return self.CLAIMED, None
+
+        self.redis.sadd(waiters_key, owner)
+        self.redis.expire(waiters_key, self.claim_ttl + self.result_ttl)
+        return self.BUSY, None
+
+    def _consume(self, digest: str, owner: str):
+        waiters_key = self.WAITERS_PREFIX + digest
+        self.redis.srem(waiters_key, owner)
+        if not self.redis.scard(waiters_key):
+            self.redis.delete(self.RESULT_PREFIX + digest, waiters_key)
+
+    def publish(self, keywords: List[str], owner: str, value: Any):
+        digest = self._digest(keywords)
+        if self.redis.scard(self.WAITERS_PREFIX + digest):
+            self.redis.set(self.RESULT_PREFIX + digest, encode_payload(value), ex=self.result_ttl)
+        self._release(keys=[self.CLAIM_PREFIX + digest], args=[owner])
+
+    def release(self, keywords: List[str], owner: str):
+        """결과 없이 claim 만 놓습니다 (실패 시 대기 중인 파이프라인이 이어받음)."""
+        self._release(keys=[self.CLAIM_PREFIX + self._digest(keywords)], args=[owner])
@@ -0,0 +1,179 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# 캐시 엔트리 형식
+# {"url", "title", "original", "etag", "last_modified", "fetched_at"}
+ArticleEntry = Dict[str, Any]
+
+
+class ArticleCache(ABC):
+    """
+    URL 단위 크롤링 결과 캐시.
+    - ttl       : 이 시간(초) 동안은 재요청 없이 그대로 사용 (fresh)
+    - max_stale : ttl 이후 이 시간까지는 보관하며 ETag/Last-Modified 로 재검증 (stale)
+    - max_entries : 보관할 최대 엔트리 수 (초과 시 오래 사용되지 않은 것부터 제거)
+    """
+
+    def __init__(self, ttl: int = 3600, max_stale: int = 86400, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+
+    def is_fresh(self, entry: ArticleEntry) -> bool:
+        return time.time() - entry["fetched_at"] < self.ttl
+
+    @abstractmethod
+    def get(self, url: str) -> Optional[ArticleEntry]:
+        """URL의 캐시 엔트리를 반환합니다 (max_stale 이 지난 엔트리는 None)."""
+        pass
+
+    @abstractmethod
+    def put(self, entry: ArticleEntry) -> None:
+        """크롤링 결과를 저장합니다."""
+        pass
+
+    @abstractmethod
+    def touch(self, url: str) -> None:
+        """재검증(304) 성공 시 fetched_at 을 현재 시각으로 갱신합니다."""
+        pass
+
+
+class SQLiteArticleCache(ArticleCache):
+    """
+    로컬 SQLite 파일 기반 캐시 (같은 서버의 워커 프로세스끼리 공유).
+    SQLite 연결은 fork 를 넘겨 쓸 수 없으므로, 처음 사용할 때 프로세스마다 따로 엽니다
+    (prefork 부모에서 만든 객체를 자식이 물려받아도 안전).
+    """
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            # 부모 프로세스의 연결과 락은 닫지 않고 버림 (자식에서 닫으면 부모의 연결 상태까지 건드림)
+            self._lock = threading.Lock()
+            self._conn = None
+            self._pid = os.getpid()
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        self._check_pid()
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open()
+            yield self._conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                original TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_accessed_at ON articles(accessed_at)")
+        conn.commit()
+        return conn
+
+    def get(self, url: str) -> Optional[ArticleEntry]:
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT url, title, original, etag, last_modified, fetched_at FROM articles WHERE url = ?",
+                (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            if time.time() - row[5] >= self.ttl + self.max_stale:
+                conn.execute("DELETE FROM articles WHERE url = ?", (url,))
+                conn.commit()
+                return None
+            conn.execute("UPDATE articles SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            conn.commit()
+        return dict(zip(("url", "title", "original", "etag", "last_modified", "fetched_at"), row))
+
+    def put(self, entry: ArticleEntry) -> None:
+        with self._connection() as conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO articles(url, title, original, etag, last_modified, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                entry["url"], entry["title"], entry["original"],
+                entry.get("etag"), entry.get("last_modified"), entry["fetched_at"], time.time()
+            ))
+            # 크기 제한: 가장 오래 접근되지 않은 엔트리부터 제거
+            conn.execute('''
+                DELETE FROM articles WHERE url IN (
+                    SELECT url FROM articles ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+            ''', (self.max_entries,))
+            conn.commit()
+
+    def touch(self, url: str) -> None:
+        with self._connection() as conn:
+            now = time.time()
+            conn.execute("UPDATE articles SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            conn.commit()
+
+
+class RedisArticleCache(ArticleCache):
+    """Redis 기반 캐시 (브로커와 같은 Redis 를 사용해 모든 워커가 공유)."""
+
+    KEY_PREFIX = "article_cache:"
+    INDEX_KEY = "article_cache:index"  # 접근 시각 기준 sorted set (크기 제한용)
+
+    def __init__(self, redis_url: str, **kwargs):
+        super().__init__(**kwargs)
+        import redis
+        self.redis = redis.Redis.from_url(redis_url)
+
+    def _key(self, url: str) -> str:
+        return self.KEY_PREFIX + hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[ArticleEntry]:
+        key = self._key(url)
+        raw = self.redis.get(key)
+        if raw is None:
+            return None
+        self.redis.zadd(self.INDEX_KEY, {key: time.time()})
+        return json.loads(raw)
+
+    def put(self, entry: ArticleEntry) -> None:
+        key = self._key(entry["url"])
+        pipe = self.redis.pipeline()
+        # 만료는 Redis TTL 에 맡김 (fresh + stale 기간)
+        pipe.set(key, json.dumps(entry, ensure_ascii=False), ex=self.ttl + self.max_stale)
+        pipe.zadd(self.INDEX_KEY, {key: time.time()})
+        pipe.execute()
+        self._evict()
+
+    def touch(self, url: str) -> None:
+        entry = self.get(url)
+        if entry is not None:
+            entry["fetched_at"] = time.time()
+            self.put(entry)
+
+    def _evict(self):
+        overflow = self.redis.zcard(self.INDEX_KEY) - self.max_entries
+        if overflow > 0:
+            oldest = self.redis.zrange(self.INDEX_KEY, 0, overflow - 1)
+            pipe = self.redis.pipeline()
+            pipe.delete(*oldest)
+            pipe.zrem(self.INDEX_KEY, *oldest)
+            pipe.execute()
@@ -1,25 +1,296 @@
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 from newspaper import Article
+import time
+import weakref
 import asyncio
+import httpx
+import requests
 from domain.interfaces.crawler import ICrawlerClient
+from infrastructure.crawler.article_cache import ArticleCache, ArticleEntry
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+def _response_html(response: Union[requests.Response, httpx.Response]) -> Union[str, bytes]:
+    """
+    Content-Type 에 charset 이 명시된 경우에만 본문을 디코딩해 text 로 사용합니다.
+    명시되지 않으면 requests 는 ISO-8859-1 로 디코딩해 한글 본문이 깨지므로,
+    newspaper 의 get_html 처럼 bytes 를 넘겨 <meta charset> / 내용 기반으로 판별하게 합니다.
+    (디코딩 비용이 있으므로 async 모드에서는 파싱 워커 풀에서 호출)
+    """
+    if "charset=" in response.headers.get("Content-Type", "").lower():
+        return response.text
+    return response.content
+
+class _LoopState:
+    """이벤트 루프마다 하나씩 생성되는 HTTP 커넥션 풀과 동시성 제한 세마포어"""
+    def __init__(self, loop, client: httpx.AsyncClient, max_concurrency: int, per_host_concurrency: int):
+        self.loop = loop
+        self.client = client
+        self.global_limit = asyncio.Semaphore(max_concurrency)
+        self.per_host_concurrency = per_host_concurrency
+        # 도메인별 세마포어는 요청(대기 포함)이 참조하는 동안만 유지 → 워커 수명 동안 호스트 수만큼 쌓이지 않음
+        self.host_limits: "weakref.WeakValueDictionary[str, asyncio.Semaphore]" = weakref.WeakValueDictionary()
+
+    def host_limit(self, host: str) -> asyncio.Semaphore:
+        limit = self.host_limits.get(host)
+        if limit is None:
+            limit = asyncio.Semaphore(self.per_host_concurrency)
+            self.host_limits[host] = limit
+        return limit
 
 class NewspaperCrawlerAdapter(ICrawlerClient):
-    def _crawl_one(self, url: str) -> Dict[str, Optional[str]]:
+    """
+    mode="executor" : 기존 방식 (크롤러 전용 스레드풀(max_concurrency 개)에서 Article.download + parse)
+    mode="async"    : httpx 커넥션 풀로 비동기 다운로드 (전역/도메인별 동시성 제한, 요청별 deadline)
+                      + 제한된 크기의 파싱 워커 풀
+
+    cache 지정 시 두 모드 모두 URL 캐시를 먼저 확인하고, TTL 이 지난 엔트리는
+    ETag/Last-Modified 조건부 요청으로 재검증합니다 (304 면 다운로드/파싱 생략).
+    """
+
+    def __init__(
+        self,
+        mode: str = "executor",
+        max_concurrency: int = 20,
+        per_host_concurrency: int = 4,
+        fetch_timeout: float = 10.0,
+        parse_workers: int = 4,
+        user_agent: str = DEFAULT_USER_AGENT,
+        cache: Optional[ArticleCache] = None
+    ):
+        if mode not in ("executor", "async"):
+            raise ValueError(f"지원하지 않는 크롤러 모드입니다: {mode}")
+
+        self.mode = mode
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.fetch_timeout = fetch_timeout
+        self.user_agent = user_agent
+        self.cache = cache
+        self._parse_pool = ThreadPoolExecutor(max_workers=parse_workers, thread_name_prefix="article-parse")
+        # executor 모드 다운로드 전용 풀: 이벤트 루프의 기본 executor 를 채우지 않고,
+        # 취소 시 아직 시작하지 않은 다운로드는 실행되지 않음
+        self._fetch_pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="article-fetch")
+        self._state: Optional[_LoopState] = None
+
+    # ------------------------------------------------------------------
+    # 공통: 파싱
+    # ------------------------------------------------------------------
+    def _build_item(self, url: str, article: Article) -> Optional[Dict[str, Optional[str]]]:
+        return {
+            "url": url,
+            "title": article.title,
+            "original": article.text,
+            "summary": None
+        } if article.title and article.text else None
+
+    def _parse_html(self, url: str, html: Union[str, bytes]) -> Optional[Dict[str, Optional[str]]]:
         try:
             article = Article(url)
-            article.download()
+            article.download(input_html=html)
             article.parse()
-            return {
-                "url": url,
-                "title": article.title,
-                "original": article.text,
-                "summary": None
-            } if article.title and article.text else None
-        except:
+            return self._build_item(url, article)
+        except Exception:
             return None
 
+    # ------------------------------------------------------------------
+    # 공통: 캐시 조회 / 재검증 응답 처리
+    # ------------------------------------------------------------------
+    def _item_from_entry(self, entry: ArticleEntry) -> Dict[str, Optional[str]]:
+        return {
+            "url": entry["url"],
+            "title": entry["title"],
+            "original": entry["original"],
+            "summary": None
+        }
+
+    def _request_headers(self, cached: Optional[ArticleEntry]) -> Dict[str, str]:
+        headers = {"User-Agent": self.user_agent}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+
+    def _handle_response(
+        self,
+        url: str,
+        cached: Optional[ArticleEntry],
+        status_code: int,
+        headers,
+        html: Union[str, bytes]
+    ) -> Optional[Dict[str, Optional[str]]]:
+        # 변경 없음: 캐시 엔트리 재사용 후 신선도 갱신
+        if status_code == 304 and cached:
+            self.cache.touch(url)
+            return self._item_from_entry(cached)
+        if status_code != 200:
+            # 원본 사이트 오류(5xx 등) 시 오래된 캐시라도 사용
+            return self._item_from_entry(cached) if cached else None
+
+        item = self._parse_html(url, html)
+        if item and self.cache is not None:
+            self.cache.put({
+                "url": url,
+                "title": item["title"],
+                "original": item["original"],
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "fetched_at": time.time()
+            })
+        return item
+
+    def _handle_fetched(
+        self,
+        url: str,
+        cached: Optional[ArticleEntry],
+        response: Union[requests.Response, httpx.Response]
+    ) -> Optional[Dict[str, Optional[str]]]:
+        return self._handle_response(url, cached, response.status_code, response.headers, _response_html(response))
+
+    def _crawl_one(self, url: str) -> Dict[str, Optional[str]]:
+        if self.cache is None:
+            try:
+                article = Article(url, request_timeout=self.fetch_timeout)
+                article.download()
+                article.parse()
+                return self._build_item(url, article)
+            except:
+                return None
+
+        cached = self.cache.get(url)
+        if cached and self.cache.is_fresh(cached):
+            return self._item_from_entry(cached)
+        try:
+            response = requests.get(url, headers=self._request_headers(cached), timeout=self.fetch_timeout)
+            return self._handle_fetched(url, cached, response)
+        except Exception:
+            # 원본 사이트 오류 / 파싱·캐시 저장 오류 시 오래된 캐시라도 사용
+            return self._item_from_entry(cached) if cached else None
+
+    # ------------------------------------------------------------------
+    # async 모드: 커넥션 풀 + 동시성 제한 + deadline
+    # ------------------------------------------------------------------
+    def _get_state(self) -> _LoopState:
+        """현재 이벤트 루프에 묶인 클라이언트/세마포어를 반환합니다 (루프가 바뀌면 새로 생성)."""
+        loop = asyncio.get_running_loop()
+        if self._state is None or self._state.loop is not loop:
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.fetch_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                headers={"User-Agent": self.user_agent},
+                follow_redirects=True
+            )
+            self._state = _LoopState(loop, client, self.max_concurrency, self.per_host_concurrency)
+        return self._state
+
+    async def _fetch(self, state: _LoopState, url: str, headers: Dict[str, str]) -> Optional[httpx.Response]:
+        host = urlparse(url).hostname or ""
+        async with state.global_limit, state.host_limit(host):
+            try:
+                # 응답 대기/본문 수신 전체에 대한 hard deadline
+                return await asyncio.wait_for(state.client.get(url, headers=headers), timeout=self.fetch_timeout)
+            except Exception:
+                # 타임아웃/HTTP 오류뿐 아니라 잘못된 URL, 호스트명 인코딩, SSL 오류도 해당 기사만 건너뜀
+                return None
+
+    async def _crawl_one_async(self, state: _LoopState, url: str) -> Optional[Dict[str, Optional[str]]]:
+        cached = None
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get, url)
+            if cached and self.cache.is_fresh(cached):
+                return self._item_from_entry(cached)
+
+        response = await self._fetch(state, url, self._request_headers(cached))
+        if response is None:
+            return self._item_from_entry(cached) if cached else None
+
+        loop = asyncio.get_running_loop()
+        try:
+            # 본문 디코딩과 파싱 모두 파싱 워커 풀에서 수행 (이벤트 루프를 막지 않음)
+            return await loop.run_in_executor(self._parse_pool, self._handle_fetched, url, cached, response)
+        except Exception:
+            return self._item_from_entry(cached) if cached else None
+
+    async def stream_urls(self, urls: List[str]) -> AsyncIterator[Dict[str, Optional[str]]]:
+        if self.mode == "async":
+            state = self._get_state()
+            tasks = [asyncio.ensure_future(self._crawl_one_async(state, url)) for url in urls]
+        else:
+            loop = asyncio.get_running_loop()
+            tasks = [loop.run_in_executor(self._fetch_pool, self._crawl_one, url) for url in urls]
+
+        try:
+            # 가장 느린 사이트를 기다리지 않고 끝나는 순서대로 전달
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result is not None:
+                    yield result
+        finally:
+            # 소비자가 중간에 멈춘 경우 남은 작업을 취소하고 정리될 때까지 대기
+            # (executor 모드에서 이미 스레드가 실행 중인 다운로드는 취소되지 않고 백그라운드로 끝남)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def crawl_urls(self, urls: List[str]) -> List[Dict[str, Optional[str]]]:
-        loop = asyncio.get_event_loop()
-        tasks = [loop.run_in_executor(None, self._crawl_one, url) for url in urls]
+        """검색 결과(입력 URL) 순서를 유지해 반환합니다. 완료 순서가 필요하면 stream_urls 사용."""
+        if self.mode == "async":
+            state = self._get_state()
+            results = await asyncio.gather(*(self._crawl_one_async(state, url) for url in urls))
+            return [res for res in results if res is not None]
+
+        loop = asyncio.get_running_loop()
+        tasks = [loop.run_in_executor(self._fetch_pool, self._crawl_one, url) for url in urls]
         results = await asyncio.gather(*tasks)
-        return [res for res in results if res is not None]
\ No newline at end of file
+        return [res for res in results if res is not None]
+
+    async def crawl_with_budget(
+        self,
+        urls: List[str],
+        max_items: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        완료되는 순서대로(입력 순서 아님) 기사를 모으다가 max_items 개가 모이거나 time_budget(초)이 지나면
+        즉시 중단하고 남은 다운로드를 취소합니다. (둘 다 None 이면 crawl_urls 와 동일)
+        executor 모드는 아직 시작하지 않은 다운로드만 취소되며, 이미 스레드에서 실행 중인 다운로드
+        (최대 max_concurrency 개)는 fetch_timeout 안에서 끝날 때까지 백그라운드로 진행됩니다.
+        """
+        if not max_items and not time_budget:
+            return await self.crawl_urls(urls)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + time_budget if time_budget else None
+        items: List[Dict[str, Optional[str]]] = []
+        stream = self.stream_urls(urls)
+        try:
+            while not max_items or len(items) < max_items:
+                remaining = deadline - loop.time() if deadline else None
+                if remaining is not None and remaining <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(stream.__anext__(), timeout=remaining))
+                except (StopAsyncIteration, asyncio.TimeoutError):
+                    break
+        finally:
+            # 스트림 종료 시 stream_urls 의 finally 에서 남은 작업이 취소됨
+            await stream.aclose()
+
+        print(f"  [Crawler] 예산 내 수집 완료: {len(items)}개 / 요청 URL {len(urls)}개")
+        return items
+
+    async def aclose(self):
+        """커넥션 풀 정리 (현재 루프에 묶인 클라이언트만 닫을 수 있음)"""
+        if self._state is not None:
+            await self._state.client.aclose()
+            self._state = None
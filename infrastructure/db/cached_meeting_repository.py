@@ -0,0 +1,153 @@
+# app/infrastructure/db/cached_meeting_repository.py
+import json
+import uuid
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from domain.interfaces.repository import IMeetingRepository
+from infrastructure.cache.kv_cache import KeyValueCache
+from infrastructure.cache.invalidation import CacheInvalidator
+
+KEY_PREFIX = "meeting_cache:"
+MISSING = "null"  # 부정 캐시 값 (존재하지 않거나 권한 없는 회의록)
+
+
+# 워커도 같은 키를 무효화하므로 키 형식은 모듈 함수로 공유
+def meeting_detail_key(meeting_id: int) -> str:
+    # 상세 캐시의 버전 토큰 키: 지우면 이전 버전으로 저장된 상세 캐시는 더 이상 조회되지 않음
+    return f"{KEY_PREFIX}detail_version:{meeting_id}"
+
+def meeting_missing_key(meeting_id: int, user_id: int) -> str:
+    return f"{KEY_PREFIX}missing:{meeting_id}:{user_id}"
+
+def meeting_list_version_key(user_id: Optional[int] = None) -> str:
+    # user_id 가 None 이면 전체 목록 epoch (소유자를 모르는 삭제 시 갱신)
+    return f"{KEY_PREFIX}list_version:{user_id if user_id is not None else 'all'}"
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=lambda v: v.isoformat())
+
+def _restore_dates(row: Dict[str, Any]) -> Dict[str, Any]:
+    if isinstance(row.get("created_dt"), str):
+        row["created_dt"] = datetime.fromisoformat(row["created_dt"])
+    return row
+
+
+class CachedMeetingRepository(IMeetingRepository):
+    """
+    IMeetingRepository read-through 캐시 데코레이터.
+    - 상세(get_by_id): 회의록별 버전 토큰을 키에 포함해 캐시하고, 조회 시 user_id 로 소유자를 확인
+      (무효화 전에 DB 를 읽은 요청이 늦게 저장해도 이전 버전 키에 쓰이므로 다시 조회되지 않음)
+    - 목록(get_page_by_user): 사용자별 버전 토큰을 키에 포함해 생성/삭제 시 버전만 바꿔 무효화
+    - 부정 캐시: 없는 회의록 조회 결과를 negative_ttl 초 동안 캐시
+    - delete / clear_news_items / save 시 명시적으로 무효화 (워커의 뉴스 저장은 invalidator 로 전달됨)
+    캐시 오류는 조회 실패로 간주하고 원본 저장소를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        inner: IMeetingRepository,
+        cache: KeyValueCache,
+        invalidator: Optional[CacheInvalidator] = None,
+        negative_ttl: int = 30
+    ):
+        self.inner = inner
+        self.cache = cache
+        self.invalidator = invalidator or CacheInvalidator(cache)
+        self.negative_ttl = negative_ttl
+
+    # ------------------------------------------------------------------
+    # 캐시 접근 (동기 캐시 클라이언트는 스레드에서 실행)
+    # ------------------------------------------------------------------
+    async def _cache_get(self, key: str) -> Optional[str]:
+        try:
+            return await asyncio.to_thread(self.cache.get, key)
+        except Exception as e:
+            print(f"[Meeting Cache Error] 조회 실패: {e}")
+            return None
+
+    async def _cache_set(self, key: str, value: str, ttl: Optional[int] = None):
+        try:
+            await asyncio.to_thread(self.cache.set, key, value, ttl)
+        except Exception as e:
+            print(f"[Meeting Cache Error] 저장 실패: {e}")
+
+    async def _invalidate(self, *keys: str):
+        try:
+            await asyncio.to_thread(self.invalidator.invalidate, keys)
+        except Exception as e:
+            print(f"[Meeting Cache Error] 무효화 실패: {e}")
+
+    async def _list_version(self, user_id: Optional[int]) -> str:
+        return await self._version(meeting_list_version_key(user_id))
+
+    async def _version(self, key: str) -> str:
+        version = await self._cache_get(key)
+        if version is None:
+            # 무효화(키 삭제) 이후 첫 조회 시 새 토큰 발급 → 이전 페이지 캐시와 충돌하지 않음
+            version = uuid.uuid4().hex[:12]
+            await self._cache_set(key, version)
+        return version
+
+    # ------------------------------------------------------------------
+    # IMeetingRepository
+    # ------------------------------------------------------------------
+    async def save(self, meeting_data: Dict[str, Any]) -> int:
+        meeting_id = await self.inner.save(meeting_data)
+        user_id = meeting_data["user_id"]
+        await self._invalidate(meeting_list_version_key(user_id), meeting_missing_key(meeting_id, user_id))
+        return meeting_id
+
+    async def get_by_id(self, meeting_id: int, user_id: int) -> Optional[Dict[str, Any]]:
+        # 버전은 DB 조회 전에 읽어야, 그 사이 무효화되면 아래 저장이 버려진 버전 키로 감
+        detail_key = f"{KEY_PREFIX}detail:{meeting_id}:{await self._version(meeting_detail_key(meeting_id))}"
+        cached = await self._cache_get(detail_key)
+        if cached is not None:
+            meeting = _restore_dates(json.loads(cached))
+            return meeting if meeting.get("user_id") == user_id else None
+        if await self._cache_get(meeting_missing_key(meeting_id, user_id)) == MISSING:
+            return None
+
+        meeting = await self.inner.get_by_id(meeting_id, user_id)
+        if meeting is None:
+            await self._cache_set(meeting_missing_key(meeting_id, user_id), MISSING, self.negative_ttl)
+            return None
+        # 뉴스 분석이 끝나기 전에는 워커 저장 직후 바로 보이도록 캐시하지 않음
+        if meeting.get("news_items"):
+            await self._cache_set(detail_key, _dumps(meeting))
+        return meeting
+
+    async def get_news_items(self, meeting_id: int) -> List[Dict[str, Any]]:
+        return await self.inner.get_news_items(meeting_id)
+
+    async def get_page_by_user(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        versions = f"{await self._list_version(None)}:{await self._list_version(user_id)}"
+        cursor = f"{after[0].isoformat()}_{after[1]}" if after else "first"
+        key = f"{KEY_PREFIX}list:{user_id}:{versions}:{cursor}:{limit}"
+
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return [_restore_dates(row) for row in json.loads(cached)]
+
+        rows = await self.inner.get_page_by_user(user_id, limit, after)
+        await self._cache_set(key, _dumps(rows))
+        return rows
+
+    async def delete(self, meeting_id: int) -> None:
+        await self.inner.delete(meeting_id)
+        await self._invalidate(meeting_detail_key(meeting_id), meeting_list_version_key(None))
+
+    async def set_news_task_id(self, meeting_id: int, task_id: str) -> None:
+        await self.inner.set_news_task_id(meeting_id, task_id)
+        await self._invalidate(meeting_detail_key(meeting_id))
+
+    async def clear_news_items(self, meeting_id: int, user_id: int) -> None:
+        await self.inner.clear_news_items(meeting_id, user_id)
+        await self._invalidate(meeting_detail_key(meeting_id))
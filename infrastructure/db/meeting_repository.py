@@ -1,7 +1,8 @@
 # app/infrastructure/db/meeting_repository.py
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 import json
 
 from domain.interfaces.repository import IMeetingRepository
@@ -37,7 +38,12 @@ class MySQLMeetingRepository(IMeetingRepository):
         return result.lastrowid
 
     async def get_by_id(self, meeting_id: int, user_id: int) -> Optional[Dict[str, Any]]:
-        query = text('SELECT * FROM meetings WHERE user_id = :user_id AND id = :id')
+        # 상세 화면에 필요한 컬럼만 조회 (뉴스 원문은 meeting_news_bodies 에 있어 읽지 않음)
+        query = text('''
+            SELECT id, user_id, title, created_dt, original_meeting, summary_meeting, keywords, news_task_id
+            FROM meetings
+            WHERE user_id = :user_id AND id = :id
+        ''')
         result = await self.session.execute(query, {"user_id": user_id, "id": meeting_id})
         row = result.fetchone()
         
@@ -47,19 +53,41 @@ class MySQLMeetingRepository(IMeetingRepository):
             # JSON 필드 파싱 (DB에서 문자열로 왔을 경우)
             if isinstance(data.get('keywords'), str):
                 data['keywords'] = json.loads(data['keywords'])
-            if isinstance(data.get('news_items'), str):
-                data['news_items'] = json.loads(data['news_items'])
+            data['news_items'] = await self.get_news_items(meeting_id)
             return data
         return None
 
-    async def get_all_by_user(self, user_id: int) -> List[Dict[str, Any]]:
+    async def get_news_items(self, meeting_id: int) -> List[Dict[str, Any]]:
         query = text('''
-            SELECT id, title, created_dt 
+            SELECT url, title, summary, score, preview
+            FROM meeting_news_items
+            WHERE meeting_id = :meeting_id
+            ORDER BY rank_no
+        ''')
+        result = await self.session.execute(query, {"meeting_id": meeting_id})
+        return [row._asdict() for row in result.fetchall()]
+
+    async def get_page_by_user(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        # idx_meetings_user_created (user_id, created_dt [, id]) 인덱스 범위 스캔으로 filesort 없이 limit 개만 읽음
+        params = {"user_id": user_id, "limit": limit}
+        keyset = ""
+        if after is not None:
+            keyset = "AND (created_dt < :created_dt OR (created_dt = :created_dt AND id < :id))"
+            params["created_dt"], params["id"] = after
+
+        query = text(f'''
+            SELECT id, title, created_dt
             FROM meetings
-            WHERE user_id = :user_id
-            ORDER BY created_dt DESC
+            WHERE user_id = :user_id {keyset}
+            ORDER BY created_dt DESC, id DESC
+            LIMIT :limit
         ''')
-        result = await self.session.execute(query, {"user_id": user_id})
+        result = await self.session.execute(query, params)
         rows = result.fetchall()
         return [row._asdict() for row in rows]
 
@@ -68,7 +96,17 @@ class MySQLMeetingRepository(IMeetingRepository):
         await self.session.execute(query, {"id": meeting_id})
         await self.session.commit()
 
+    async def set_news_task_id(self, meeting_id: int, task_id: str) -> None:
+        query = text('UPDATE meetings SET news_task_id = :task_id WHERE id = :id')
+        await self.session.execute(query, {"task_id": task_id, "id": meeting_id})
+        await self.session.commit()
+
     async def clear_news_items(self, meeting_id: int, user_id: int) -> None:
-        query = text('UPDATE meetings SET news_items = NULL WHERE id = :id AND user_id = :user_id')
+        # 원문(meeting_news_bodies)은 FK ON DELETE CASCADE 로 함께 삭제됨
+        query = text('''
+            DELETE n FROM meeting_news_items n
+            JOIN meetings m ON m.id = n.meeting_id
+            WHERE m.id = :id AND m.user_id = :user_id
+        ''')
         await self.session.execute(query, {"id": meeting_id, "user_id": user_id})
         await self.session.commit()
\ No newline at end of file
@@ -0,0 +1,36 @@
+# app/infrastructure/db/news_codec.py
+from typing import Any, Union
+
+import msgpack
+import zstandard
+
+# 저장 포맷 버전 (첫 바이트)
+# - 0x01 : zstd(msgpack(value))
+# - 그 외 : 버전 바이트 도입 이전 데이터 (UTF-8 텍스트) 로 간주
+FORMAT_ZSTD_MSGPACK = 0x01
+CURRENT_FORMAT = FORMAT_ZSTD_MSGPACK
+
+ZSTD_LEVEL = 3
+
+# ZstdCompressor/Decompressor 는 스레드 간 공유할 수 없으므로 호출마다 생성 (생성 비용은 작음)
+
+
+def encode_payload(value: Any) -> bytes:
+    """값을 현재 포맷(버전 바이트 + zstd 압축 msgpack)으로 인코딩합니다."""
+    packed = msgpack.packb(value, use_bin_type=True)
+    return bytes([CURRENT_FORMAT]) + zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(packed)
+
+
+def is_encoded(raw: Union[bytes, str, None]) -> bool:
+    return isinstance(raw, (bytes, bytearray, memoryview)) and len(raw) > 0 and raw[0] == FORMAT_ZSTD_MSGPACK
+
+
+def decode_payload(raw: Union[bytes, str, None]) -> Any:
+    """encode_payload 결과를 디코딩합니다. 버전 바이트가 없는 기존 데이터는 UTF-8 텍스트 그대로 반환합니다."""
+    if raw is None:
+        return None
+    if is_encoded(raw):
+        packed = zstandard.ZstdDecompressor().decompress(bytes(raw[1:]))
+        return msgpack.unpackb(packed, raw=False)
+
+    return bytes(raw).decode("utf-8") if not isinstance(raw, str) else raw
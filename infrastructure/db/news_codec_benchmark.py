@@ -0,0 +1,120 @@
+"""
+뉴스 저장 포맷 비교: JSON(UTF-8) vs news_codec(버전 바이트 + zstd 압축 msgpack)
+
+사용 예:
+    # DB 의 최근 원문으로 측정
+    python -m infrastructure.db.news_codec_benchmark --samples 200
+    # DB 없이 파일로 측정 (sbert_parity 와 같은 samples.json 형식)
+    python -m infrastructure.db.news_codec_benchmark --file samples.json
+    # 압축되지 않은 기존 원문 행을 현재 포맷으로 변환
+    python -m infrastructure.db.news_codec_benchmark --recompress
+"""
+import os
+import json
+import time
+import argparse
+import statistics
+from typing import Any, Dict, List
+
+from dotenv import load_dotenv
+
+from infrastructure.db.sync_pool import PyMySQLPool, parse_db_conn
+from infrastructure.db.news_codec import FORMAT_ZSTD_MSGPACK, encode_payload, decode_payload
+
+
+def _median_ms(fn, values: List[Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for value in values:
+            fn(value)
+        timings.append((time.perf_counter() - started) * 1000 / len(values))
+    return round(statistics.median(timings), 4)
+
+
+def compare_formats(payloads: List[Any], repeat: int = 5) -> Dict[str, Any]:
+    """각 값을 두 포맷으로 인코딩해 평균 크기와 값당 디코딩 시간(ms)을 비교합니다."""
+    as_json = [json.dumps(value, ensure_ascii=False).encode("utf-8") for value in payloads]
+    as_codec = [encode_payload(value) for value in payloads]
+
+    json_bytes = sum(map(len, as_json)) / len(payloads)
+    codec_bytes = sum(map(len, as_codec)) / len(payloads)
+    return {
+        "samples": len(payloads),
+        "json_avg_bytes": round(json_bytes),
+        "codec_avg_bytes": round(codec_bytes),
+        "compression_ratio": round(json_bytes / codec_bytes, 2) if codec_bytes else None,
+        "json_decode_ms": _median_ms(lambda raw: json.loads(raw), as_json, repeat),
+        "codec_decode_ms": _median_ms(decode_payload, as_codec, repeat),
+        "codec_encode_ms": _median_ms(encode_payload, payloads, repeat),
+    }
+
+
+def load_db_samples(pool: PyMySQLPool, samples: int) -> List[Any]:
+    """회의록별 뉴스 목록(원문 포함)을 복원해 저장 단위 샘플로 사용합니다."""
+    with pool.connection() as conn, conn.cursor() as cursor:
+        cursor.execute('''
+            SELECT n.meeting_id, n.url, n.title, n.summary, n.score, b.original
+            FROM meeting_news_items n
+            JOIN meeting_news_bodies b ON b.meeting_id = n.meeting_id AND b.rank_no = n.rank_no
+            WHERE n.meeting_id IN (
+                SELECT meeting_id FROM (
+                    SELECT DISTINCT meeting_id FROM meeting_news_items ORDER BY meeting_id DESC LIMIT %s
+                ) AS recent
+            )
+            ORDER BY n.meeting_id, n.rank_no
+        ''', (samples,))
+        grouped: Dict[int, List[Dict[str, Any]]] = {}
+        for row in cursor.fetchall():
+            row["original"] = decode_payload(row["original"])
+            grouped.setdefault(row.pop("meeting_id"), []).append(row)
+    return list(grouped.values())
+
+
+def recompress_bodies(pool: PyMySQLPool, batch_size: int = 500) -> int:
+    """버전 바이트가 없는(이전 포맷) 원문 행을 현재 포맷으로 다시 저장합니다."""
+    converted = 0
+    while True:
+        with pool.connection() as conn, conn.cursor() as cursor:
+            cursor.execute('''
+                SELECT meeting_id, rank_no, original FROM meeting_news_bodies
+                WHERE original IS NOT NULL AND ASCII(original) <> %s
+                LIMIT %s
+            ''', (FORMAT_ZSTD_MSGPACK, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                return converted
+            cursor.executemany(
+                "UPDATE meeting_news_bodies SET original = %s WHERE meeting_id = %s AND rank_no = %s",
+                [(encode_payload(decode_payload(row["original"])), row["meeting_id"], row["rank_no"]) for row in rows]
+            )
+            conn.commit()
+        converted += len(rows)
+        print(f"[Recompress] {converted}행 변환")
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="뉴스 저장 포맷(JSON vs zstd+msgpack) 벤치마크")
+    parser.add_argument("--file", help="samples.json 경로 (지정 시 DB 대신 파일의 news_items 사용)")
+    parser.add_argument("--samples", type=int, default=200, help="DB 에서 읽을 최근 회의록 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--recompress", action="store_true", help="기존 원문 행을 현재 포맷으로 변환")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            payloads = [sample["news_items"] for sample in json.load(f)]
+        print(json.dumps(compare_formats(payloads, args.repeat), ensure_ascii=False, indent=2))
+    else:
+        pool = PyMySQLPool(parse_db_conn(os.environ["DB_CONN"]), max_size=1)
+        try:
+            if args.recompress:
+                print(f"[Recompress] 완료: {recompress_bodies(pool)}행")
+            else:
+                payloads = load_db_samples(pool, args.samples)
+                if not payloads:
+                    raise SystemExit("저장된 추천 뉴스가 없습니다.")
+                print(json.dumps(compare_formats(payloads, args.repeat), ensure_ascii=False, indent=2))
+        finally:
+            pool.close()
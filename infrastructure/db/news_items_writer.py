@@ -0,0 +1,368 @@
+# app/infrastructure/db/news_items_writer.py
+import os
+import time
+import sqlite3
+import itertools
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pymysql
+
+from infrastructure.db.sync_pool import PyMySQLPool
+from infrastructure.db.news_codec import encode_payload, decode_payload
+
+# 상세 화면에 표시하는 본문 앞부분 길이 (meeting_news_items.preview)
+NEWS_PREVIEW_CHARS = 400
+
+# meeting_id -> (seq, encode_payload(news_items))
+PendingWrites = Dict[int, Tuple[int, bytes]]
+
+# 재시도하면 성공할 수 있는 오류 (연결 끊김/락 대기 초과, 풀 대기 초과)
+# 그 밖의 오류(DataError, ProgrammingError 등)는 같은 데이터로 다시 시도해도 실패하므로 재시도하지 않음
+TRANSIENT_DB_ERRORS = (pymysql.OperationalError, pymysql.InterfaceError, TimeoutError)
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _SpoolFile:
+    """
+    아직 DB 에 반영되지 않은 쓰기를 보관하는 로컬 SQLite 파일.
+    워커가 재시작되거나 DB 가 잠시 내려가 있어도 결과를 잃지 않도록, flush 에 성공한 뒤에만 지웁니다.
+
+    prefork 자식들이 같은 파일을 공유하므로 행마다 소유 프로세스(owner = pid)를 기록하고,
+    각 프로세스는 자기 행만 읽고 지웁니다. 종료된 프로세스의 행은 시작 시 claim_orphans() 로
+    한 프로세스만 가져가며, 이미 더 새로운 값이 반영됐거나 대기 중인 회의록의 행은 버립니다.
+    """
+
+    # 반영 완료 seq 기록 보관 기간 (seq 는 ms 단위 시각)
+    FLUSHED_RETENTION_MS = 7 * 24 * 3600 * 1000
+
+    def __init__(self, path: str, owner: int):
+        self.owner = owner
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS pending_news_writes (
+                owner INTEGER NOT NULL,
+                meeting_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (owner, meeting_id)
+            )
+        ''')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS flushed_news_writes (
+                meeting_id INTEGER PRIMARY KEY,
+                seq INTEGER NOT NULL
+            )
+        ''')
+        self._conn.commit()
+
+    def put(self, meeting_id: int, seq: int, payload: bytes):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pending_news_writes(owner, meeting_id, seq, payload) VALUES (?, ?, ?, ?)",
+                (self.owner, meeting_id, seq, payload)
+            )
+            self._conn.commit()
+
+    def remove(self, flushed: PendingWrites):
+        # 그 사이 같은 회의록에 더 새로운 쓰기가 들어왔다면(seq 가 다르면) 남겨 둠
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM pending_news_writes WHERE owner = ? AND meeting_id = ? AND seq = ?",
+                [(self.owner, meeting_id, seq) for meeting_id, (seq, _) in flushed.items()]
+            )
+            self._conn.executemany(
+                "INSERT INTO flushed_news_writes(meeting_id, seq) VALUES (?, ?) "
+                "ON CONFLICT(meeting_id) DO UPDATE SET seq = MAX(seq, excluded.seq)",
+                [(meeting_id, seq) for meeting_id, (seq, _) in flushed.items()]
+            )
+            self._conn.commit()
+
+    def claim_orphans(self) -> PendingWrites:
+        """종료된 프로세스가 남긴 행을 이 프로세스 소유로 옮긴 뒤, 이 프로세스의 미반영 쓰기를 반환합니다."""
+        with self._lock:
+            owners = [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT owner FROM pending_news_writes WHERE owner != ?", (self.owner,)
+            )]
+            for dead in (owner for owner in owners if not _pid_alive(owner)):
+                # BEGIN IMMEDIATE 로 쓰기 잠금을 먼저 잡아, 같은 행을 두 프로세스가 가져가지 않도록 함
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.execute('''
+                        DELETE FROM pending_news_writes AS p
+                        WHERE p.owner = ? AND (
+                            p.seq <= COALESCE((SELECT f.seq FROM flushed_news_writes f WHERE f.meeting_id = p.meeting_id), -1)
+                            OR EXISTS (SELECT 1 FROM pending_news_writes q WHERE q.meeting_id = p.meeting_id AND q.seq > p.seq)
+                        )
+                    ''', (dead,))
+                    self._conn.execute(
+                        "UPDATE OR REPLACE pending_news_writes SET owner = ? WHERE owner = ?", (self.owner, dead)
+                    )
+                    self._conn.commit()
+                except Exception:
+                    self._conn.rollback()
+                    raise
+
+            self._conn.execute(
+                "DELETE FROM flushed_news_writes WHERE seq < ?",
+                (int(time.time() * 1000) - self.FLUSHED_RETENTION_MS,)
+            )
+            self._conn.commit()
+            rows = self._conn.execute(
+                "SELECT meeting_id, seq, payload FROM pending_news_writes WHERE owner = ?", (self.owner,)
+            ).fetchall()
+        return {meeting_id: (seq, payload) for meeting_id, seq, payload in rows}
+
+
+class NewsItemsWriter:
+    """
+    파이프라인 결과(news_items)를 meeting_news_items(목록/요약) 와 meeting_news_bodies(원문, 압축) 에 기록합니다.
+
+    write_behind=False : write() 호출 시 바로 반영 (일시적 오류는 max_retries 회 재시도)
+    write_behind=True  : 메모리에 모아 두었다가(같은 회의록은 마지막 값만 유지) flush_interval 초마다
+                         또는 flush_size 건이 쌓이면 한 트랜잭션의 다중 행 INSERT 로 반영합니다.
+                         실패하면 지수 백오프로 재시도합니다.
+                         spool_path 를 지정해야 반영 전까지 로컬 파일에도 보관되어 재시작 후 복구되며,
+                         지정하지 않으면 미반영 쓰기는 메모리에만 있어 프로세스가 종료되면 유실됩니다.
+
+    연결 오류(TRANSIENT_DB_ERRORS)만 재시도합니다. 그 밖의 오류로 배치가 실패하면 회의록 단위로 나눠
+    다시 반영하고, 그래도 실패하는 회의록의 쓰기는 버린 뒤 on_dropped 로 알립니다.
+    """
+
+    def __init__(
+        self,
+        pool: PyMySQLPool,
+        write_behind: bool = False,
+        flush_interval: float = 0.5,
+        flush_size: int = 20,
+        spool_path: Optional[str] = None,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        on_written: Optional[Callable[[List[int]], None]] = None,
+        on_dropped: Optional[Callable[[List[int]], None]] = None
+    ):
+        self.pool = pool
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.spool_path = spool_path
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.on_written = on_written  # DB 반영 직후 호출 (예: 조회 캐시 무효화)
+        self.on_dropped = on_dropped  # write-behind 에서 반영할 수 없어 버린 쓰기 (예: 실패 이벤트 발행)
+
+        self._spool: Optional[_SpoolFile] = None
+        self._pending: PendingWrites = {}
+        self._seq = itertools.count(int(time.time() * 1000))
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._failures = 0
+
+    # ------------------------------------------------------------------
+    # 수명 주기 (워커 프로세스 시작/종료 시그널에서 호출)
+    # ------------------------------------------------------------------
+    def start(self):
+        if not self.write_behind or (self._flusher and self._flusher.is_alive()):
+            return
+        if self.spool_path:
+            # 워커 프로세스(prefork 자식)마다 start() 를 호출하므로 pid 를 소유자로 사용
+            self._spool = _SpoolFile(self.spool_path, owner=os.getpid())
+            recovered = self._spool.claim_orphans()
+            if recovered:
+                print(f"[DB Writer] 미반영 쓰기 {len(recovered)}건 복구")
+            with self._lock:
+                self._pending = {**recovered, **self._pending}
+        else:
+            print("[DB Writer] spool 미설정: 미반영 쓰기는 메모리에만 보관됩니다 (프로세스 종료 시 유실)")
+
+        self._stopped.clear()
+        self._flusher = threading.Thread(target=self._run, name="news-items-writer", daemon=True)
+        self._flusher.start()
+
+    def close(self, timeout: float = 10.0):
+        """flusher 를 멈추고 남은 쓰기를 한 번 더 반영합니다 (실패분은 spool 에 남음)."""
+        if self._flusher is None:
+            return
+        self._stopped.set()
+        self._wake.set()
+        self._flusher.join(timeout)
+        self._flusher = None
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def write(self, meeting_id: int, news_items: List[Dict]) -> bool:
+        # 메모리/spool 에는 압축된 형태로 보관
+        payload = encode_payload(news_items)
+        if not self.write_behind:
+            return self._write_with_retry({meeting_id: (0, payload)})
+
+        if self._flusher is None:
+            self.start()
+        seq = next(self._seq)
+        if self._spool is not None:
+            self._spool.put(meeting_id, seq, payload)
+        with self._lock:
+            self._pending[meeting_id] = (seq, payload)
+            if len(self._pending) >= self.flush_size:
+                self._wake.set()
+        return True
+
+    def _write_with_retry(self, batch: PendingWrites) -> bool:
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._update_many(batch)
+                return True
+            except TRANSIENT_DB_ERRORS as e:
+                if attempt == self.max_retries:
+                    print(f"[DB Writer Error] 재시도 {self.max_retries}회 후 저장 실패: {e}")
+                    return False
+                time.sleep(min(self.max_backoff, self.retry_backoff * 2 ** attempt))
+            except Exception as e:
+                print(f"[DB Writer Error] 저장 실패 (재시도하지 않음): {e}")
+                return False
+
+    def _update_many(self, batch: PendingWrites):
+        """
+        여러 회의록의 추천 뉴스를 한 트랜잭션에서 교체합니다.
+        meeting_news_items / meeting_news_bodies 에 각각 다중 행 INSERT 한 번씩 실행합니다.
+        """
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                # 그 사이 삭제된 회의록은 건너뜀 (FK 오류로 배치 전체가 실패하지 않도록)
+                ids = list(batch)
+                placeholders = ", ".join("%s" for _ in ids)
+                cursor.execute(f"SELECT id FROM meetings WHERE id IN ({placeholders}) FOR UPDATE", ids)
+                existing = {row["id"] for row in cursor.fetchall()}
+                if existing:
+                    placeholders = ", ".join("%s" for _ in existing)
+                    cursor.execute(
+                        f"DELETE FROM meeting_news_items WHERE meeting_id IN ({placeholders})",
+                        list(existing)
+                    )
+
+                item_rows, body_rows = [], []
+                for meeting_id in existing:
+                    news_items = decode_payload(batch[meeting_id][1])
+                    for rank_no, item in enumerate(item for item in news_items if item and item.get("url")):
+                        original = item.get("original") or ""
+                        item_rows.append((
+                            meeting_id, rank_no, item["url"], item.get("title"),
+                            item.get("summary"), item.get("score"), original[:NEWS_PREVIEW_CHARS]
+                        ))
+                        body_rows.append((meeting_id, rank_no, encode_payload(original)))
+
+                if item_rows:
+                    cursor.executemany(
+                        "INSERT INTO meeting_news_items (meeting_id, rank_no, url, title, summary, score, preview) "
+                        "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                        item_rows
+                    )
+                    cursor.executemany(
+                        "INSERT INTO meeting_news_bodies (meeting_id, rank_no, original) VALUES (%s, %s, %s)",
+                        body_rows
+                    )
+            conn.commit()
+
+        if self.on_written and existing:
+            try:
+                self.on_written(list(existing))
+            except Exception as e:
+                print(f"[DB Writer Error] 저장 후 처리 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # write-behind flush
+    # ------------------------------------------------------------------
+    def flush(self) -> bool:
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return True
+
+        try:
+            self._update_many(batch)
+        except TRANSIENT_DB_ERRORS as e:
+            self._requeue(batch)
+            print(f"[DB Writer Error] {len(batch)}건 반영 실패 ({self._failures}회 연속): {e}")
+            return False
+        except Exception as e:
+            print(f"[DB Writer Error] {len(batch)}건 반영 실패, 회의록 단위로 나눠 다시 반영: {e}")
+            return self._flush_each(batch)
+
+        self._failures = 0
+        if self._spool is not None:
+            self._spool.remove(batch)
+        print(f"[DB Writer] news_items {len(batch)}건 반영")
+        return True
+
+    def _flush_each(self, batch: PendingWrites) -> bool:
+        """회의록별로 반영합니다. 반영할 수 없는 회의록은 버리고, 연결 오류가 나면 나머지는 다음 주기로 넘깁니다."""
+        done: PendingWrites = {}
+        retry: PendingWrites = {}
+        dropped: List[int] = []
+        for meeting_id, entry in batch.items():
+            if retry:
+                retry[meeting_id] = entry
+                continue
+            try:
+                self._update_many({meeting_id: entry})
+            except TRANSIENT_DB_ERRORS as e:
+                print(f"[DB Writer Error] 반영 중 연결 오류, 남은 {len(batch) - len(done)}건은 다음 주기에 재시도: {e}")
+                retry[meeting_id] = entry
+                continue
+            except Exception as e:
+                print(f"[DB Writer Error] meeting_id={meeting_id} 반영 불가, 쓰기를 버림: {e}")
+                dropped.append(meeting_id)
+            done[meeting_id] = entry
+
+        if self._spool is not None and done:
+            self._spool.remove(done)
+        if retry:
+            self._requeue(retry)
+        else:
+            self._failures = 0
+        print(f"[DB Writer] news_items {len(done) - len(dropped)}건 반영, {len(dropped)}건 버림")
+
+        if self.on_dropped and dropped:
+            try:
+                self.on_dropped(dropped)
+            except Exception as e:
+                print(f"[DB Writer Error] 버린 쓰기 처리 실패: {e}")
+        return not retry and not dropped
+
+    def _requeue(self, batch: PendingWrites):
+        # 다음 주기에 다시 시도 (그 사이 들어온 더 새로운 값은 덮어쓰지 않음)
+        with self._lock:
+            for meeting_id, entry in batch.items():
+                self._pending.setdefault(meeting_id, entry)
+        self._failures += 1
+
+    def _run(self):
+        while not self._stopped.is_set():
+            # 연속 실패 시 지수 백오프, 평소에는 flush_interval 또는 flush_size 도달 시 깨어남
+            wait = self.flush_interval if not self._failures else min(
+                self.max_backoff, self.retry_backoff * 2 ** (self._failures - 1)
+            )
+            self._wake.wait(wait)
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            self.flush()
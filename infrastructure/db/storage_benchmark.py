@@ -0,0 +1,112 @@
+"""
+회의록 상세 조회: 기존 레이아웃(meetings.news_items JSON) vs 분리 레이아웃(meeting_news_items) 비교.
+migrations/002 적용 후, 기존 news_items 컬럼을 제거하기 전에 실행합니다.
+
+사용 예:
+    python -m infrastructure.db.storage_benchmark --samples 50 --repeat 5
+"""
+import os
+import json
+import time
+import argparse
+import statistics
+from typing import Any, Callable, Dict, List
+
+from dotenv import load_dotenv
+
+from infrastructure.db.sync_pool import PyMySQLPool, parse_db_conn
+
+LEGACY_DETAIL_SQL = "SELECT * FROM meetings WHERE id = %s"
+SPLIT_DETAIL_SQL = (
+    "SELECT id, user_id, title, created_dt, original_meeting, summary_meeting, keywords "
+    "FROM meetings WHERE id = %s"
+)
+SPLIT_NEWS_SQL = (
+    "SELECT url, title, summary, score, preview FROM meeting_news_items "
+    "WHERE meeting_id = %s ORDER BY rank_no"
+)
+
+
+def _payload_bytes(rows: List[Dict[str, Any]]) -> int:
+    """클라이언트로 전송된 값의 대략적인 크기 (문자열/바이트 컬럼 합)"""
+    return sum(
+        len(value.encode("utf-8") if isinstance(value, str) else value)
+        for row in rows for value in row.values() if isinstance(value, (str, bytes))
+    )
+
+
+def _read_legacy(cursor, meeting_id: int) -> int:
+    cursor.execute(LEGACY_DETAIL_SQL, (meeting_id,))
+    rows = cursor.fetchall()
+    for row in rows:
+        if isinstance(row.get("news_items"), str):
+            json.loads(row["news_items"])
+    return _payload_bytes(rows)
+
+
+def _read_split(cursor, meeting_id: int) -> int:
+    cursor.execute(SPLIT_DETAIL_SQL, (meeting_id,))
+    rows = cursor.fetchall()
+    cursor.execute(SPLIT_NEWS_SQL, (meeting_id,))
+    return _payload_bytes(rows) + _payload_bytes(cursor.fetchall())
+
+
+def run_benchmark(pool: PyMySQLPool, samples: int = 50, repeat: int = 5) -> Dict[str, Any]:
+    readers: Dict[str, Callable] = {"legacy": _read_legacy, "split": _read_split}
+    report: Dict[str, Any] = {}
+
+    with pool.connection() as conn, conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT id FROM meetings WHERE news_items IS NOT NULL ORDER BY id DESC LIMIT %s", (samples,)
+        )
+        meeting_ids = [row["id"] for row in cursor.fetchall()]
+        if not meeting_ids:
+            raise SystemExit("news_items 가 있는 회의록이 없습니다.")
+
+        # 저장 크기: 회의록당 뉴스 데이터 바이트 수
+        placeholders = ", ".join("%s" for _ in meeting_ids)
+        cursor.execute(
+            f"SELECT AVG(LENGTH(news_items)) AS avg_bytes FROM meetings WHERE id IN ({placeholders})",
+            meeting_ids
+        )
+        legacy_row_bytes = float(cursor.fetchone()["avg_bytes"] or 0)
+        cursor.execute(f'''
+            SELECT
+                SUM(LENGTH(url) + IFNULL(LENGTH(title), 0) + IFNULL(LENGTH(summary), 0)
+                    + IFNULL(LENGTH(preview), 0)) / COUNT(DISTINCT meeting_id) AS hot_bytes
+            FROM meeting_news_items WHERE meeting_id IN ({placeholders})
+        ''', meeting_ids)
+        split_hot_bytes = float(cursor.fetchone()["hot_bytes"] or 0)
+
+        report["meetings"] = len(meeting_ids)
+        report["legacy_news_bytes_per_meeting"] = round(legacy_row_bytes)
+        report["split_hot_bytes_per_meeting"] = round(split_hot_bytes)
+
+        for name, read in readers.items():
+            latencies, transferred = [], 0
+            for _ in range(repeat):
+                for meeting_id in meeting_ids:
+                    started = time.perf_counter()
+                    transferred = read(cursor, meeting_id)
+                    latencies.append((time.perf_counter() - started) * 1000)
+            latencies.sort()
+            report[name] = {
+                "p50_ms": round(statistics.median(latencies), 3),
+                "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 3),
+                "last_payload_bytes": transferred,
+            }
+    return report
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="회의록 상세 조회 저장 레이아웃 벤치마크")
+    parser.add_argument("--samples", type=int, default=50, help="측정할 최근 회의록 수")
+    parser.add_argument("--repeat", type=int, default=5, help="회의록당 반복 조회 횟수")
+    args = parser.parse_args()
+
+    pool = PyMySQLPool(parse_db_conn(os.environ["DB_CONN"]), max_size=1)
+    try:
+        print(json.dumps(run_benchmark(pool, args.samples, args.repeat), ensure_ascii=False, indent=2))
+    finally:
+        pool.close()
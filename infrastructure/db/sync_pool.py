@@ -0,0 +1,125 @@
+# app/infrastructure/db/sync_pool.py
+import os
+import time
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import pymysql
+
+
+def parse_db_conn(db_url: str) -> Dict[str, Any]:
+    """SQLAlchemy 용 DB_CONN(mysql+aiomysql://...) 을 pymysql.connect 인자로 변환합니다."""
+    conn_str = db_url
+    if conn_str.startswith("mysql+aiomysql://"):
+        conn_str = "mysql://" + conn_str[len("mysql+aiomysql://"):]
+
+    parsed = urlparse(conn_str)
+    return {
+        "host": parsed.hostname,
+        "port": parsed.port or 3306,
+        "user": parsed.username,
+        "password": parsed.password,
+        "database": parsed.path.lstrip('/'),
+        "charset": 'utf8mb4',
+        "cursorclass": pymysql.cursors.DictCursor
+    }
+
+
+class PyMySQLPool:
+    """
+    Celery 워커용 동기 pymysql 커넥션 풀.
+    - max_size 개까지만 연결을 만들고, 모두 사용 중이면 acquire_timeout 동안 대기합니다.
+    - health_check_interval 초 이상 놀고 있던 연결은 꺼낼 때 ping 으로 확인하고 끊겼으면 재연결합니다.
+    - fork 이후(prefork 자식)에는 부모의 소켓을 공유하지 않도록 PID 가 바뀌면 풀을 비웁니다.
+    """
+
+    def __init__(
+        self,
+        conn_params: Dict[str, Any],
+        max_size: int = 4,
+        acquire_timeout: float = 10.0,
+        health_check_interval: float = 30.0,
+        connect_timeout: float = 5.0
+    ):
+        self.conn_params = {**conn_params, "connect_timeout": connect_timeout, "autocommit": False}
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()  # (conn, last_used)
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._pid = os.getpid()
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            # 부모 프로세스의 연결은 닫지 않고 버림 (close 시 부모 세션까지 끊김)
+            self._idle = queue.LifoQueue()
+            self._slots = threading.BoundedSemaphore(self.max_size)
+            self._pid = os.getpid()
+
+    def open(self, min_size: int = 1):
+        """워커 시작 시 min_size 개의 연결을 미리 만들어 둡니다 (실패해도 이후 요청 시 재시도)."""
+        self._check_pid()
+        for _ in range(min(min_size, self.max_size) - self._idle.qsize()):
+            try:
+                self._idle.put((pymysql.connect(**self.conn_params), time.monotonic()))
+            except pymysql.MySQLError as e:
+                print(f"[DB Pool] 초기 연결 실패: {e}")
+                break
+
+    def _checkout(self) -> pymysql.connections.Connection:
+        try:
+            conn, last_used = self._idle.get_nowait()
+        except queue.Empty:
+            return pymysql.connect(**self.conn_params)
+
+        if time.monotonic() - last_used >= self.health_check_interval:
+            try:
+                conn.ping(reconnect=True)
+            except pymysql.MySQLError:
+                self._discard(conn)
+                return pymysql.connect(**self.conn_params)
+        return conn
+
+    @staticmethod
+    def _discard(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def connection(self) -> Iterator[pymysql.connections.Connection]:
+        """연결을 빌려주고, 예외 없이 끝나면 풀에 반환합니다 (예외 시 rollback 후 폐기)."""
+        self._check_pid()
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"DB 커넥션 풀 대기 시간 초과 ({self.acquire_timeout}s)")
+
+        conn: Optional[pymysql.connections.Connection] = None
+        try:
+            conn = self._checkout()
+            yield conn
+        except BaseException:
+            if conn is not None:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                self._discard(conn)
+                conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._idle.put((conn, time.monotonic()))
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
@@ -0,0 +1,138 @@
+import json
+import asyncio
+import hashlib
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from domain.interfaces.llm import ILLMClient
+from infrastructure.cache.kv_cache import KeyValueCache
+
+
+# =========================================================
+# ILLMClient 캐시 데코레이터
+# =========================================================
+class CachedLLMClient(ILLMClient):
+    """
+    임의의 ILLMClient 를 감싸 동일 입력에 대한 API 호출을 생략합니다.
+    - 키: (model_name, prompt_version, 요청 종류, 내용 해시)
+    - single-flight: 같은 키의 요청이 동시에 들어오면 한 번만 호출하고 결과를 공유
+    - 실패한 호출은 캐시하지 않습니다.
+    """
+
+    KEY_PREFIX = "llm_cache:"
+
+    def __init__(
+        self,
+        inner: ILLMClient,
+        cache: KeyValueCache,
+        model_name: Optional[str] = None,
+        prompt_version: Optional[str] = None
+    ):
+        self.inner = inner
+        self.cache = cache
+        self.model_name = model_name or getattr(inner, "model_name", type(inner).__name__)
+        self.prompt_version = prompt_version or getattr(inner, "prompt_version", "v1")
+
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        # 히트율 지표
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # 진행 중인 동일 요청에 합류한 횟수
+
+    def _make_key(self, kind: str, content: str) -> str:
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}{self.model_name}:{self.prompt_version}:{kind}:{digest}"
+
+    async def _cache_get(self, key: str) -> Optional[str]:
+        try:
+            return await asyncio.to_thread(self.cache.get, key)
+        except Exception as e:
+            print(f"[LLM Cache Error] 조회 실패: {e}")
+            return None
+
+    async def _cache_set(self, key: str, value: str):
+        try:
+            await asyncio.to_thread(self.cache.set, key, value)
+        except Exception as e:
+            print(f"[LLM Cache Error] 저장 실패: {e}")
+
+    async def _get_or_call(self, key: str, call: Callable[[], Awaitable[str]]) -> str:
+        """캐시 조회 → (진행 중인 동일 요청 합류) → 실제 호출 후 저장. 값은 JSON 문자열."""
+        cached = await self._cache_get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        while True:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None or in_flight.get_loop() is not asyncio.get_running_loop():
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                # 선행 요청이 취소(타임아웃 등)된 경우는 미스로 보고 다시 시도, 자신이 취소된 경우만 전파
+                if not in_flight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await call()
+            future.set_result(value)
+            await self._cache_set(key, value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 합류한 요청이 없으면 "exception was never retrieved" 경고가 나지 않도록 소비
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+    async def generate_meeting_summary(self, content: str) -> Tuple[str, List[str]]:
+        async def call() -> str:
+            summary, keywords = await self.inner.generate_meeting_summary(content)
+            return json.dumps([summary, keywords], ensure_ascii=False)
+
+        summary, keywords = json.loads(await self._get_or_call(self._make_key("meeting", content), call))
+        return summary, keywords
+
+    async def generate_news_summary(self, news_content: str) -> str:
+        async def call() -> str:
+            return json.dumps(await self.inner.generate_news_summary(news_content), ensure_ascii=False)
+
+        return json.loads(await self._get_or_call(self._make_key("news", news_content), call))
+
+    async def generate_news_summaries(self, news_contents: List[str]) -> List[Optional[str]]:
+        keys = [self._make_key("news", content) for content in news_contents]
+        cached = await asyncio.gather(*(self._cache_get(key) for key in keys))
+
+        summaries: List[Optional[str]] = [json.loads(value) if value is not None else None for value in cached]
+        missing = [i for i, summary in enumerate(summaries) if summary is None]
+        self.hits += len(news_contents) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            fresh = await self.inner.generate_news_summaries([news_contents[i] for i in missing])
+            for i, summary in zip(missing, fresh):
+                summaries[i] = summary
+                if summary:
+                    await self._cache_set(keys[i], json.dumps(summary, ensure_ascii=False))
+        return summaries
+
+    def split_news_batches(self, news_contents: List[str]) -> List[List[int]]:
+        return self.inner.split_news_batches(news_contents)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
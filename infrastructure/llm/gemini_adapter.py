@@ -1,4 +1,4 @@
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
 from google import genai
 import os
 import json
@@ -6,9 +6,18 @@ from domain.interfaces.llm import ILLMClient
 from domain.models import processes_schemas # 기존 스키마 재사용
 
 class GeminiLLMAdapter(ILLMClient):
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, batch_token_budget: int = 30000):
         self.client = genai.Client(api_key=api_key)
         self.model_name = 'gemini-2.5-flash-lite'
+        # 프롬프트 문구를 바꾸면 올려서 기존 LLM 응답 캐시가 재사용되지 않도록 함
+        self.prompt_version = 'v1'
+        # 배치 요약 1회 요청에 담을 입력 토큰 상한 (초과 시 여러 요청으로 분할)
+        self.batch_token_budget = batch_token_budget
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        # 한국어는 대략 글자 1개 ≈ 토큰 1개이므로 글자 수를 보수적인 추정치로 사용
+        return len(text) + 1
 
     async def generate_meeting_summary(self, content: str) -> Tuple[str, List[str]]:
         prompt = f"회의록: {content}"
@@ -42,6 +51,54 @@ class GeminiLLMAdapter(ILLMClient):
             data = processes_schemas.SummaryNewsByLLM.model_validate_json(response.text)
             return data.summary
         except Exception as e:
+            # 재시도/대체 문구 처리는 호출 측(NewsSummaryService)에서 수행
             print(f"[Gemini Error] News Summary Failed: {e}")
-            return "요약 실패"
-    
\ No newline at end of file
+            raise
+
+    def split_news_batches(self, news_contents: List[str]) -> List[List[int]]:
+        return self._split_by_budget(news_contents)
+
+    def _split_by_budget(self, news_contents: List[str]) -> List[List[int]]:
+        """입력 토큰 추정치가 예산을 넘지 않도록 인덱스 그룹으로 분할합니다."""
+        groups: List[List[int]] = []
+        current: List[int] = []
+        used = 0
+        for index, content in enumerate(news_contents):
+            tokens = self._estimate_tokens(content)
+            if current and used + tokens > self.batch_token_budget:
+                groups.append(current)
+                current, used = [], 0
+            current.append(index)
+            used += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    async def generate_news_summaries(self, news_contents: List[str]) -> List[Optional[str]]:
+        # 요청 1회만 보냄: 예산 분할(split_news_batches)과 누락분 개별 요약/재시도는
+        # 레이트 리밋·동시성 제한을 거치도록 호출 측(NewsSummaryService)에서 수행
+        articles = "\n\n".join(f"[{i}] {content}" for i, content in enumerate(news_contents))
+        prompt = (
+            f"다음 {len(news_contents)}개의 뉴스를 각각 한국어로 3~4문장으로 요약해줘. "
+            f"각 요약에는 뉴스 앞의 번호를 index 로 함께 적어줘.\n\n{articles}"
+        )
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config={
+                    "response_mime_type": "application/json",
+                    # 중첩 스키마($defs)는 dict 스키마로 넘기면 해석되지 않으므로 모델 클래스를 그대로 전달
+                    "response_schema": processes_schemas.SummaryNewsListByLLM,
+                },
+            )
+            data = processes_schemas.SummaryNewsListByLLM.model_validate_json(response.text)
+        except Exception as e:
+            print(f"[Gemini Error] Batch News Summary Failed ({len(news_contents)}건): {e}")
+            raise
+
+        summaries: List[Optional[str]] = [None] * len(news_contents)
+        for item in data.summaries:
+            if 0 <= item.index < len(news_contents) and item.summary:
+                summaries[item.index] = item.summary
+        return summaries
@@ -0,0 +1,116 @@
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+# 뉴스 분석 파이프라인 진행 이벤트
+# {"meeting_id", "step", "ts", ...단계별 데이터(count, message)}
+# step: queued(API) -> started -> searched -> crawled -> ranked -> summarized -> saved | failed
+STEP_ORDER = ("queued", "started", "searched", "crawled", "ranked", "summarized", "saved", "failed")
+TERMINAL_STEPS = ("saved", "failed")
+
+CHANNEL_PREFIX = "meeting_progress:"
+SNAPSHOT_PREFIX = "meeting_progress_last:"
+STEPS_PREFIX = "meeting_progress_steps:"  # 실행 1회의 단계별 도달 시각 (hash: step -> ts)
+
+
+def progress_channel(meeting_id: int) -> str:
+    return f"{CHANNEL_PREFIX}{meeting_id}"
+
+def progress_snapshot_key(meeting_id: int) -> str:
+    return f"{SNAPSHOT_PREFIX}{meeting_id}"
+
+def progress_steps_key(meeting_id: int) -> str:
+    return f"{STEPS_PREFIX}{meeting_id}"
+
+
+def _queue_event(pipe, meeting_id: int, step: str, ttl: int, data: Dict[str, Any]):
+    """snapshot 저장 + 단계 시각 기록 + 발행을 파이프라인에 추가합니다 (동기/비동기 Redis 공용)."""
+    ts = time.time()
+    event = json.dumps({"meeting_id": meeting_id, "step": step, "ts": ts, **data}, ensure_ascii=False)
+    pipe.set(progress_snapshot_key(meeting_id), event, ex=ttl)
+    pipe.hset(progress_steps_key(meeting_id), step, ts)
+    pipe.expire(progress_steps_key(meeting_id), ttl)
+    pipe.publish(progress_channel(meeting_id), event)
+
+
+class PipelineProgressPublisher:
+    """
+    Celery 워커에서 단계별 진행 이벤트를 Redis pub/sub 으로 발행합니다.
+    늦게 접속한 클라이언트를 위해 마지막 이벤트를 snapshot_ttl 초 동안 함께 저장합니다.
+    발행 실패는 파이프라인을 멈추지 않도록 로그만 남깁니다.
+    """
+
+    def __init__(self, redis_url: str, snapshot_ttl: int = 3600):
+        import redis
+        self.redis = redis.Redis.from_url(redis_url)
+        self.snapshot_ttl = snapshot_ttl
+
+    def publish(self, meeting_id: int, step: str, **data: Any):
+        try:
+            pipe = self.redis.pipeline()
+            _queue_event(pipe, meeting_id, step, self.snapshot_ttl, data)
+            pipe.execute()
+        except Exception as e:
+            print(f"  [Progress Error] 진행 이벤트 발행 실패 (meeting_id={meeting_id}, step={step}): {e}")
+
+
+class PipelineProgressSubscriber:
+    """
+    API 서버에서 회의록 하나의 진행 이벤트를 구독합니다 (redis.asyncio).
+    events() 는 이벤트 dict 를, keepalive 초 동안 이벤트가 없으면 None 을 yield 하고
+    완료/실패 이벤트를 전달한 뒤 종료합니다.
+    상태 API 를 위해 마지막 이벤트 / 단계별 도달 시각 조회와, 작업 등록 시점의 queued 기록도 제공합니다.
+    """
+
+    def __init__(self, redis_url: str, keepalive: float = 15.0, snapshot_ttl: int = 3600):
+        import redis.asyncio as aioredis
+        self.redis = aioredis.Redis.from_url(redis_url)
+        self.keepalive = keepalive
+        self.snapshot_ttl = snapshot_ttl
+
+    async def mark_queued(self, meeting_id: int, **data: Any):
+        """새 실행을 등록할 때 호출: 이전 실행의 단계 기록을 지우고 queued 이벤트를 남깁니다."""
+        pipe = self.redis.pipeline()
+        pipe.delete(progress_steps_key(meeting_id))
+        _queue_event(pipe, meeting_id, "queued", self.snapshot_ttl, data)
+        await pipe.execute()
+
+    async def latest(self, meeting_id: int) -> Optional[Dict[str, Any]]:
+        snapshot = await self.redis.get(progress_snapshot_key(meeting_id))
+        return json.loads(snapshot) if snapshot is not None else None
+
+    async def step_times(self, meeting_id: int) -> Dict[str, float]:
+        """{step: 도달 시각} 을 STEP_ORDER 순서로 반환합니다."""
+        raw = await self.redis.hgetall(progress_steps_key(meeting_id))
+        times = {key.decode("utf-8"): float(value) for key, value in raw.items()}
+        return {step: times[step] for step in STEP_ORDER if step in times}
+
+    async def events(self, meeting_id: int, since: float = 0.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        # 구독을 먼저 시작한 뒤 snapshot 을 읽어야 그 사이에 발행된 이벤트를 놓치지 않음
+        await pubsub.subscribe(progress_channel(meeting_id))
+        try:
+            snapshot = await self.redis.get(progress_snapshot_key(meeting_id))
+            if snapshot is not None:
+                event = json.loads(snapshot)
+                # 페이지 렌더링(또는 재시도 요청) 이전 실행의 이벤트는 무시
+                if event["ts"] >= since:
+                    yield event
+                    if event["step"] in TERMINAL_STEPS:
+                        return
+
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=self.keepalive)
+                if message is None:
+                    yield None
+                    continue
+                event = json.loads(message["data"])
+                yield event
+                if event["step"] in TERMINAL_STEPS:
+                    return
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    async def aclose(self):
+        await self.redis.aclose()
@@ -0,0 +1,83 @@
+import json
+import asyncio
+import hashlib
+from typing import AsyncIterator, Dict, List, Optional
+
+from domain.interfaces.search import ISearchClient
+from infrastructure.cache.kv_cache import KeyValueCache
+
+
+def normalize_keywords(keywords: List[str]) -> List[str]:
+    """대소문자/공백 차이와 순서, 중복을 무시하도록 키워드 집합을 정규화합니다."""
+    return sorted({keyword.strip().casefold() for keyword in keywords if keyword and keyword.strip()})
+
+
+class CachedSearchClient(ISearchClient):
+    """
+    ISearchClient 검색 결과 캐시 데코레이터.
+    키는 (정규화된 키워드 집합, count) 이며, 같은 주제의 회의가 연달아 들어오면
+    TTL 동안은 검색 API 를 호출하지 않아 쿼터를 아낍니다. (빈 결과는 캐시하지 않음)
+    """
+
+    KEY_PREFIX = "search_cache:"
+
+    def __init__(self, inner: ISearchClient, cache: KeyValueCache):
+        self.inner = inner
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+
+    def _make_key(self, keywords: List[str], count: int) -> str:
+        payload = json.dumps([normalize_keywords(keywords), count], ensure_ascii=False)
+        return self.KEY_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _cache_get(self, key: str) -> Optional[List[str]]:
+        try:
+            cached = await asyncio.to_thread(self.cache.get, key)
+        except Exception as e:
+            print(f"[Search Cache Error] 조회 실패: {e}")
+            return None
+        return json.loads(cached) if cached is not None else None
+
+    async def _cache_set(self, key: str, urls: List[str]):
+        if not urls:
+            return
+        try:
+            await asyncio.to_thread(self.cache.set, key, json.dumps(urls, ensure_ascii=False))
+        except Exception as e:
+            print(f"[Search Cache Error] 저장 실패: {e}")
+
+    async def search_urls(self, keywords: List[str], count: int = 50) -> List[str]:
+        key = self._make_key(keywords, count)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        urls = await self.inner.search_urls(keywords, count)
+        await self._cache_set(key, urls)
+        return urls
+
+    async def stream_urls(self, keywords: List[str], count: int = 50) -> AsyncIterator[List[str]]:
+        key = self._make_key(keywords, count)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            self.hits += 1
+            yield cached
+            return
+
+        self.misses += 1
+        urls: List[str] = []
+        async for batch in self.inner.stream_urls(keywords, count):
+            urls.extend(batch)
+            yield batch
+        await self._cache_set(key, urls)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,48 +1,177 @@
-from typing import List
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+import math
 import httpx
 import asyncio
 from domain.interfaces.search import ISearchClient
 
+NEWS_PER_REQUEST = 10
+MAX_START_INDEX = 91  # Custom Search API 는 최대 100개 결과(start ≤ 91)까지만 제공
+
 class GoogleSearchAdapter(ISearchClient):
-    def __init__(self, json_api_key: str, engine_id: str):
+    """
+    Google Custom Search 어댑터.
+    하나의 httpx.AsyncClient(HTTP/2 + keep-alive 커넥션 풀)를 재사용하며,
+    startup()/aclose() 로 수명 주기를 관리합니다.
+    transport / api_url 을 바꾸면 로컬 stub 서버나 httpx.MockTransport 로 벤치마크할 수 있습니다.
+
+    pagination="fixed"    : count // 10 페이지를 한 번에 요청 (기존 방식)
+    pagination="adaptive" : 1페이지 응답의 totalResults 와 중복 비율을 보고 추가 페이지 수를 결정
+    """
+
+    def __init__(
+        self,
+        json_api_key: str,
+        engine_id: str,
+        api_url: str = "https://www.googleapis.com/customsearch/v1",
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        http2: bool = True,
+        timeout: float = 30.0,
+        max_connections: int = 10,
+        pagination: str = "fixed",
+        max_duplicate_ratio: float = 0.5
+    ):
+        if pagination not in ("fixed", "adaptive"):
+            raise ValueError(f"지원하지 않는 pagination 모드입니다: {pagination}")
+
         self.api_key = json_api_key
         self.engine_id = engine_id
-        self.api_url = "https://www.googleapis.com/customsearch/v1"
+        self.api_url = api_url
+        self.transport = transport
+        self.http2 = http2
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.pagination = pagination
+        self.max_duplicate_ratio = max_duplicate_ratio  # 1페이지 중복 비율이 이 이상이면 추가 페이지 생략
 
-    async def search_urls(self, keywords: List[str], count: int = 50) -> List[str]:
-        if not self.api_key or not self.engine_id:
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop = None
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+    async def startup(self):
+        """현재 이벤트 루프에 커넥션 풀을 생성합니다 (이미 있으면 재사용)."""
+        self._get_client()
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # httpx 클라이언트는 생성된 이벤트 루프에 묶이므로 루프가 바뀐 경우에만 새로 생성
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                http2=self.http2 and self.transport is None,
+                transport=self.transport
+            )
+            self._client_loop = loop
+        return self._client
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def _build_query(self, keywords: List[str]) -> str:
+        return " ".join(keywords) + " news -filetype:pdf"
+
+    async def _fetch_page(self, client: httpx.AsyncClient, query: str, start_index: int) -> Optional[Dict]:
+        params = {
+            "key": self.api_key,
+            "cx": self.engine_id,
+            "q": query,
+            "num": NEWS_PER_REQUEST,
+            "start": start_index,
+            "sort": "date"
+        }
+        try:
+            res = await client.get(self.api_url, params=params)
+            if res.status_code == 200:
+                return res.json()
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _page_links(data: Optional[Dict]) -> List[str]:
+        if not data:
             return []
-        
-        query = " ".join(keywords) + " news -filetype:pdf"
-        news_per_request = 10
-        num_requests = count // news_per_request
-        
-        tasks = []
-        timeout = httpx.Timeout(30.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            for i in range(num_requests):
-                start_index = 1 + i * news_per_request
-                params = {
-                    "key": self.api_key,
-                    "cx": self.engine_id,
-                    "q": query,
-                    "num": news_per_request,
-                    "start": start_index,
-                    "sort": "date"
-                }
-                tasks.append(client.get(self.api_url, params=params))
-            
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-        urls = set()
-        for res in responses:
-            if isinstance(res, httpx.Response) and res.status_code == 200:
-                try:
-                    items = res.json().get('items', [])
-                    for item in items:
-                        urls.add(item['link'])
-                except:
-                    pass
-                    
-        return list(urls)
\ No newline at end of file
+        return [item['link'] for item in data.get('items', []) if item.get('link')]
+
+    @staticmethod
+    def _duplicate_ratio(links: List[str]) -> float:
+        """같은 기사(호스트 + 경로 기준)가 차지하는 비율"""
+        if not links:
+            return 0.0
+        canonical = {
+            (urlparse(link).hostname or "", urlparse(link).path.rstrip("/"))
+            for link in links
+        }
+        return 1 - len(canonical) / len(links)
+
+    def _plan_extra_pages(self, first_page: Optional[Dict], num_requests: int) -> int:
+        """1페이지 응답을 보고 추가로 요청할 페이지 수를 결정합니다."""
+        links = self._page_links(first_page)
+        if len(links) < NEWS_PER_REQUEST:
+            return 0  # 결과가 1페이지에서 끝남
+
+        try:
+            total_results = int(first_page.get('searchInformation', {}).get('totalResults', 0))
+        except (TypeError, ValueError):
+            total_results = 0
+        available_pages = min(math.ceil(total_results / NEWS_PER_REQUEST), MAX_START_INDEX // NEWS_PER_REQUEST + 1)
+
+        if self._duplicate_ratio(links) >= self.max_duplicate_ratio:
+            return 0  # 같은 기사 반복 → 다음 페이지도 쿼터 낭비일 가능성이 큼
+        return max(0, min(num_requests, available_pages) - 1)
+
+    async def stream_urls(self, keywords: List[str], count: int = 50) -> AsyncIterator[List[str]]:
+        if not self.api_key or not self.engine_id:
+            return
+
+        query = self._build_query(keywords)
+        num_requests = count // NEWS_PER_REQUEST
+        client = self._get_client()
+        seen = set()
+
+        def fresh(links: List[str]) -> List[str]:
+            new_links = [link for link in links if link not in seen]
+            seen.update(new_links)
+            return new_links
+
+        if self.pagination == "fixed":
+            pages = await asyncio.gather(*(
+                self._fetch_page(client, query, 1 + i * NEWS_PER_REQUEST) for i in range(num_requests)
+            ))
+            urls = fresh([link for page in pages for link in self._page_links(page)])
+            if urls:
+                yield urls
+            return
+
+        # adaptive: 1페이지를 먼저 받아 바로 전달하고, 필요한 만큼만 추가 요청
+        first_page = await self._fetch_page(client, query, 1)
+        first_urls = fresh(self._page_links(first_page))
+        if first_urls:
+            yield first_urls
+
+        extra_pages = self._plan_extra_pages(first_page, num_requests)
+        if extra_pages:
+            pages = await asyncio.gather(*(
+                self._fetch_page(client, query, 1 + i * NEWS_PER_REQUEST) for i in range(1, extra_pages + 1)
+            ))
+            urls = fresh([link for page in pages for link in self._page_links(page)])
+            if urls:
+                yield urls
+
+    async def search_urls(self, keywords: List[str], count: int = 50) -> List[str]:
+        urls: List[str] = []
+        async for batch in self.stream_urls(keywords, count):
+            urls.extend(batch)
+        return urls
@@ -11,6 +11,8 @@ from dotenv import load_dotenv
 # [NEW] 모듈 임포트 경로
 from core.database import Database
 from api.routers import meetings, user
+from api.dependencies import get_meeting_cache_invalidator, get_progress_subscriber
+from infrastructure.cache.kv_cache import InMemoryKeyValueCache
 from utils import middleware, exc_handler 
 
 load_dotenv()
@@ -19,8 +21,16 @@ load_dotenv()
 async def lifespan(app: FastAPI):
     db = Database.get_instance()
     db.connect()
+    # 프로세스 내부 캐시는 다른 프로세스(워커/다른 API 워커)의 무효화 메시지를 구독해야 함
+    meeting_cache_invalidator = get_meeting_cache_invalidator()
+    if meeting_cache_invalidator and isinstance(meeting_cache_invalidator.cache, InMemoryKeyValueCache):
+        meeting_cache_invalidator.listen()
+    progress_subscriber = get_progress_subscriber()
 
     yield
+    if meeting_cache_invalidator:
+        meeting_cache_invalidator.close()
+    await progress_subscriber.aclose()
     await db.close()
 
 app = FastAPI(lifespan=lifespan)
@@ -0,0 +1,10 @@
+-- 회의록 목록(keyset pagination) 조회용 복합 인덱스
+-- WHERE user_id = ? ORDER BY created_dt DESC, id DESC LIMIT ? 를 인덱스 범위 스캔으로 처리 (filesort 제거)
+-- InnoDB 보조 인덱스에는 PK(id)가 자동으로 포함되므로 (user_id, created_dt) 만으로 (created_dt, id) 커서 정렬을 지원합니다.
+use meetings_db;
+
+CREATE INDEX idx_meetings_user_created ON meetings (user_id, created_dt);
+
+-- 확인: key = idx_meetings_user_created, Extra 에 "Using filesort" 가 없어야 함
+-- EXPLAIN SELECT id, title, created_dt FROM meetings
+-- WHERE user_id = 1 ORDER BY created_dt DESC, id DESC LIMIT 21;
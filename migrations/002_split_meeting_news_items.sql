@@ -0,0 +1,51 @@
+-- meetings.news_items(JSON, 기사 원문 포함)를 별도 테이블로 분리
+-- 상세 조회는 meeting_news_items 의 짧은 컬럼만 읽고, 원문은 meeting_news_bodies 에 보관합니다.
+-- 워커 저장 경로가 새 테이블을 사용하므로 배포 전에 적용합니다. (JSON_TABLE: MySQL 8.0+)
+use meetings_db;
+
+CREATE TABLE meeting_news_items (
+    meeting_id BIGINT NOT NULL,
+    rank_no SMALLINT NOT NULL,
+    url VARCHAR(2048) NOT NULL,
+    title TEXT DEFAULT NULL,
+    summary TEXT DEFAULT NULL,
+    score FLOAT DEFAULT NULL,
+    preview VARCHAR(400) DEFAULT NULL,
+    PRIMARY KEY (meeting_id, rank_no),
+    FOREIGN KEY (meeting_id) REFERENCES meetings(id) ON DELETE CASCADE
+);
+
+CREATE TABLE meeting_news_bodies (
+    meeting_id BIGINT NOT NULL,
+    rank_no SMALLINT NOT NULL,
+    original MEDIUMTEXT DEFAULT NULL,
+    PRIMARY KEY (meeting_id, rank_no),
+    FOREIGN KEY (meeting_id, rank_no) REFERENCES meeting_news_items(meeting_id, rank_no) ON DELETE CASCADE
+);
+
+-- 기존 JSON 데이터 이관 (url 이 없는 항목은 화면에도 표시되지 않으므로 제외)
+INSERT INTO meeting_news_items (meeting_id, rank_no, url, title, summary, score, preview)
+SELECT m.id, jt.rank_no - 1, jt.url, jt.title, jt.summary, jt.score, LEFT(jt.original, 400)
+FROM meetings m,
+     JSON_TABLE(m.news_items, '$[*]' COLUMNS (
+         rank_no FOR ORDINALITY,
+         url VARCHAR(2048) PATH '$.url',
+         title TEXT PATH '$.title',
+         summary TEXT PATH '$.summary',
+         score FLOAT PATH '$.score',
+         original MEDIUMTEXT PATH '$.original'
+     )) AS jt
+WHERE m.news_items IS NOT NULL AND jt.url IS NOT NULL;
+
+INSERT INTO meeting_news_bodies (meeting_id, rank_no, original)
+SELECT m.id, jt.rank_no - 1, jt.original
+FROM meetings m,
+     JSON_TABLE(m.news_items, '$[*]' COLUMNS (
+         rank_no FOR ORDINALITY,
+         url VARCHAR(2048) PATH '$.url',
+         original MEDIUMTEXT PATH '$.original'
+     )) AS jt
+WHERE m.news_items IS NOT NULL AND jt.url IS NOT NULL;
+
+-- 이관 결과 확인 후 기존 컬럼 제거 (롤백이 필요 없을 때 실행)
+-- ALTER TABLE meetings DROP COLUMN news_items;
@@ -0,0 +1,7 @@
+-- meeting_news_bodies.original 을 압축 포맷(news_codec: 버전 바이트 + zstd 압축 msgpack)을 담을 수 있도록 BLOB 으로 변경
+-- 기존 행은 UTF-8 바이트 그대로 보존되며, 버전 바이트가 없으므로 디코더가 이전 데이터(텍스트)로 읽습니다.
+-- 새로 저장되는 행부터 압축되며, 기존 행까지 압축하려면 다음을 실행합니다:
+--   python -m infrastructure.db.news_codec_benchmark --recompress
+use meetings_db;
+
+ALTER TABLE meeting_news_bodies MODIFY original MEDIUMBLOB DEFAULT NULL;
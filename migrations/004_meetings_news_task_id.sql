@@ -0,0 +1,4 @@
+-- 회의록별 마지막 뉴스 분석 Celery 작업 ID (상태 조회 API / 중복 재시도 방지용)
+use meetings_db;
+
+ALTER TABLE meetings ADD COLUMN news_task_id VARCHAR(64) DEFAULT NULL;
@@ -1,20 +1,80 @@
 # app/services/meeting_service.py
-from typing import List, Optional
+import time
+import uuid
+import asyncio
+from typing import Any, Dict, List, Optional
 from fastapi import HTTPException, status
 
 from domain.interfaces.repository import IMeetingRepository
 from domain.interfaces.llm import ILLMClient
+from utils.pagination import encode_cursor, decode_cursor
 
 class MeetingService:
     def __init__(
         self, 
         repository: IMeetingRepository, 
         llm_client: ILLMClient,
-        celery_task = None  # 순환 참조 방지를 위해 런타임에 주입하거나 래퍼 사용
+        celery_task = None,  # 순환 참조 방지를 위해 런타임에 주입하거나 래퍼 사용
+        page_size: int = 20,
+        progress = None,  # PipelineProgressSubscriber (단계별 진행 기록 조회)
+        stale_after: float = 900.0,  # 이 시간(초) 동안 진행 이벤트가 없으면 멈춘 작업으로 간주
+        pipeline_lock = None  # MeetingPipelineLock (워커와 공유하는 회의록별 파이프라인 락)
     ):
         self.repository = repository
         self.llm_client = llm_client
         self.celery_task = celery_task
+        self.page_size = page_size
+        self.progress = progress
+        self.stale_after = stale_after
+        self.pipeline_lock = pipeline_lock
+
+    async def _acquire_pipeline_lock(self, meeting_id: int, task_id: str) -> bool:
+        """회의록 락을 새 작업 ID 로 잡습니다 (원자적 SET NX). 락 저장소 오류 시에는 막지 않습니다."""
+        if not self.pipeline_lock:
+            return True
+        try:
+            return await asyncio.to_thread(self.pipeline_lock.acquire, meeting_id, task_id)
+        except Exception as e:
+            print(f"파이프라인 락 획득 실패: {e}")
+            return True
+
+    async def _release_pipeline_lock(self, meeting_id: int, task_id: str):
+        if not self.pipeline_lock:
+            return
+        try:
+            await asyncio.to_thread(self.pipeline_lock.release, meeting_id, task_id)
+        except Exception as e:
+            print(f"파이프라인 락 해제 실패: {e}")
+
+    async def _enqueue_news_task(
+        self,
+        meeting_id: int,
+        user_id: int,
+        summary: str,
+        keywords: List[str],
+        task_id: Optional[str] = None
+    ) -> str:
+        """
+        뉴스 분석 작업을 등록하고 작업 ID 를 회의록에 저장합니다.
+        빠른 워커가 발행한 started 이후 이벤트를 지우지 않도록, 작업 ID 를 먼저 정해 queued 를 기록한 뒤 등록합니다.
+        """
+        task_id = task_id or str(uuid.uuid4())
+        if self.progress:
+            try:
+                await self.progress.mark_queued(meeting_id, task_id=task_id)
+            except Exception as e:
+                print(f"진행 상태 기록 실패: {e}")
+        self.celery_task.apply_async(
+            kwargs={
+                "meeting_id": meeting_id,
+                "user_id": user_id,
+                "summary_meeting": summary,
+                "keyword_meeting_list": keywords
+            },
+            task_id=task_id
+        )
+        await self.repository.set_news_task_id(meeting_id, task_id)
+        return task_id
 
     async def create_meeting(self, user_id: int, title: str, original_text: str) -> int:
         # 1. LLM 요약 수행
@@ -47,21 +107,35 @@ class MeetingService:
 
         # 4. Celery 태스크 호출 (뉴스 분석)
         if self.celery_task:
+            task_id = str(uuid.uuid4())
             try:
-                self.celery_task.delay(
-                    meeting_id=meeting_id,
-                    user_id=user_id,
-                    summary_meeting=summary,
-                    keyword_meeting_list=keywords
-                )
+                await self._acquire_pipeline_lock(meeting_id, task_id)
+                await self._enqueue_news_task(meeting_id, user_id, summary, keywords, task_id)
             except Exception as e:
+                await self._release_pipeline_lock(meeting_id, task_id)
                 print(f"Celery Task 호출 실패: {e}")
                 # 태스크 실패가 회의록 생성 실패는 아니므로 에러는 넘김
         
         return meeting_id
 
-    async def get_all_meetings(self, user_id: int) -> List[dict]:
-        return await self.repository.get_all_by_user(user_id)
+    async def get_meetings_page(self, user_id: int, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        최신순 회의록 한 페이지와 다음 페이지 커서를 반환합니다.
+        {"items": [...], "next_cursor": str | None}
+        """
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 페이지 요청입니다.")
+
+        # 한 개 더 조회해서 다음 페이지 존재 여부 판단
+        rows = await self.repository.get_page_by_user(user_id, self.page_size + 1, after)
+        items: List[dict] = rows[:self.page_size]
+        next_cursor = None
+        if len(rows) > self.page_size:
+            last = items[-1]
+            next_cursor = encode_cursor(last["created_dt"], last["id"])
+        return {"items": items, "next_cursor": next_cursor}
 
     async def get_meeting_detail(self, meeting_id: int, user_id: int) -> dict:
         meeting = await self.repository.get_by_id(meeting_id, user_id)
@@ -85,16 +159,97 @@ class MeetingService:
         if not meeting.get('summary_meeting') or not meeting.get('keywords'):
              raise HTTPException(status_code=400, detail="요약본이나 키워드가 없어 분석할 수 없습니다.")
 
-        # 3. 기존 뉴스 데이터 초기화 (Repository에 메서드 필요)
-        await self.repository.clear_news_items(meeting_id, user_id)
-        
-        # 4. Celery 태스크 재호출
-        if self.celery_task:
-            self.celery_task.delay(
-                meeting_id=meeting_id,
-                user_id=user_id,
-                summary_meeting=meeting['summary_meeting'],
-                keyword_meeting_list=meeting['keywords']
+        if not self.celery_task:
+            raise HTTPException(status_code=500, detail="백그라운드 작업을 실행할 수 없습니다.")
+
+        # 3. 이미 진행 중인 분석이 있으면 중복 실행하지 않음
+        # 회의록 락을 먼저 원자적으로 잡아, 동시에 들어온 재시도 중 하나만 초기화/등록까지 진행
+        # (락은 워커의 파이프라인이 끝날 때 해제되며, 작업이 사라져도 TTL 뒤 만료)
+        conflict = HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 뉴스 분석이 진행 중입니다.")
+        task_id = str(uuid.uuid4())
+        if not await self._acquire_pipeline_lock(meeting_id, task_id):
+            raise conflict
+        try:
+            news_status = await self._news_status(meeting)
+            if news_status["in_flight"]:
+                raise conflict
+
+            # 4. 기존 뉴스 데이터 초기화 (Repository에 메서드 필요)
+            await self.repository.clear_news_items(meeting_id, user_id)
+
+            # 5. Celery 태스크 재호출
+            await self._enqueue_news_task(
+                meeting_id, user_id, meeting['summary_meeting'], meeting['keywords'], task_id
             )
+        except Exception:
+            await self._release_pipeline_lock(meeting_id, task_id)
+            raise
+
+    async def get_news_status(self, meeting_id: int, user_id: int) -> Dict[str, Any]:
+        """뉴스 분석 작업 상태 (state / 현재 단계 / 단계별 소요 시간)"""
+        meeting = await self.repository.get_by_id(meeting_id, user_id)
+        if not meeting:
+            raise HTTPException(status_code=404, detail="회의록을 찾을 수 없습니다.")
+        return await self._news_status(meeting)
+
+    def _celery_states(self, task_id: str) -> Dict[str, Optional[str]]:
+        """진입 작업과 (chain 등록 후) 마지막 단계 작업의 Celery 상태 (결과 백엔드 조회, 동기)"""
+        entry = self.celery_task.AsyncResult(task_id)
+        states = {"entry": entry.state, "pipeline": None}
+        if entry.successful() and entry.result:
+            # 진입 작업은 chain 의 마지막 단계(persist) 작업 ID 를 반환
+            states["pipeline"] = self.celery_task.AsyncResult(entry.result).state
+        return states
+
+    async def _news_status(self, meeting: Dict[str, Any]) -> Dict[str, Any]:
+        task_id = meeting.get("news_task_id")
+        latest, step_times = None, {}
+        if self.progress:
+            try:
+                latest = await self.progress.latest(meeting["id"])
+                step_times = await self.progress.step_times(meeting["id"])
+            except Exception as e:
+                print(f"진행 상태 조회 실패: {e}")
+        celery_states = await asyncio.to_thread(self._celery_states, task_id) if task_id and self.celery_task else {}
+
+        step = latest["step"] if latest else None
+        if step == "saved" or (not task_id and meeting.get("news_items")):
+            state = "done"
+        elif step == "failed" or "FAILURE" in celery_states.values():
+            state = "failed"
+        elif celery_states.get("pipeline") == "SUCCESS":
+            state = "done"
+        elif not task_id:
+            state = "unknown"
+        elif celery_states.get("entry") == "PENDING" and step in (None, "queued"):
+            state = "queued"
         else:
-            raise HTTPException(status_code=500, detail="백그라운드 작업을 실행할 수 없습니다.")
\ No newline at end of file
+            state = "running"
+
+        # 결과 백엔드의 PENDING 은 "알 수 없는 작업"도 포함하므로, 진행 이벤트가 오래 없으면 멈춘 것으로 간주
+        # (진행 기록 저장소가 없으면 Celery 상태만 신뢰)
+        last_event_at = max(step_times.values()) if step_times else None
+        stale = self.progress is not None and (
+            last_event_at is None or time.time() - last_event_at > self.stale_after
+        )
+        in_flight = state in ("queued", "running") and not stale
+
+        # 단계별 소요 시간: 이전 단계 도달 시각부터의 경과(초)
+        timings, previous = {}, None
+        for name, reached_at in step_times.items():
+            if previous is not None:
+                timings[name] = round(reached_at - previous, 3)
+            previous = reached_at
+        if len(step_times) > 1:
+            timings["total"] = round(previous - next(iter(step_times.values())), 3)
+
+        return {
+            "meeting_id": meeting["id"],
+            "task_id": task_id,
+            "state": state if in_flight or state not in ("queued", "running") else "stale",
+            "in_flight": in_flight,
+            "step": step,
+            "message": latest.get("message") if latest else None,
+            "celery": celery_states,
+            "timings": timings
+        }
\ No newline at end of file
@@ -0,0 +1,96 @@
+# app/services/news_summary_service.py
+import asyncio
+import random
+from typing import Dict, List, Optional
+
+from domain.interfaces.llm import ILLMClient
+from utils.rate_limiter import AsyncTokenBucket
+
+SUMMARY_FALLBACK = "요약 실패"
+
+class NewsSummaryService:
+    """
+    선별된 뉴스들의 요약을 동시에 생성합니다.
+    - max_concurrency : 동시에 진행되는 LLM 호출 수 상한
+    - rate_limiter    : API 쿼터를 지키기 위한 토큰 버킷 (None 이면 제한 없음)
+    - call_timeout    : 호출 1회당 제한 시간(초)
+    - max_retries     : 실패 시 재시도 횟수 (full jitter 지수 백오프)
+    - use_batch       : True 면 split_news_batches 그룹마다 generate_news_summaries 로 묶어 요약하고,
+                        실패/누락분만 개별 요약 (그룹 호출도 레이트 리밋/동시성 제한/호출별 제한 시간 적용)
+    """
+
+    def __init__(
+        self,
+        llm_client: ILLMClient,
+        max_concurrency: int = 5,
+        rate_limiter: Optional[AsyncTokenBucket] = None,
+        call_timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 10.0,
+        use_batch: bool = False
+    ):
+        self.llm_client = llm_client
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.call_timeout = call_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.use_batch = use_batch
+
+    async def summarize_one(self, news_content: str) -> str:
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+            try:
+                return await asyncio.wait_for(
+                    self.llm_client.generate_news_summary(news_content),
+                    timeout=self.call_timeout
+                )
+            except Exception as e:
+                if attempt == self.max_retries:
+                    print(f"  [Summary Error] 재시도 {self.max_retries}회 후 요약 실패: {e!r}")
+                    return SUMMARY_FALLBACK
+                # full jitter: 0 ~ min(max, base * 2^attempt) 사이 무작위 대기
+                delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+                print(f"  [Summary Retry] {attempt + 1}번째 재시도 ({delay:.2f}s 후): {e!r}")
+                await asyncio.sleep(delay)
+
+    async def summarize_all(self, items: List[Dict]) -> List[Dict]:
+        """각 뉴스의 'summary' 를 채워서 반환합니다. 리스트 순서(랭킹 순서)는 그대로 유지됩니다."""
+        targets = [item for item in items if item.get('original')]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self.use_batch and targets:
+            await self._summarize_batch(targets, semaphore)
+            targets = [item for item in targets if not item.get('summary')]
+
+        async def summarize_item(item: Dict):
+            async with semaphore:
+                item['summary'] = await self.summarize_one(item['original'])
+
+        await asyncio.gather(*(summarize_item(item) for item in targets))
+        return items
+
+    async def _summarize_batch(self, targets: List[Dict], semaphore: asyncio.Semaphore):
+        groups = self.llm_client.split_news_batches([item['original'] for item in targets])
+        await asyncio.gather(*(
+            self._summarize_group([targets[i] for i in group], semaphore) for group in groups
+        ))
+
+    async def _summarize_group(self, group: List[Dict], semaphore: asyncio.Semaphore):
+        """그룹 1개 = LLM 요청 1회. 실패하면 재시도 없이 개별 요약(summarize_one)에 맡깁니다."""
+        async with semaphore:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+            try:
+                summaries = await asyncio.wait_for(
+                    self.llm_client.generate_news_summaries([item['original'] for item in group]),
+                    timeout=self.call_timeout
+                )
+            except Exception as e:
+                print(f"  [Summary Error] 배치 요약 실패 ({len(group)}건), 개별 요약으로 전환: {e!r}")
+                return
+        for item, summary in zip(group, summaries):
+            if summary:
+                item['summary'] = summary
@@ -43,16 +43,57 @@ CREATE TABLE Meetings (
     -- 추출된 핵심 키워드 목록 (JSON 배열)
     keywords JSON DEFAULT NULL,
     
-    -- 추천 뉴스 데이터 (JSON 배열)
-    -- URL, 원문, 요약문이 매핑된 객체들의 리스트
-    news_items JSON DEFAULT NULL,
+    -- (추천 뉴스는 meeting_news_items / meeting_news_bodies 테이블에 저장)
+    
+    -- 마지막 뉴스 분석 Celery 작업 ID (상태 조회 / 중복 재시도 방지)
+    news_task_id VARCHAR(64) DEFAULT NULL,
     
     -- 외래 키(Foreign Key) 설정
     -- user_id가 User 테이블의 id를 참조하도록 설정
     -- ON DELETE SET NULL: 사용자가 삭제되어도 회의록 기록은 남도록 설정
-    FOREIGN KEY (user_id) REFERENCES User(id) ON DELETE SET NULL
+    FOREIGN KEY (user_id) REFERENCES User(id) ON DELETE SET NULL,
+
+    -- 사용자별 최신순 목록 조회(keyset pagination)용 복합 인덱스
+    INDEX idx_meetings_user_created (user_id, created_dt)
+);
+
+-- 추천 뉴스 (회의록당 최대 5행, 상세 화면은 이 테이블만 조회)
+CREATE TABLE meeting_news_items (
+    meeting_id BIGINT NOT NULL,
+    
+    -- S-BERT 랭킹 순서 (0부터)
+    rank_no SMALLINT NOT NULL,
+    
+    url VARCHAR(2048) NOT NULL,
+    title TEXT DEFAULT NULL,
+    
+    -- LLM 이 요약한 뉴스 요약문
+    summary TEXT DEFAULT NULL,
+    
+    -- 회의록 요약과의 유사도 점수 (fallback 선별 시 NULL)
+    score FLOAT DEFAULT NULL,
+    
+    -- 상세 화면에 표시하는 본문 앞부분
+    preview VARCHAR(400) DEFAULT NULL,
+    
+    PRIMARY KEY (meeting_id, rank_no),
+    FOREIGN KEY (meeting_id) REFERENCES Meetings(id) ON DELETE CASCADE
+);
+
+-- 크롤링 원문 (조회 경로에서는 읽지 않으므로 별도 테이블로 분리)
+CREATE TABLE meeting_news_bodies (
+    meeting_id BIGINT NOT NULL,
+    rank_no SMALLINT NOT NULL,
+    
+    -- infrastructure/db/news_codec.py 포맷 (버전 바이트 + zstd 압축 msgpack)
+    -- 버전 바이트가 없는 값은 이전 데이터(UTF-8 텍스트)로 읽음
+    original MEDIUMBLOB DEFAULT NULL,
+    
+    PRIMARY KEY (meeting_id, rank_no),
+    FOREIGN KEY (meeting_id, rank_no) REFERENCES meeting_news_items(meeting_id, rank_no) ON DELETE CASCADE
 );
 
 select * from user;
 select * from meetings;
+select * from meeting_news_items;
 
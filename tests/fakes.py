@@ -0,0 +1,64 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from domain.interfaces.llm import ILLMClient
+
+
+class FakeLLMClient(ILLMClient):
+    """
+    테스트용 ILLMClient.
+    - delays   : 원문별 응답 지연(초)
+    - failures : 원문별로 앞에서부터 실패시킬 호출 횟수
+    - hang     : 이 원문들은 응답하지 않음 (타임아웃 확인용)
+    동시에 진행 중인 호출 수의 최댓값과 호출 기록을 남깁니다.
+    """
+
+    def __init__(
+        self,
+        delays: Optional[Dict[str, float]] = None,
+        failures: Optional[Dict[str, int]] = None,
+        hang: Tuple[str, ...] = (),
+        batch_size: Optional[int] = None,
+        batch_missing: Tuple[str, ...] = ()
+    ):
+        self.delays = delays or {}
+        self.failures = dict(failures or {})
+        self.hang = set(hang)
+        self.batch_size = batch_size            # split_news_batches 그룹 크기 (None 이면 전체 한 그룹)
+        self.batch_missing = set(batch_missing)  # 배치 응답에서 누락시킬 원문
+        self.calls: List[str] = []
+        self.batch_calls: List[List[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _call(self, key: str):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if key in self.hang:
+                await asyncio.sleep(3600)
+            await asyncio.sleep(self.delays.get(key, 0.01))
+            if self.failures.get(key, 0) > 0:
+                self.failures[key] -= 1
+                raise RuntimeError(f"일시 오류: {key}")
+        finally:
+            self.in_flight -= 1
+
+    async def generate_meeting_summary(self, content: str) -> Tuple[str, List[str]]:
+        return f"요약:{content}", ["키워드"]
+
+    async def generate_news_summary(self, news_content: str) -> str:
+        self.calls.append(news_content)
+        await self._call(news_content)
+        return f"요약:{news_content}"
+
+    async def generate_news_summaries(self, news_contents: List[str]) -> List[Optional[str]]:
+        self.batch_calls.append(list(news_contents))
+        await self._call("|".join(news_contents))
+        return [None if content in self.batch_missing else f"배치요약:{content}" for content in news_contents]
+
+    def split_news_batches(self, news_contents: List[str]) -> List[List[int]]:
+        if not self.batch_size:
+            return super().split_news_batches(news_contents)
+        indices = list(range(len(news_contents)))
+        return [indices[i:i + self.batch_size] for i in range(0, len(indices), self.batch_size)]
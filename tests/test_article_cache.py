@@ -0,0 +1,22 @@
+import os
+import time
+
+from infrastructure.crawler.article_cache import SQLiteArticleCache
+
+
+def _entry(url):
+    return {"url": url, "title": "제목", "original": "본문", "etag": None, "last_modified": None,
+            "fetched_at": time.time()}
+
+
+def test_sqlite_connection_is_opened_lazily_per_process(tmp_path, monkeypatch):
+    cache = SQLiteArticleCache(str(tmp_path / "articles.sqlite3"))
+    assert cache._conn is None  # 생성(모듈 import) 시점에는 연결을 열지 않음
+
+    cache.put(_entry("https://news.example/1"))
+    parent_conn = cache._conn
+
+    # fork 된 자식 프로세스: 부모의 연결을 쓰지 않고 새로 연 연결로 같은 파일을 읽음
+    monkeypatch.setattr(os, "getpid", lambda: -1)
+    assert cache.get("https://news.example/1")["title"] == "제목"
+    assert cache._conn is not parent_conn
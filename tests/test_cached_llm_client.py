@@ -0,0 +1,59 @@
+import asyncio
+
+from infrastructure.cache.kv_cache import InMemoryKeyValueCache
+from infrastructure.llm.cached_llm_client import CachedLLMClient
+from services.news_summary_service import NewsSummaryService, SUMMARY_FALLBACK
+from tests.fakes import FakeLLMClient
+
+
+class StaggeredLimiter:
+    """호출마다 조금씩 늦게 토큰을 내줘서, 두 번째 요청이 진행 중인 첫 요청에 합류하게 함"""
+
+    def __init__(self, step: float):
+        self.step = step
+        self.acquired = 0
+
+    async def acquire(self, tokens: float = 1):
+        self.acquired += 1
+        await asyncio.sleep(self.step * (self.acquired - 1))
+
+
+def test_concurrent_identical_requests_are_coalesced():
+    inner = FakeLLMClient(delays={"A": 0.05})
+    client = CachedLLMClient(inner, InMemoryKeyValueCache())
+
+    async def run():
+        return await asyncio.gather(*(client.generate_news_summary("A") for _ in range(3)))
+
+    assert asyncio.run(run()) == ["요약:A"] * 3
+    assert inner.calls == ["A"]
+
+
+def test_waiter_calls_inner_when_leader_is_cancelled():
+    inner = FakeLLMClient(delays={"A": 0.1})
+    client = CachedLLMClient(inner, InMemoryKeyValueCache())
+
+    async def run():
+        leader = asyncio.create_task(client.generate_news_summary("A"))
+        await asyncio.sleep(0.02)
+        waiter = asyncio.create_task(client.generate_news_summary("A"))
+        await asyncio.sleep(0.02)
+        leader.cancel()
+        return await waiter
+
+    assert asyncio.run(run()) == "요약:A"
+    assert inner.calls == ["A", "A"]
+
+
+def test_leader_timeout_does_not_escape_summarize_all():
+    # 본문이 같은 두 기사: 선행 호출이 타임아웃으로 취소돼도 합류한 쪽은 재시도/폴백으로 끝나야 함
+    inner = FakeLLMClient(delays={"A": 0.3})
+    client = CachedLLMClient(inner, InMemoryKeyValueCache())
+    service = NewsSummaryService(
+        client, rate_limiter=StaggeredLimiter(0.03), call_timeout=0.1, max_retries=1, backoff_base=0
+    )
+    items = [{"url": f"https://news.example/{i}", "original": "A", "summary": None} for i in range(2)]
+
+    asyncio.run(service.summarize_all(items))
+
+    assert [item["summary"] for item in items] == [SUMMARY_FALLBACK, SUMMARY_FALLBACK]
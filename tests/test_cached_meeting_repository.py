@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime
+
+from domain.interfaces.repository import IMeetingRepository
+from infrastructure.cache.kv_cache import InMemoryKeyValueCache
+from infrastructure.db.cached_meeting_repository import CachedMeetingRepository
+
+
+class FakeMeetingRepository(IMeetingRepository):
+    """회의록 1건을 메모리에 두고, gate 가 설정되면 get_by_id 가 DB 를 읽은 뒤 대기합니다."""
+
+    def __init__(self):
+        self.meeting = {
+            "id": 1, "user_id": 7, "title": "회의", "created_dt": datetime(2024, 5, 1),
+            "news_items": [{"url": "https://news.example/old", "title": "이전 뉴스"}]
+        }
+        self.reads = 0
+        self.gate = None
+
+    async def get_by_id(self, meeting_id, user_id):
+        self.reads += 1
+        snapshot = {**self.meeting, "news_items": list(self.meeting["news_items"])}
+        if self.gate is not None:
+            await self.gate.wait()
+        return snapshot if user_id == self.meeting["user_id"] else None
+
+    async def clear_news_items(self, meeting_id, user_id):
+        self.meeting["news_items"] = []
+
+    async def save(self, meeting_data): return 1
+    async def get_news_items(self, meeting_id): return self.meeting["news_items"]
+    async def get_page_by_user(self, user_id, limit, after=None): return []
+    async def delete(self, meeting_id): pass
+    async def set_news_task_id(self, meeting_id, task_id): pass
+
+
+def test_detail_is_cached_after_first_read():
+    inner = FakeMeetingRepository()
+    repo = CachedMeetingRepository(inner, InMemoryKeyValueCache())
+
+    async def run():
+        first = await repo.get_by_id(1, 7)
+        second = await repo.get_by_id(1, 7)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert second["created_dt"] == datetime(2024, 5, 1)
+    assert inner.reads == 1
+
+
+def test_slow_reader_does_not_recache_stale_detail_after_invalidation():
+    inner = FakeMeetingRepository()
+    repo = CachedMeetingRepository(inner, InMemoryKeyValueCache())
+
+    async def run():
+        inner.gate = asyncio.Event()
+        slow_read = asyncio.ensure_future(repo.get_by_id(1, 7))
+        while inner.reads == 0:  # 이전 뉴스가 있는 행을 읽고 대기할 때까지
+            await asyncio.sleep(0.001)
+
+        await repo.clear_news_items(1, 7)  # 재시도: 뉴스 초기화 + 상세 캐시 무효화
+        inner.gate.set()
+        stale = await slow_read
+        inner.gate = None
+        return stale, await repo.get_by_id(1, 7)
+
+    stale, fresh = asyncio.run(run())
+    assert stale["news_items"]
+    assert fresh["news_items"] == []
+    assert inner.reads == 2
+
+
+def test_detail_is_not_returned_to_other_users():
+    repo = CachedMeetingRepository(FakeMeetingRepository(), InMemoryKeyValueCache())
+
+    async def run():
+        await repo.get_by_id(1, 7)
+        return await repo.get_by_id(1, 8)
+
+    assert asyncio.run(run()) is None
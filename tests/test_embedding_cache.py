@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from infrastructure.ai.embedding_cache import DiskEmbeddingStore
+
+
+def _vec(value: float) -> "np.ndarray":
+    return np.full(4, value, dtype=np.float32)
+
+
+def test_disk_store_is_shared_across_instances(tmp_path):
+    writer = DiskEmbeddingStore(str(tmp_path))
+    writer.put_many({"a": _vec(1), "b": _vec(2)})
+
+    # 다른 프로세스처럼 새 인스턴스에서 조회
+    reader = DiskEmbeddingStore(str(tmp_path))
+    found = reader.get_many(["a", "b", "missing"])
+
+    assert set(found) == {"a", "b"}
+    assert np.array_equal(found["b"], _vec(2))
+
+
+def test_disk_store_evicts_oldest_rows_past_capacity(tmp_path):
+    store = DiskEmbeddingStore(str(tmp_path), max_rows=3, initial_capacity=2)
+    store.put_many({"a": _vec(1), "b": _vec(2)})
+    store.put_many({"c": _vec(3), "d": _vec(4)})
+
+    found = store.get_many(["a", "b", "c", "d"])
+
+    assert set(found) == {"b", "c", "d"}
+    assert np.array_equal(found["d"], _vec(4))
+    assert store.rows == 3
+    assert os.path.getsize(tmp_path / DiskEmbeddingStore.MATRIX_FILE) == 3 * 4 * 4
+
+
+def test_overwritten_row_is_not_returned_for_the_evicted_key(tmp_path):
+    store = DiskEmbeddingStore(str(tmp_path), max_rows=1)
+    store.put_many({"a": _vec(1)})
+    found = store._lookup(store._connection(), ["a"])
+
+    DiskEmbeddingStore(str(tmp_path), max_rows=1).put_many({"b": _vec(2)})
+
+    assert found == {"a": 0}
+    assert store.get_many(["a"]) == {}
+    assert np.array_equal(store.get_many(["b"])["b"], _vec(2))
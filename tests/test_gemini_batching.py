@@ -0,0 +1,33 @@
+import pytest
+
+pytest.importorskip("google.genai")
+pytest.importorskip("pydantic")
+
+from infrastructure.llm.gemini_adapter import GeminiLLMAdapter
+
+
+def _adapter(budget: int) -> GeminiLLMAdapter:
+    # API 클라이언트 없이 분할 로직만 확인
+    adapter = GeminiLLMAdapter.__new__(GeminiLLMAdapter)
+    adapter.batch_token_budget = budget
+    return adapter
+
+
+def test_groups_stay_within_budget_and_keep_order():
+    adapter = _adapter(budget=25)
+    contents = ["a" * 9, "b" * 9, "c" * 9, "d" * 4]
+
+    groups = adapter._split_by_budget(contents)
+
+    assert groups == [[0, 1], [2, 3]]
+    for group in groups:
+        assert sum(adapter._estimate_tokens(contents[i]) for i in group) <= 25
+
+
+def test_oversized_article_gets_its_own_group():
+    adapter = _adapter(budget=10)
+    assert adapter._split_by_budget(["x" * 50, "y", "z" * 50]) == [[0], [1], [2]]
+
+
+def test_empty_input():
+    assert _adapter(budget=10)._split_by_budget([]) == []
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import HTTPException
+
+from services.meeting_service import MeetingService
+from tests.fakes import FakeLLMClient
+
+
+class FakeRepository:
+    def __init__(self, events):
+        self.events = events
+        self.meeting = {"id": 1, "user_id": 7, "summary_meeting": "요약", "keywords": ["AI"], "news_task_id": None}
+
+    async def get_by_id(self, meeting_id, user_id):
+        return dict(self.meeting)
+
+    async def set_news_task_id(self, meeting_id, task_id):
+        self.events.append(("set_news_task_id", task_id))
+        self.meeting["news_task_id"] = task_id
+
+    async def clear_news_items(self, meeting_id, user_id):
+        self.events.append(("clear_news_items", meeting_id))
+        await asyncio.sleep(0.01)
+
+
+class FakeProgress:
+    def __init__(self, events):
+        self.events = events
+
+    async def mark_queued(self, meeting_id, **data):
+        self.events.append(("mark_queued", data["task_id"]))
+
+    async def latest(self, meeting_id):
+        return None
+
+    async def step_times(self, meeting_id):
+        return {}
+
+
+class FakeCeleryTask:
+    def __init__(self, events):
+        self.events = events
+
+    def apply_async(self, kwargs, task_id):
+        self.events.append(("apply_async", task_id))
+
+    def AsyncResult(self, task_id):
+        raise AssertionError("news_task_id 가 없는 회의록은 결과 백엔드를 조회하지 않음")
+
+
+class FakeLock:
+    def __init__(self):
+        self.holders = {}
+
+    def acquire(self, meeting_id, token):
+        return self.holders.setdefault(meeting_id, token) == token
+
+    def release(self, meeting_id, token):
+        if self.holders.get(meeting_id) == token:
+            del self.holders[meeting_id]
+
+
+def _service(events, lock=None):
+    return MeetingService(
+        FakeRepository(events), FakeLLMClient(),
+        celery_task=FakeCeleryTask(events), progress=FakeProgress(events), pipeline_lock=lock
+    )
+
+
+def test_queued_is_recorded_before_the_task_is_sent():
+    events = []
+    task_id = asyncio.run(_service(events)._enqueue_news_task(1, 7, "요약", ["AI"]))
+
+    assert [name for name, _ in events] == ["mark_queued", "apply_async", "set_news_task_id"]
+    assert all(value == task_id for _, value in events)
+
+
+def test_concurrent_retries_clear_and_enqueue_once():
+    events = []
+    lock = FakeLock()
+    service = _service(events, lock)
+
+    async def run():
+        return await asyncio.gather(
+            service.retry_news_analysis(1, 7), service.retry_news_analysis(1, 7), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    conflicts = [r for r in results if isinstance(r, HTTPException)]
+    assert len(conflicts) == 1 and conflicts[0].status_code == 409
+    assert [name for name, _ in events].count("clear_news_items") == 1
+    assert [name for name, _ in events].count("apply_async") == 1
+    # 락은 등록된 작업 ID 로 잡혀 있고 워커가 끝날 때 해제
+    assert lock.holders[1] == dict(events)["apply_async"]
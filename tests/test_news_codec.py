@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("msgpack")
+pytest.importorskip("zstandard")
+
+from infrastructure.db.news_codec import FORMAT_ZSTD_MSGPACK, encode_payload, decode_payload, is_encoded
+
+
+def test_round_trip_with_version_byte():
+    value = [{"url": "https://news.example/1", "title": "제목", "original": "본문 " * 200, "score": 0.82}]
+    raw = encode_payload(value)
+
+    assert raw[0] == FORMAT_ZSTD_MSGPACK
+    assert is_encoded(raw)
+    assert decode_payload(raw) == value
+
+
+def test_compresses_repetitive_text():
+    text = "반복되는 기사 본문입니다. " * 500
+    assert len(encode_payload(text)) < len(text.encode("utf-8")) / 5
+
+
+def test_legacy_rows_are_decoded():
+    assert decode_payload(None) is None
+    assert decode_payload("기존 원문") == "기존 원문"
+    assert decode_payload("기존 원문".encode("utf-8")) == "기존 원문"
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+pymysql = pytest.importorskip("pymysql")
+pytest.importorskip("msgpack")
+pytest.importorskip("zstandard")
+
+from infrastructure.db.news_items_writer import NewsItemsWriter, _SpoolFile
+
+DEAD_PID = 2 ** 22 + 1  # pid_max 보다 큰 값: 항상 종료된 프로세스로 취급
+LIVE_PID = 1
+
+
+def test_each_process_sees_only_its_own_rows(tmp_path):
+    path = str(tmp_path / "spool.sqlite3")
+    mine = _SpoolFile(path, owner=os.getpid())
+    other = _SpoolFile(path, owner=LIVE_PID)
+
+    mine.put(1, 100, b"a")
+    other.put(2, 100, b"b")
+
+    assert mine.claim_orphans() == {1: (100, b"a")}
+
+
+def test_orphaned_rows_are_claimed_once_and_stale_rows_dropped(tmp_path):
+    path = str(tmp_path / "spool.sqlite3")
+    dead = _SpoolFile(path, owner=DEAD_PID)
+    dead.put(1, 100, b"orphan")
+    dead.put(2, 100, b"stale-pending")
+    dead.put(3, 100, b"stale-flushed")
+
+    _SpoolFile(path, owner=LIVE_PID).put(2, 200, b"newer")
+    mine = _SpoolFile(path, owner=os.getpid())
+    mine.remove({3: (150, b"")})
+
+    assert mine.claim_orphans() == {1: (100, b"orphan")}
+    # 다른 프로세스가 다시 claim 해도 이미 가져간 행은 나오지 않음
+    assert _SpoolFile(path, owner=LIVE_PID).claim_orphans() == {2: (200, b"newer")}
+
+
+def test_removed_rows_are_not_recovered(tmp_path):
+    path = str(tmp_path / "spool.sqlite3")
+    mine = _SpoolFile(path, owner=os.getpid())
+    mine.put(1, 100, b"a")
+    mine.remove({1: (100, b"a")})
+
+    assert mine.claim_orphans() == {}
+
+
+class FlakyWriter(NewsItemsWriter):
+    """_update_many 대신 오류를 흉내 냄: bad 회의록이 포함되면 DataError, down 이면 연결 오류"""
+
+    def __init__(self, bad=(), **kwargs):
+        super().__init__(pool=None, write_behind=True, **kwargs)
+        self.bad = set(bad)
+        self.down = False
+        self.written = []
+
+    def _update_many(self, batch):
+        if self.down:
+            raise pymysql.OperationalError(2013, "Lost connection")
+        if self.bad & set(batch):
+            raise pymysql.DataError(1406, "Data too long for column 'url'")
+        self.written.extend(batch)
+
+
+def _queue(writer, *meeting_ids):
+    for meeting_id in meeting_ids:
+        writer._pending[meeting_id] = (meeting_id, b"")
+
+
+def test_connection_errors_keep_the_batch_for_retry():
+    writer = FlakyWriter()
+    writer.down = True
+    _queue(writer, 1, 2)
+
+    assert writer.flush() is False
+    assert set(writer._pending) == {1, 2}
+
+    writer.down = False
+    assert writer.flush() is True
+    assert sorted(writer.written) == [1, 2]
+
+
+def test_bad_rows_are_dropped_without_blocking_others(tmp_path):
+    dropped = []
+    writer = FlakyWriter(bad={2}, on_dropped=dropped.extend)
+    writer._spool = _SpoolFile(str(tmp_path / "spool.sqlite3"), owner=os.getpid())
+    for meeting_id in (1, 2, 3):
+        writer._spool.put(meeting_id, meeting_id, b"")
+    _queue(writer, 1, 2, 3)
+
+    assert writer.flush() is False
+    assert sorted(writer.written) == [1, 3]
+    assert dropped == [2]
+    # 버린 쓰기는 다시 시도하지 않고 spool 에서도 지움
+    assert writer._pending == {}
+    assert writer._spool.claim_orphans() == {}
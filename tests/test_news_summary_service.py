@@ -0,0 +1,115 @@
+import asyncio
+
+from services.news_summary_service import NewsSummaryService, SUMMARY_FALLBACK
+from tests.fakes import FakeLLMClient
+
+
+def _items(*originals):
+    return [{"url": f"https://news.example/{i}", "original": original, "summary": None}
+            for i, original in enumerate(originals)]
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    async def acquire(self, tokens: float = 1):
+        self.acquired += tokens
+
+
+def test_concurrency_is_limited():
+    client = FakeLLMClient()
+    service = NewsSummaryService(client, max_concurrency=3, backoff_base=0)
+
+    asyncio.run(service.summarize_all(_items(*[f"뉴스{i}" for i in range(10)])))
+
+    assert len(client.calls) == 10
+    assert client.max_in_flight == 3
+
+
+def test_ranking_order_is_preserved():
+    # 먼저 끝나는 순서와 무관하게 입력(랭킹) 순서대로 요약이 채워져야 함
+    client = FakeLLMClient(delays={"A": 0.05, "B": 0.0, "C": 0.02})
+    service = NewsSummaryService(client, max_concurrency=3, backoff_base=0)
+
+    items = asyncio.run(service.summarize_all(_items("A", "B", "C")))
+
+    assert [item["original"] for item in items] == ["A", "B", "C"]
+    assert [item["summary"] for item in items] == ["요약:A", "요약:B", "요약:C"]
+
+
+def test_items_without_original_are_skipped():
+    client = FakeLLMClient()
+    service = NewsSummaryService(client, backoff_base=0)
+    items = _items("A", "")
+
+    asyncio.run(service.summarize_all(items))
+
+    assert client.calls == ["A"]
+    assert items[1]["summary"] is None
+
+
+def test_transient_failures_are_retried():
+    client = FakeLLMClient(failures={"A": 2})
+    limiter = CountingLimiter()
+    service = NewsSummaryService(client, rate_limiter=limiter, max_retries=3, backoff_base=0)
+
+    assert asyncio.run(service.summarize_one("A")) == "요약:A"
+    assert client.calls == ["A", "A", "A"]
+    # 재시도도 호출마다 토큰을 사용
+    assert limiter.acquired == 3
+
+
+def test_fallback_after_retries_exhausted():
+    client = FakeLLMClient(failures={"A": 10})
+    service = NewsSummaryService(client, max_retries=2, backoff_base=0)
+
+    assert asyncio.run(service.summarize_one("A")) == SUMMARY_FALLBACK
+    assert len(client.calls) == 3
+
+
+def test_hanging_call_times_out_and_falls_back():
+    client = FakeLLMClient(hang=("A",))
+    service = NewsSummaryService(client, call_timeout=0.05, max_retries=1, backoff_base=0)
+
+    items = asyncio.run(service.summarize_all(_items("A", "B")))
+
+    assert items[0]["summary"] == SUMMARY_FALLBACK
+    assert items[1]["summary"] == "요약:B"
+    assert client.calls.count("A") == 2
+
+
+def test_batch_groups_go_through_limiter_and_semaphore():
+    client = FakeLLMClient(batch_size=2)
+    limiter = CountingLimiter()
+    service = NewsSummaryService(client, max_concurrency=2, rate_limiter=limiter, use_batch=True, backoff_base=0)
+
+    items = asyncio.run(service.summarize_all(_items("A", "B", "C", "D", "E")))
+
+    assert client.batch_calls == [["A", "B"], ["C", "D"], ["E"]]
+    assert limiter.acquired == 3
+    assert client.max_in_flight <= 2
+    assert [item["summary"] for item in items] == [f"배치요약:{x}" for x in "ABCDE"]
+    assert client.calls == []
+
+
+def test_batch_missing_items_are_summarized_individually_once():
+    client = FakeLLMClient(batch_missing=("B",))
+    service = NewsSummaryService(client, use_batch=True, backoff_base=0)
+
+    items = asyncio.run(service.summarize_all(_items("A", "B")))
+
+    assert [item["summary"] for item in items] == ["배치요약:A", "요약:B"]
+    assert client.calls == ["B"]
+
+
+def test_batch_timeout_falls_back_only_for_that_group():
+    client = FakeLLMClient(batch_size=1, hang=("A",))
+    service = NewsSummaryService(client, use_batch=True, call_timeout=0.05, max_retries=0, backoff_base=0)
+
+    items = asyncio.run(service.summarize_all(_items("A", "B")))
+
+    # 멈춘 그룹(A)만 개별 요약으로 넘어가고, 개별 요약도 자체 제한 시간으로 끝남
+    assert items[1]["summary"] == "배치요약:B"
+    assert items[0]["summary"] == SUMMARY_FALLBACK
+    assert client.calls == ["A"]
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+import pytest
+
+from utils.pagination import encode_cursor, decode_cursor
+
+
+def test_cursor_round_trip():
+    created_dt = datetime(2024, 5, 1, 13, 45, 12, 123456)
+    assert decode_cursor(encode_cursor(created_dt, 42)) == (created_dt, 42)
+
+
+def test_cursor_is_url_safe_without_padding():
+    token = encode_cursor(datetime(2024, 5, 1), 7)
+    assert "=" not in token and "+" not in token and "/" not in token
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "W10", "WyJ4IiwxXQ"])
+def test_invalid_cursor_raises_value_error(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token)
@@ -0,0 +1,131 @@
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("msgpack")
+pytest.importorskip("zstandard")
+
+from infrastructure.cache.pipeline_coalescing import MeetingPipelineLock, SharedWorkMap
+
+
+class FakeRedis:
+    """get / set(nx, ex) / delete 와 토큰 비교 삭제 스크립트만 흉내 내는 인메모리 Redis"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    @classmethod
+    def from_url(cls, url):
+        return cls()
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value.encode("utf-8") if isinstance(value, str) else value
+        self.ttls[key] = ex
+        return True
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member)
+
+    def srem(self, key, member):
+        members = self.data.get(key, set())
+        members.discard(member)
+        if not members:
+            self.data.pop(key, None)
+
+    def sismember(self, key, member):
+        return member in self.data.get(key, set())
+
+    def scard(self, key):
+        return len(self.data.get(key, set()))
+
+    def register_script(self, script):
+        def release(keys, args):
+            if self.data.get(keys[0]) == args[0].encode("utf-8"):
+                return self.delete(keys[0])
+            return 0
+        return release
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch):
+    monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(Redis=FakeRedis))
+
+
+def test_meeting_lock_allows_one_holder():
+    lock = MeetingPipelineLock("redis://test", ttl=60)
+
+    assert lock.acquire(1, "pipeline-a")
+    assert not lock.acquire(1, "pipeline-b")
+    assert lock.holder(1) == "pipeline-a"
+    assert lock.acquire(2, "pipeline-b")
+
+
+def test_meeting_lock_release_requires_token():
+    lock = MeetingPipelineLock("redis://test", ttl=60)
+    lock.acquire(1, "pipeline-a")
+
+    assert not lock.release(1, "pipeline-b")
+    assert lock.holder(1) == "pipeline-a"
+    assert lock.release(1, "pipeline-a")
+    assert lock.holder(1) is None
+    assert lock.acquire(1, "pipeline-b")
+
+
+def test_shared_work_claim_is_keyed_by_normalized_keywords():
+    shared = SharedWorkMap("redis://test", result_ttl=30, claim_ttl=60)
+
+    assert shared.claim(["AI", " 반도체 "], "a") == (SharedWorkMap.CLAIMED, None)
+    assert shared.claim(["반도체", "ai", "AI"], "b") == (SharedWorkMap.BUSY, None)
+    # 재시도된 같은 태스크는 계속 작업을 맡음
+    assert shared.claim(["AI", "반도체"], "a") == (SharedWorkMap.CLAIMED, None)
+    assert shared.claim(["전기차"], "b") == (SharedWorkMap.CLAIMED, None)
+
+
+def test_shared_work_result_is_reused_by_waiters_only_once():
+    shared = SharedWorkMap("redis://test", result_ttl=30, claim_ttl=60)
+    news_items = [{"url": "https://news.example/1", "title": "제목", "original": "본문"}]
+
+    shared.claim(["AI"], "a")
+    assert shared.claim(["ai"], "b")[0] == SharedWorkMap.BUSY
+    assert shared.claim(["AI "], "c")[0] == SharedWorkMap.BUSY
+    shared.publish(["AI"], "a", news_items)
+
+    assert shared.claim(["ai"], "b") == (SharedWorkMap.READY, news_items)
+    assert shared.claim(["AI"], "c") == (SharedWorkMap.READY, news_items)
+    # 마지막 대기자가 가져가면 결과 삭제: 이후 들어온 실행은 직접 검색/크롤링
+    assert not any(key.startswith(SharedWorkMap.RESULT_PREFIX) for key in shared.redis.data)
+    assert shared.claim(["AI"], "d") == (SharedWorkMap.CLAIMED, None)
+
+
+def test_result_is_not_kept_without_waiters():
+    shared = SharedWorkMap("redis://test", result_ttl=30, claim_ttl=60)
+
+    shared.claim(["AI"], "a")
+    shared.publish(["AI"], "a", [{"url": "https://news.example/1"}])
+
+    # 실행이 끝난 뒤의 재시도는 이전 결과를 재사용하지 않음
+    assert shared.claim(["AI"], "retry") == (SharedWorkMap.CLAIMED, None)
+
+
+def test_released_claim_can_be_taken_over():
+    shared = SharedWorkMap("redis://test", result_ttl=30, claim_ttl=60)
+
+    shared.claim(["AI"], "a")
+    shared.release(["AI"], "b")  # 다른 토큰으로는 해제되지 않음
+    assert shared.claim(["AI"], "b") == (SharedWorkMap.BUSY, None)
+
+    shared.release(["AI"], "a")
+    assert shared.claim(["AI"], "b") == (SharedWorkMap.CLAIMED, None)
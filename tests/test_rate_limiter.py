@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from utils.rate_limiter import AsyncTokenBucket
+
+
+def test_burst_up_to_capacity_does_not_wait():
+    bucket = AsyncTokenBucket(rate=10, capacity=3)
+    assert [bucket._reserve(1) for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_wait_grows_with_reserved_deficit():
+    bucket = AsyncTokenBucket(rate=10, capacity=1)
+    assert bucket._reserve(1) == 0.0
+    assert bucket._reserve(1) == pytest.approx(0.1, abs=0.01)
+    assert bucket._reserve(1) == pytest.approx(0.2, abs=0.01)
+
+
+def test_acquire_paces_calls():
+    bucket = AsyncTokenBucket(rate=20, capacity=1)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+        return loop.time() - started
+
+    # 첫 토큰은 즉시, 나머지 2개는 0.05초 간격
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        AsyncTokenBucket(rate=0)
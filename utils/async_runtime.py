@@ -0,0 +1,89 @@
+import os
+import asyncio
+import threading
+from typing import Awaitable, Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRuntime:
+    """
+    워커 프로세스당 하나의 이벤트 루프를 전용 스레드에서 계속 실행합니다.
+    동기 코드(Celery 태스크)는 run() 으로 코루틴을 제출하고 결과를 기다립니다.
+
+    - 루프가 유지되므로 어댑터의 커넥션 풀 / 세마포어 / 캐시가 태스크 사이에 재사용됩니다.
+    - run() 은 스레드 안전하므로 threads 풀의 여러 태스크가 동시에 같은 루프를 사용할 수 있습니다.
+    - fork 이후(prefork 자식)에는 부모의 루프 스레드가 존재하지 않으므로 PID 가 바뀌면 새로 시작합니다.
+    """
+
+    def __init__(self, name: str = "async-runtime"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and self._pid == os.getpid() and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """루프 스레드를 시작합니다 (이미 현재 프로세스에서 실행 중이면 그대로 반환)."""
+        with self._lock:
+            if self.running:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=run_loop, name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+            self._pid = os.getpid()
+            print(f"[AsyncRuntime] 이벤트 루프 시작 (pid={self._pid})")
+            return loop
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """코루틴을 워커 루프에서 실행하고 결과를 반환합니다 (아직 시작 전이면 자동 시작)."""
+        loop = self.start()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # 타임아웃/인터럽트 시 루프에 남은 코루틴 취소
+            future.cancel()
+            raise
+
+    def on_shutdown(self, hook: Callable[[], Awaitable[None]]):
+        """stop() 시 루프 안에서 실행할 정리 코루틴(예: 커넥션 풀 aclose)을 등록합니다."""
+        self._shutdown_hooks.append(hook)
+
+    def stop(self, timeout: float = 10.0):
+        with self._lock:
+            if not self.running:
+                return
+
+            async def shutdown():
+                for hook in self._shutdown_hooks:
+                    try:
+                        await hook()
+                    except Exception as e:
+                        print(f"[AsyncRuntime] 종료 훅 실패: {e}")
+
+            try:
+                asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout)
+            except Exception as e:
+                print(f"[AsyncRuntime] 종료 처리 중 오류: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+            print(f"[AsyncRuntime] 이벤트 루프 종료 (pid={os.getpid()})")
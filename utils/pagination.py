@@ -0,0 +1,22 @@
+import json
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+
+# 목록 페이지네이션용 불투명 커서.
+# 마지막 행의 정렬 키 (created_dt, id) 를 base64url 로 감싸서 클라이언트는 값을 해석/조작하지 않도록 합니다.
+
+def encode_cursor(created_dt: datetime, row_id: int) -> str:
+    raw = json.dumps([created_dt.isoformat(), row_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str) -> Tuple[datetime, int]:
+    """잘못된 커서면 ValueError 를 발생시킵니다."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_dt, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_dt), int(row_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"잘못된 페이지 커서입니다: {token}") from e
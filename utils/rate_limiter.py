@@ -0,0 +1,37 @@
+import asyncio
+import threading
+import time
+
+
+class AsyncTokenBucket:
+    """
+    asyncio 용 토큰 버킷 레이트 리미터.
+    - rate     : 초당 보충되는 토큰 수 (API 초당 허용 호출 수)
+    - capacity : 버킷 크기 (순간적으로 허용되는 최대 burst)
+
+    토큰이 부족하면 미리 "예약"(잔량을 음수로)하고 부족분만큼 sleep 하므로
+    asyncio.Lock 없이도 루프가 바뀌어도 (asyncio.run 반복) 안전하게 재사용할 수 있습니다.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate 는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """토큰을 예약하고 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self, tokens: float = 1):
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)